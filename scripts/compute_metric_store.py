@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   compute_metric_store.py
+
+   Descp: Compute every metric of the classic and monowiki apps for the wikis
+      listed in wikis.json, in parallel, and save them in the metric store
+      (see wikichron/utils/metric_store.py), so WikiChron serves them without
+      computing anything. Metrics already in the store for the current data
+      of a wiki are skipped, and the ones of older versions are removed.
+
+      Parameters:
+        -force: compute every metric again, even if it is already stored.
+        domains (optional): only process the wikis with these domains.
+
+      The number of processes is taken from the environment variable
+      WIKICHRON_COMPUTE_PROCESSES (the number of CPUs by default).
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import sys
+import json
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+if not 'WIKICHRON_DATA_DIR' in os.environ:
+    os.environ['WIKICHRON_DATA_DIR'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+data_dir = os.environ['WIKICHRON_DATA_DIR']
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import wikichron.utils.metric_store as metric_store
+import wikichron.utils.metric_cache as metric_cache
+import wikichron.utils.data_version as data_version
+from wikichron.dash.apps.classic.metrics import interface as classic_interface
+from wikichron.dash.apps.monowiki.metrics import interface as monowiki_interface
+
+INTERFACES = {
+    'classic': classic_interface,
+    'monowiki': monowiki_interface,
+}
+
+processes = int(os.getenv('WIKICHRON_COMPUTE_PROCESSES', 0)) or os.cpu_count()
+
+
+def compute_wiki(namespace, wiki, force):
+    """ Compute and store the missing metrics of a wiki in an app """
+    time_start = time.perf_counter()
+    interface = INTERFACES[namespace]
+    version = data_version.get_data_version(wiki)
+    codes = [metric.code for metric in interface.get_available_metrics()]
+
+    if not force:
+        stored = metric_store.load_cells(namespace, wiki, codes,
+                                    metric_cache.MONTHLY, version)
+        codes = [code for (code, cell) in zip(codes, stored) if cell is None]
+
+    if codes:
+        cells = interface.compute_metrics_on_wiki(wiki, codes)
+        metric_store.save_cells(namespace, wiki, codes, cells,
+                                metric_cache.MONTHLY, version)
+    metric_store.prune_wiki(namespace, wiki, version)
+    return (len(codes), time.perf_counter() - time_start)
+
+
+def main():
+    args = sys.argv[1:]
+    force = '-force' in args
+    selected_domains = {arg for arg in args if arg != '-force'}
+
+    wikis = json.load(open(os.path.join(data_dir, 'wikis.json')))
+
+    tasks = []
+    for wiki in wikis:
+        if selected_domains and wiki['domain'] not in selected_domains:
+            continue
+
+        if not os.path.isfile(os.path.join(data_dir, wiki['data'])):
+            print(f'Skipping {wiki["domain"]}: {wiki["data"]} not found')
+            continue
+
+        for namespace in INTERFACES:
+            tasks.append((namespace, wiki))
+
+    failed = 0
+    time_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {executor.submit(compute_wiki, namespace, wiki, force): (namespace, wiki)
+                    for (namespace, wiki) in tasks}
+        for future in as_completed(futures):
+            (namespace, wiki) = futures[future]
+            try:
+                (n_computed, elapsed) = future.result()
+            except Exception:
+                print(f'Error computing the {namespace} metrics of {wiki["domain"]}:')
+                traceback.print_exc()
+                failed += 1
+                continue
+            if n_computed:
+                print(f' * [Timing] {wiki["domain"]} ({namespace}) -> {n_computed} metrics : {elapsed} seconds')
+            else:
+                print(f'{wiki["domain"]} ({namespace}) is up to date')
+
+    time_end = time.perf_counter() - time_start
+    print(f' * [Timing] {len(tasks) - failed} of {len(tasks)} tasks done : {time_end} seconds')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+   sys.exit(main())
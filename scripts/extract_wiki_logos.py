@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   extract_wiki_logos.py
+
+   Descp: Move the logos embedded as base64 in wikis.json (`imageSrc`) to
+      the logos store, as content-hashed image files, and rewrite
+      wikis.json with only a reference to them (`logo`).
+
+      WikiChron does this in memory when loading wikis.json anyway, so
+      running this script is only needed to get a lighter wikis.json.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import sys
+import json
+
+if not 'WIKICHRON_DATA_DIR' in os.environ:
+    os.environ['WIKICHRON_DATA_DIR'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+data_dir = os.environ['WIKICHRON_DATA_DIR']
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../wikichron'))
+from utils import wiki_logos
+from utils.data_manager import update_wikis_metadata
+
+
+def main():
+    wikis = json.load(open(os.path.join(data_dir, 'wikis.json')))
+
+    extracted = 0
+    for wiki in wikis:
+        if 'imageSrc' in wiki:
+            wiki_logos.extract_logo(wiki)
+            print(f'{wiki["domain"]} -> {wiki.get("logo")}')
+            extracted += 1
+
+    if not extracted:
+        print('No embedded logos found in wikis.json')
+        return 0
+
+    if not update_wikis_metadata(wikis):
+        print('Error: unable to update wikis.json')
+        return 1
+
+    print(f'{extracted} logos moved to {wiki_logos.logos_dir}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   generate_columnar_cache.py
+
+   Descp: Generate (or refresh) the columnar cache files for the wikis
+      listed in wikis.json, so WikiChron doesn't need to parse any csv when
+      loading them for the first time.
+
+      Parameters:
+        -force: regenerate every columnar file, even if it is up to date.
+        domains (optional): only process the wikis with these domains.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import sys
+import json
+import time
+
+if not 'WIKICHRON_DATA_DIR' in os.environ:
+    os.environ['WIKICHRON_DATA_DIR'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+data_dir = os.environ['WIKICHRON_DATA_DIR']
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../wikichron'))
+from utils import columnar_store
+
+
+def main():
+    args = sys.argv[1:]
+    force = '-force' in args
+    selected_domains = {arg for arg in args if arg != '-force'}
+
+    if not columnar_store.columnar_available:
+        print('Error: pyarrow is not installed. Install it with: pip install pyarrow')
+        return 1
+
+    wikis = json.load(open(os.path.join(data_dir, 'wikis.json')))
+
+    for wiki in wikis:
+        if selected_domains and wiki['domain'] not in selected_domains:
+            continue
+
+        if not os.path.isfile(os.path.join(data_dir, wiki['data'])):
+            print(f'Skipping {wiki["domain"]}: {wiki["data"]} not found')
+            continue
+
+        path = columnar_store.get_columnar_path(wiki['data'])
+        if not force and os.path.isfile(path):
+            print(f'{wiki["domain"]} is up to date')
+            continue
+
+        print(f'Generating columnar cache for {wiki["domain"]}')
+        time_start = time.perf_counter()
+        path = columnar_store.build_columnar(wiki['data'])
+        time_end = time.perf_counter() - time_start
+        print(f' * [Timing] {wiki["domain"]} -> {path} : {time_end} seconds')
+
+    return 0
+
+
+if __name__ == '__main__':
+   sys.exit(main())
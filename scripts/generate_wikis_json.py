@@ -29,6 +29,7 @@ from is_wikia_wiki import is_wikia_wiki
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../wikichron'))
 from utils.data_manager import update_wikis_metadata, get_stats
 from utils.utils import get_domain_from_url
+from utils.wiki_logos import store_data_uri, extract_logo
 
 if 'WIKICHRON_DATA_DIR' in os.environ:
     data_dir = os.environ['WIKICHRON_DATA_DIR']
@@ -128,12 +129,16 @@ def main():
             if (is_wikia_wiki(wiki['url'])):
                 b64 = get_wikia_wordmark_file(wiki['url'])
                 if b64:
-                    wiki['imageSrc'] = b64
+                    wiki['logo'] = store_data_uri(b64)
                 else:
                     print(f'\n-->Failed to find image for wiki: {wiki["url"]}<--\n')
             # append to wikis.json
             wikis_json.append(wiki)
 
+    # move logos still embedded in wikis.json to the logos store
+    for wiki in wikis_json:
+        extract_logo(wiki)
+
     update_wikis_metadata(wikis_json)
 
     print(f'\nWikis updated: {[wiki["domain"] for wiki in wikis]}')
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   invalidate_wiki_cache.py
+
+   Descp: Drop the cached data of some wikis from the Redis cache of
+      WikiChron, and tell the running workers to drop their own copies,
+      without flushing the data of the rest of wikis. Their metrics are
+      also removed from the metric store.
+
+      Parameters:
+        domains: domains of the wikis to invalidate.
+
+      The Redis server is taken from the environment variable REDIS_URL
+      (redis://localhost:6379 by default).
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import sys
+import json
+
+import redis
+
+if not 'WIKICHRON_DATA_DIR' in os.environ:
+    os.environ['WIKICHRON_DATA_DIR'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+data_dir = os.environ['WIKICHRON_DATA_DIR']
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../wikichron'))
+from utils import cache_invalidation
+from utils import metric_store
+
+redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
+# default key prefix of Flask-Caching
+KEY_PREFIX = 'flask_cache_'
+
+
+def main():
+    domains = sys.argv[1:]
+    if not domains:
+        print(f'Usage: {sys.argv[0]} domain [domain ...]')
+        return 1
+
+    wikis = {wiki['domain']: wiki for wiki in json.load(open(os.path.join(data_dir, 'wikis.json')))}
+    client = redis.StrictRedis.from_url(redis_url)
+
+    for domain in domains:
+        wiki = wikis.get(domain, {'domain': domain, 'data': domain + '.csv'})
+        deleted = cache_invalidation.delete_tagged_keys(client, domain, KEY_PREFIX)
+        cache_invalidation.publish_invalidation(client, wiki)
+        metric_store.delete_wiki(wiki)
+        print(f'{domain}: {deleted} cache entries deleted')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
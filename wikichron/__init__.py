@@ -5,6 +5,7 @@ from flask import Flask
 
 # local imports
 from wikichron.config import DevelopmentConfig
+import wikichron.utils.warm_up as warm_up
 
 # classic app
 from wikichron.dash.apps.classic.app import create_dash_app as create_classic, set_up_app as set_up_classic
@@ -29,6 +30,10 @@ def create_app(config_class = DevelopmentConfig):
     register_dashapp(server)
     register_blueprints(server)
 
+    # compute in background the data of the most requested wikis
+    if not server.config['DEBUG']:
+        warm_up.start()
+
     return server
 
 
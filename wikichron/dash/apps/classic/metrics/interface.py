@@ -14,6 +14,9 @@ import numpy as np
 import time
 import os
 
+import wikichron.utils.metrics_engine as metrics_engine
+import wikichron.utils.compute_pool as compute_pool
+import wikichron.utils.data_registry as data_registry
 from . import stats
 from . import metrics_generator
 
@@ -44,39 +47,61 @@ Return a dictionary where every key is a MetricCategory object and every value
     return _metrics_by_category
 
 
-def compute_metrics_on_dataframe(metrics, df):
+def compute_metrics_on_dataframe(metrics, df, window=None):
     """
         Get the requested metrics computed on a dataframe in relative dates.
 
         metrics -- list of metric objects
         df -- Dataframe to compute and calculate the metrics on.
+        window -- time window to compute the metrics for (see
+            wikichron.utils.time_window), or None for the whole history.
         Return a list of panda series corresponding to the provided metrics.
     """
     index = stats.calculate_index_all_months(df) #TOIMPROVE
     metrics_data = []
-    for metric in metrics:
-        metric_series = metric.calculate(df, index)
+    # compute all metrics at once, so they share their intermediate results
+    metrics_series = metrics_engine.compute_metrics(metrics, df, index, window)
+    for (metric, metric_series) in zip(metrics, metrics_series):
         metric_series.name = '{}<>{}'.format(df.index.name,metric.code)
         metrics_data.append(metric_series)
     return metrics_data
 
 
-def compute_data(dataframes, metrics):
-    """ Load analyzed data by every metric for every dataframe and return it in two dimensional array """
+def compute_metrics_on_wiki(wiki, metrics_codes, window=None):
+    """
+        Get the requested metrics computed on the data of a wiki.
+
+        This is the task run by the compute_pool workers: the data is read
+        from the registry of the worker, which maps it from the mapped store
+        instead of getting it pickled, and metrics are passed by code.
+    """
+    df = data_registry.read_data(wiki)
+    metrics = [_metrics_dict_by_code[code] for code in metrics_codes]
+    return compute_metrics_on_dataframe(metrics, df, window)
 
-    metrics_by_wiki = []
-    for df in dataframes:
-        metrics_by_wiki.append(compute_metrics_on_dataframe(metrics, df))
 
-    # transposing matrix row=>wikis, column=>metrics to row=>metrics, column=>wikis
+def transpose_metrics_by_wiki(metrics_by_wiki, n_metrics):
+    """ Transpose matrix row=>wikis, column=>metrics to row=>metrics, column=>wikis """
     wiki_by_metrics = []
-    for metric_idx in range(len(metrics)):
-        metric_row = [metrics_by_wiki[wiki_idx].pop(0) for wiki_idx in range(len(metrics_by_wiki))]
+    for metric_idx in range(n_metrics):
+        metric_row = [metrics_by_wiki[wiki_idx][metric_idx] for wiki_idx in range(len(metrics_by_wiki))]
         wiki_by_metrics.append(metric_row)
-
     return wiki_by_metrics
 
 
+def compute_metrics_on_wikis(wikis_metrics_codes):
+    """
+        Get the requested metrics computed on the data of every wiki.
+
+        wikis_metrics_codes -- list of (wiki, metrics codes, time window)
+            tuples. See compute_metrics_on_dataframe() for the window.
+        Return, for every tuple, the list of panda series of its metrics.
+        Every wiki is computed in a different process of the compute pool
+        (see compute_pool) when it is enabled.
+    """
+    return compute_pool.map_tasks(compute_metrics_on_wiki, wikis_metrics_codes)
+
+
 # Too inefficient with the current implementation
 # TOIMPROVE
 # NOTBEENUSED
@@ -22,7 +22,7 @@ class MetricCategory(Enum):
 class Metric:
     """ Class for ADT Metric. """
 
-    def __init__(self, code, text, category, func, descp):
+    def __init__(self, code, text, category, func, descp, windowed=False):
         """
         Creates a new Metric object.
 
@@ -34,6 +34,9 @@ class Metric:
         Presumably, located in the stats.py file.
         descp -- Short description (about a paragraph) of what
         the metric consists in.
+        windowed -- whether func computes the metric for just the months of
+        the index it gets, even if they don't start at the first month of
+        the data (see wikichron.utils.time_window).
         Return a new Metric instance.
         """
         self.code = code
@@ -41,6 +44,7 @@ class Metric:
         self.category = category
         self.func = func
         self.descp = descp
+        self.windowed = windowed
 
 
     def calculate(self, pandas_data_frame, index=None):
@@ -13,7 +13,10 @@
 import pandas as pd
 import numpy as np
 import math
-import inequality_coefficients as ineq
+
+import wikichron.utils.derived_columns as derived_columns
+import wikichron.utils.accumulated_distribution as accumulated_distribution
+from wikichron.utils.metrics_engine import shared_intermediate
 
 # CONSTANTS
 MINIMAL_USERS_GINI = 20
@@ -26,91 +29,125 @@ MINIMAL_USERS_RATIO_10_90 = 10
 
 
 def calculate_index_all_months(data):
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    index = monthly_data.size().index
-    return index
+    return derived_columns.get_months_index(data)
+
+##### Shared intermediates #####
+# These are computed only once per wiki when metrics are computed through
+#  wikichron.utils.metrics_engine, so they must not be modified.
+# They are computed on the whole history of the wiki, and metrics pick the
+#  months of their index from them. Accumulated metrics also add up the
+#  months before their index, so any window of months can be computed.
+
+
+@shared_intermediate
+def monthly_edits_by_namespace(data):
+    """ Number of edits and of different pages edited per month and namespace """
+    return data.groupby(['month', 'page_ns'])['page_code'].agg(['size', 'nunique'])
+
+
+@shared_intermediate
+def monthly_edits_by_contributor(data):
+    """ Number of edits per month and contributor, split by anonymity """
+    return data.groupby(['month', 'is_anonymous', 'contributor_code']).size()
+
+
+@shared_intermediate
+def monthly_new_pages_by_namespace(data):
+    """ Number of pages created per month and namespace """
+    return data[data['is_first_page_edit']].groupby(['month', 'page_ns']).size()
+
+
+@shared_intermediate
+def monthly_new_users_by_anonymity(data):
+    """ Number of new contributors per month, split by anonymity """
+    return data[data['is_first_contributor_edit']].groupby(['month', 'is_anonymous']).size()
+
+
+def sum_by_month(series, level=None, value=None):
+    """
+        Sum a series indexed by month and other levels by month.
+        If level is given, only the rows whose level is equal to value are
+        taken into account.
+    """
+    if level is not None:
+        series = series[series.index.get_level_values(level) == value]
+    return series.groupby(level='month').sum()
 
 # Pages
 
 
 def pages_new(data, index):
-    # We use the fact that data is sorted first by page_title and them by revision_id
-    # If we drop publicates we will get the first revision for each page_title, which
-    #  corresponds with the date it was created.
-    pages = data.drop_duplicates('page_id')
-    series = pages.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    # The first revision of each page corresponds with the date it was created.
+    series = sum_by_month(monthly_new_pages_by_namespace(data))
+    return derived_columns.as_monthly_series(series, index)
 
 
 def pages_accum(data, index):
-    return (pages_new(data, index).cumsum())
+    series = sum_by_month(monthly_new_pages_by_namespace(data))
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def pages_main_new(data, index):
-    pages = data.drop_duplicates('page_id')
-    main_pages = pages[pages['page_ns'] == 0]
-    series = main_pages.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_new_pages_by_namespace(data), 'page_ns', 0)
+    return derived_columns.as_monthly_series(series, index)
 
 
 def pages_main_accum(data, index):
-    return (pages_main_new(data, index).cumsum())
+    series = sum_by_month(monthly_new_pages_by_namespace(data), 'page_ns', 0)
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def pages_edited(data, index):
-    monthly_data = data.groupby([pd.Grouper(key='timestamp', freq='MS')])
-    series = monthly_data.apply(lambda x: len(x.page_id.unique()))
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    # every page belongs to just one namespace, so we can add up the pages
+    #  edited in every namespace
+    series = sum_by_month(monthly_edits_by_namespace(data)['nunique'])
+    return derived_columns.as_monthly_series(series, index)
 
 
 def main_edited(data, index):
-    main_pages = data[data['page_ns'] == 0]
-    monthly_data = main_pages.groupby([pd.Grouper(key='timestamp', freq='MS')])
-    series = monthly_data.apply(lambda x: len(x.page_id.unique()))
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_edits_by_namespace(data)['nunique'], 'page_ns', 0)
+    return derived_columns.as_monthly_series(series, index)
 
 ########################################################################
 
 # Editions
 
+##### Helper functions #####
+
+
+def edits_in_namespace(data, index, page_ns):
+    series = sum_by_month(monthly_edits_by_namespace(data)['size'], 'page_ns', page_ns)
+    return derived_columns.as_monthly_series(series, index)
+
+
+##### callable editions metrics #####
+
 
 def edits(data, index):
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    series = monthly_data.size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_edits_by_namespace(data)['size'])
+    return derived_columns.as_monthly_series(series, index)
 
 
 def edits_accum(data, index):
-    return (edits(data, index).cumsum())
+    series = sum_by_month(monthly_edits_by_namespace(data)['size'])
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def edits_main_content(data, index):
-    edits_main_data = data[data['page_ns'] == 0]
-    return (edits(edits_main_data, index))
+    return edits_in_namespace(data, index, 0)
 
 
 def edits_main_content_accum(data, index):
-    return (edits_main_content(data, index).cumsum())
+    series = sum_by_month(monthly_edits_by_namespace(data)['size'], 'page_ns', 0)
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def edits_article_talk(data, index):
-    edits_talk_data = data[data['page_ns'] == 1]
-    return (edits(edits_talk_data, index))
+    return edits_in_namespace(data, index, 1)
 
 
 def edits_user_talk(data, index):
-    edits_talk_data = data[data['page_ns'] == 3]
-    return (edits(edits_talk_data, index))
+    return edits_in_namespace(data, index, 3)
 
 ########################################################################
 
@@ -119,54 +156,51 @@ def edits_user_talk(data, index):
 ##### Helper functions #####
 
 
-def users_active_more_than_x_editions(data, index, x):
-    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size()
-    monthly_edits_filtered = monthly_edits[monthly_edits > x].to_frame(name='pages_edited').reset_index()
-    series = monthly_edits_filtered.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+def users_active_more_than_x_editions(data, index, x, anonymous=None):
+    """
+        Number of users who made more than x editions every month.
+        If anonymous is given, only anonymous (True) or registered (False)
+        users are counted.
+    """
+    monthly_edits = monthly_edits_by_contributor(data)
+    if anonymous is not None:
+        monthly_edits = monthly_edits[monthly_edits.index.get_level_values('is_anonymous') == anonymous]
+    monthly_edits_filtered = monthly_edits[monthly_edits > x]
+    series = monthly_edits_filtered.groupby(level='month').size()
+    return derived_columns.as_monthly_series(series, index)
 
 
 ##### callable users metrics #####
 
 
 def users_new(data, index):
-    users = data.drop_duplicates('contributor_id')
-    series = users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_new_users_by_anonymity(data))
+    return derived_columns.as_monthly_series(series, index)
 
 
 def users_accum(data, index):
-    return (users_new(data, index).cumsum())
+    series = sum_by_month(monthly_new_users_by_anonymity(data))
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def users_new_anonymous(data, index):
-    users = data.drop_duplicates('contributor_id')
-    anonymous_users = users[users['contributor_name'] == 'Anonymous']
-    series = anonymous_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_new_users_by_anonymity(data), 'is_anonymous', True)
+    return derived_columns.as_monthly_series(series, index)
 
 
 def users_anonymous_accum(data, index):
-    return (users_new_anonymous(data, index).cumsum())
+    series = sum_by_month(monthly_new_users_by_anonymity(data), 'is_anonymous', True)
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def users_new_registered(data, index):
-    users = data.drop_duplicates('contributor_id')
-    non_anonymous_users = users[users['contributor_name'] != 'Anonymous']
-    series = non_anonymous_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_new_users_by_anonymity(data), 'is_anonymous', False)
+    return derived_columns.as_monthly_series(series, index)
 
 
 def users_registered_accum(data, index):
-    return (users_new_registered(data, index).cumsum())
+    series = sum_by_month(monthly_new_users_by_anonymity(data), 'is_anonymous', False)
+    return derived_columns.accumulate_by_month(series, index)
 
 
 def users_active(data, index):
@@ -175,15 +209,12 @@ def users_active(data, index):
 
 # this metric is the same as the users_active, but getting rid of anonymous users
 def users_registered_active(data, index):
-    # get rid of anonymous users and procceed as it was done in the previous metric.
-    user_registered = data[data['contributor_name'] != 'Anonymous']
-    return users_active(user_registered, index)
+    return users_active_more_than_x_editions(data, index, 0, anonymous=False)
 
 
 # this metric is the complementary to users_registered_active: now, we get rid of registered users and focus on anonymous users.
 def users_anonymous_active(data, index):
-    user_anonymous = data[data['contributor_name'] == 'Anonymous']
-    return users_active(user_anonymous, index)
+    return users_active_more_than_x_editions(data, index, 0, anonymous=True)
 
 
 # this metric gets, per month, those users who have contributed to the wiki in more than 4 editions.
@@ -209,11 +240,8 @@ def users_active_more_than_99_editions(data, index):
 
 
 def anonymous_edits(data, index):
-    series = data[data['contributor_name'] == 'Anonymous']
-    series = series.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = sum_by_month(monthly_edits_by_contributor(data), 'is_anonymous', True)
+    return derived_columns.as_monthly_series(series, index)
 
 
 ##### callable ditribution metrics #####
@@ -252,7 +280,8 @@ def percentage_edits_by_anonymous_monthly(data, index):
 
 
 def percentage_edits_by_anonymous_accum(data, index):
-    series_anon_edits_accum = anonymous_edits(data, index).cumsum()
+    series_anon_edits_accum = derived_columns.accumulate_by_month(
+            sum_by_month(monthly_edits_by_contributor(data), 'is_anonymous', True), index)
     series_total_edits_accum = edits_accum(data, index)
     series = series_anon_edits_accum / series_total_edits_accum
     series *= 100 # we want it to be displayed in percentage
@@ -270,7 +299,38 @@ def contributions_per_author(data):
     """
     Takes data and outputs data grouped by its author
     """
-    return data.groupby('contributor_id').size()
+    return data.groupby('contributor_code').size()
+
+
+@shared_intermediate
+def accumulated_contributions(data, first_month, last_month):
+    """
+    Distribution of the contributions per author accumulated until every
+    month from first_month to last_month (month codes), computed in just
+    one pass over data. The contributions before first_month are taken
+    at once.
+    Returns a list of ContributionsDistribution, one per month.
+    """
+    months = derived_columns.months_to_datetime(np.arange(first_month, last_month + 1))
+    month_ends = derived_columns.get_month_ends(data, months)
+    return list(accumulated_distribution.accumulate(
+                            data['contributor_code'].values, month_ends))
+
+
+def map_accumulated_contributions(data, index, func):
+    """
+    Apply func to the distribution of contributions accumulated until every
+    month of index (of data if None) and return the results as a series
+    indexed by month.
+    """
+    if index is None:
+        index = calculate_index_all_months(data)
+    if len(index) == 0:
+        return pd.Series([], index=index, dtype=float)
+    months = derived_columns.get_month_codes(index)
+    distributions = accumulated_contributions(data, int(months[0]), int(months[-1]))
+    return pd.Series([func(distributions[month - months[0]]) for month in months],
+                    index=index, dtype=float)
 
 
 def calc_ratio_percentile_max(data, index, percentile, minimal_users):
@@ -279,77 +339,36 @@ def calc_ratio_percentile_max(data, index, percentile, minimal_users):
 
 def calc_ratio_percentile(data, index, top_percentile, percentile, minimal_users):
 
-    # Note that contributions is an *unsorted* list of contributions per author
-    def ratio_max_percentile_for_period(contributions, percentage):
+    def ratio_max_percentile_for_period(contributions):
 
-        position = int(n_users * percentage)
+        # Skip when the wiki has too few users
+        if contributions.n_users < minimal_users:
+            return np.NaN
 
-        # get top users until user who corresponds to percentil n
-        top_users = contributions.nlargest(position)
+        position = int(contributions.n_users * percentage)
 
         # get top user and percentil n user
-        p_max = top_users[top_percentile-1]
-        percentile = top_users[-1]
+        p_max = contributions.nth_largest(top_percentile)
+        percentile = contributions.nth_largest(position)
 
         # calculate ratio between percentiles
         return p_max / percentile
 
     percentage = percentile * 0.01
-    i = 0
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    result = pd.Series(index=monthly_data.size().index)
-    indices = result.index
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Accumulate data so far
-        accum_data = accum_data.append(group)
-
-        # Get contributions per contributor
-        contributions = contributions_per_author(accum_data)
-
-        n_users = len(contributions)
-
-        # Skip when the wiki has too few users
-        if n_users < minimal_users:
-            result[indices[i]] = np.NaN
-        else:
-            result[indices[i]] = ratio_max_percentile_for_period(contributions, percentage)
-        i = i + 1
-
-    return result
+    return map_accumulated_contributions(data, index, ratio_max_percentile_for_period)
 
 ##### callable ditribution metrics #####
 
 
 def gini_accum(data, index):
 
-    #~ data = raw_data.set_index([raw_data['timestamp'].dt.to_period('M'), raw_data.index])
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    if index is not None:
-        gini_accum_df = pd.Series(index=index)
-    else:
-        gini_accum_df = pd.Series(index=monthly_data.size().index)
-    indices = gini_accum_df.index
-    i = 0
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Accumulate data so far
-        accum_data = accum_data.append(group)
-
-        # Get contributions per contributor, sort them
-        #   and make it a list to call to gini_coeff()
-        values = contributions_per_author(accum_data) \
-                .tolist()
+    def gini_for_period(contributions):
+        if contributions.n_users < MINIMAL_USERS_GINI:
+            return np.NaN
+        return contributions.gini_corrected()
 
-        n_users = len(values)
-
-        if (n_users) < MINIMAL_USERS_GINI:
-            gini_accum_df[indices[i]] = np.NaN
-        else:
-            gini_accum_df[indices[i]] = ineq.gini_corrected(values, n_users)
-        i = i + 1
-
-    return gini_accum_df
+    # months after the last edit get the value of the whole data
+    return map_accumulated_contributions(data, index, gini_for_period)
 
 
 def ratio_percentiles_max_5(data, index):
@@ -378,25 +397,11 @@ def ratio_percentiles_10_20(data, index):
 
 
 def ratio_10_90(data, index):
-    i = 0
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    result = pd.Series(index=monthly_data.size().index)
-    indices = result.index
-    accum_data = pd.DataFrame()
-    for name, group in monthly_data:
-        # Get contributions per contributor, sort them
-        #   and make it a Python list
-        accum_data = accum_data.append(group)
-        contributions = contributions_per_author(accum_data)
-
-        n_users = len(contributions)
 
+    def ratio_10_90_for_period(contributions):
         # Skip when the wiki has too few users
-        if n_users < MINIMAL_USERS_RATIO_10_90:
-            result[indices[i]] = np.NaN
-        else:
-            result[indices[i]] = ineq.ratio_top10_rest(contributions)
-        i = i + 1
-
-    return result
+        if contributions.n_users < MINIMAL_USERS_RATIO_10_90:
+            return np.NaN
+        return contributions.ratio_top_rest(10)
 
+    return map_accumulated_contributions(data, index, ratio_10_90_for_period)
@@ -42,6 +42,8 @@ from .utils import get_mode_config
 from .metrics import interface as interface
 from . import cache
 from . import data_controller
+import wikichron.utils.warm_up as warm_up
+import wikichron.utils.time_window as time_window
 
 # production or development (DEBUG) flag:
 global debug
@@ -66,8 +68,6 @@ selection_params = {'wikis', 'metrics', 'lower_bound', 'upper_bound'}
 # The folowing ones will be set later on
 global available_metrics
 global available_metrics_dict
-global available_wikis
-global available_wikis_dict
 global main
 
 
@@ -117,7 +117,7 @@ def define_meta_tags(hostname, assets_url_path):
 
 
 def extract_wikis_and_metrics_from_selection_dict(selection):
-    wikis = [ available_wikis_dict[wiki_url] for wiki_url in selection['wikis'] ]
+    wikis = [ data_controller.get_wiki_by_domain(wiki_url) for wiki_url in selection['wikis'] ]
     metrics = [ available_metrics_dict[metric] for metric in selection['metrics'] ]
     return (wikis, metrics)
 
@@ -174,11 +174,17 @@ def app_bind_callbacks(app):
             if selection.get('wikis') and selection.get('metrics'):
 
                 (wikis, metrics) = extract_wikis_and_metrics_from_selection_dict(selection)
+                warm_up.record_requests(wikis)
 
                 relative_time = len(wikis) > 1
 
+                # only the months between the bounds, if any, are computed
+                window = time_window.get_window(selection.get('lower_bound'),
+                                                selection.get('upper_bound'))
+
                 return main.generate_main_content(wikis, metrics,
-                                                relative_time, query_string)
+                                                relative_time, query_string,
+                                                window)
 
 
         print('There is not a valid wikis & metrics tuple selection yet for plotting any graph')
@@ -231,8 +237,10 @@ def start_download_data_server(app, download_pathname):
             return 'Nothing to download!'
 
         (wikis, metrics) = extract_wikis_and_metrics_from_selection_dict(selection)
+        window = time_window.get_window(selection.get('lower_bound'),
+                                        selection.get('upper_bound'))
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.load_and_compute_data(wikis, metrics, window)
 
         # output in-memory zip file
         in_memory_zip = BytesIO()
@@ -310,15 +318,11 @@ def create_dash_app(server):
 
 
 def _init_global_vars():
-    global available_wikis
-    global available_wikis_dict
     global available_metrics
     global available_metrics_dict
 
     available_metrics = interface.get_available_metrics()
     available_metrics_dict = interface.get_available_metrics_dict()
-    available_wikis = data_controller.get_available_wikis()
-    available_wikis_dict = {wiki['domain']: wiki for wiki in available_wikis}
 
 
 def _init_app_callbacks(app):
@@ -12,13 +12,9 @@ WikiChron code.
 """
 
 # Built-in imports
-import pandas as pd
 import os
-import numpy as np
 import time
 from datetime import datetime
-from warnings import warn
-import json
 import functools
 
 # get csv data location (data/ by default)
@@ -28,7 +24,13 @@ data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
 TIME_DIV = 60 * 60 * 24 * 30
 
 # Local imports:
-from .metrics.interface import compute_data
+import wikichron.utils.data_registry as data_registry
+import wikichron.utils.wiki_catalog as wiki_catalog
+import wikichron.utils.metric_cache as metric_cache
+import wikichron.utils.data_version as data_version
+import wikichron.utils.job_queue as job_queue
+import wikichron.utils.warm_up as warm_up
+from .metrics.interface import compute_metrics_on_wikis, get_available_metrics
 
 ### CACHED FUNCTIONS ###
 
@@ -36,36 +38,60 @@ def set_cache(cache):
 
     # we need to declare as *global* all the cached functions we want to be
     #  available to be used from outside of this file.
-    global read_data
     global load_and_compute_data
+    global submit_compute_job
+    global get_job_status
+    global warm_up_wiki
     global generate_longest_time_axis
     global calculate_index_all_months
 
-    @cache.memoize()
-    def read_data(wiki):
-        df = get_dataframe_from_csv(wiki['data'])
-        prepare_data(df)
-        df = clean_up_bot_activity(df, wiki)
-        return df
-
-
-    # returns data[metric][wiki]
-    @cache.memoize(timeout=3600)
-    def load_and_compute_data(wikis, metrics):
+    # returns data[metric], for the only wiki selected
+    def load_and_compute_data(wikis, metrics, window=None):
+        """
+            Every (wiki, metric) result is cached on its own (see
+            metric_cache), so only the ones not in the cache are computed.
 
-        # load data from csvs:
-        time_start_loading_csvs = time.perf_counter()
-        wikis_df = read_data(wikis[0])
-        time_end_loading_csvs = time.perf_counter() - time_start_loading_csvs
-        print(' * [Timing] Loading csvs : {} seconds'.format(time_end_loading_csvs) )
-
-        # compute metric data:
+            window -- time window to compute the results for (see
+                time_window), or None for the whole history of the wiki.
+        """
         print(' * [Info] Starting calculations....')
         time_start_calculations = time.perf_counter()
-        data = compute_data(wikis_df, metrics)
+        metrics_codes = [metric.code for metric in metrics]
+        metrics_by_wiki = metric_cache.get_cells(cache, 'monowiki', wikis[:1],
+                                        metrics_codes, compute_metrics_on_wikis,
+                                        window=window)
         time_end_calculations = time.perf_counter() - time_start_calculations
-        print(' * [Timing] Calculations : {} seconds'.format(time_end_calculations) )
-        return data
+        print(' * [Timing] Loading csvs and calculations : {} seconds'.format(time_end_calculations) )
+        return metrics_by_wiki[0]
+
+
+    def submit_compute_job(wikis, metrics, window=None):
+        """
+            Compute the data of the selection in a background job (see
+            job_queue), which leaves it in the cache for
+            load_and_compute_data(), and return the id of the job.
+        """
+        params = {'wiki': data_version.get_data_version(wikis[0]),
+                'metrics': [metric.code for metric in metrics],
+                'window': window}
+
+        def compute(job):
+            job.report(0, 'Computing metrics of {}'.format(wikis[0]['name']))
+            load_and_compute_data(wikis, metrics, window)
+
+        return job_queue.submit(cache, 'monowiki', params, compute,
+                        tags=[data_version.get_wiki_tag(wikis[0])])
+
+
+    def get_job_status(job_id):
+        return job_queue.get_status(cache, job_id)
+
+
+    def warm_up_wiki(wiki):
+        """ Compute every metric of the wiki, so any selection of it is cached """
+        load_and_compute_data([wiki], get_available_metrics())
+
+    warm_up.register_task('monowiki', warm_up_wiki, cache)
 
 
     @cache.memoize()
@@ -86,61 +112,17 @@ def set_cache(cache):
 
 ### OTHER DATA-RELATED FUNCTIONS ###
 
-def get_available_wikis():
-    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
-    wikis = json.load(wikis_json_file)
-    return wikis
-
-
-def remove_bots_activity(df, bots_ids):
-    """
-       Filter out bots activity from pandas dataframe.
+def read_data(wiki):
+    """ Return the data of wiki, shared with the other WikiChron apps """
+    return data_registry.read_data(wiki)
 
-       df -- data to be filtered. It'll be modified in place
-       bots_ids -- numpy array with the userid for every bot
-       Return a dataframe derived from the original but with all the
-          editions made by bot users removed
-    """
-    bots = np.array(bots_ids)
-    return df[~df['contributor_id'].isin(bots)]
 
+def get_available_wikis():
+    return wiki_catalog.get_available_wikis()
 
-def prepare_data(df):
-    """
-       Prepare data in the correct input format for the metric
-       calculation functions.
 
-       df -- data to be prepared.
-       Modifies inplace the input data as well as returns that data
-       in the appropiate format for further calling of metric functions.
-    """
-    return df.sort_values(by='timestamp', inplace=True)
-
-
-def get_dataframe_from_csv(csv):
-    """ Read and parse a csv and return the corresponding pandas dataframe"""
-
-    print('Loading csv for ' + csv)
-    time_start_loading_one_csv = time.perf_counter()
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    print('!!Loaded csv for ' + csv)
-    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
-    print(' * [Timing] Loading {} : {} seconds'
-                    .format(csv, time_end_loading_one_csv))
-    df.index.name = csv
-    return df
-
-
-def clean_up_bot_activity(df, wiki):
-    if 'bots' in wiki:
-        botsids = [bot['id'] for bot in wiki['bots']]
-        return remove_bots_activity(df, botsids)
-    else:
-        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
-    return df
+def get_wiki_by_domain(domain):
+    return wiki_catalog.get_wiki_by_domain(domain)
 
 
 def get_first_entry(wiki):
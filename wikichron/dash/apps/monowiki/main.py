@@ -23,6 +23,7 @@ import dash_html_components as html
 import plotly.graph_objs as go
 import pandas as pd
 from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 import grasia_dash_components as gdc
 import sd_material_ui
 from flask import current_app
@@ -31,6 +32,7 @@ from flask import current_app
 from .metrics import interface as interface
 from .utils import get_mode_config
 from . import data_controller
+import wikichron.utils.job_queue as job_queue
 
 global debug
 debug = True if os.environ.get('FLASK_ENV') == 'development' else False
@@ -132,7 +134,7 @@ def generate_graphs(data, metrics, wikis, relative_time):
 
 
 def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
-                            query_string):
+                            query_string, window=None):
     """
     It generates the main content
     Parameters:
@@ -140,6 +142,8 @@ def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
         -metrics_arg: metrics to apply to those wikis
         -relative_time_arg: Use relative or absolute time axis?
         -query_string: query string of the current selection
+        -window: time window to compute the metrics for, or None for the
+            whole history (see wikichron.utils.time_window)
 
     Return: An HTML object with the main content
     """
@@ -375,7 +379,8 @@ def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
         metrics_dropdown_options.append({'label': metric.text, 'value': index})
 
     metrics_code = [metric.code for metric in metrics]
-    args_selection = json.dumps({"wikis": wikis, "metrics": metrics_code, "relative_time": relative_time})
+    args_selection = json.dumps({"wikis": wikis, "metrics": metrics_code, "relative_time": relative_time,
+                                "window": window})
 
     share_url_path = f'{server_config["PREFERRED_URL_SCHEME"]}://{server_config["APP_HOSTNAME"]}{mode_config["DASH_BASE_PATHNAME"]}{query_string}'
     download_url_path = f'{server_config["PREFERRED_URL_SCHEME"]}://{server_config["APP_HOSTNAME"]}{mode_config["DASH_DOWNLOAD_PATHNAME"]}{query_string}'
@@ -398,40 +403,105 @@ def generate_main_content(wikis_arg, metrics_arg, relative_time_arg,
                 ]
              ),
 
+            html.Div(id='job-progress', className='container'),
+
             html.Div(id='graphs'),
 
             share_modal(share_url_path, download_url_path),
 
             html.Div(id='initial-selection', style={'display': 'none'}, children=args_selection),
             html.Div(id='signal-data', style={'display': 'none'}),
+            dcc.Interval(id='job-poll', interval=job_queue.POLL_INTERVAL),
             html.Div(id='time-axis', className='time-index', style={'display': 'none'}),
             html.Div(id='ready', style={'display': 'none'}),
             gdc.Import(src='/js/common/dash/sliderHandlerLabels.js')
         ]
     );
 
+def job_progress(status):
+    """ Progress bar of the job computing the data of the selection """
+    if not status or status['state'] == job_queue.DONE:
+        return None
+
+    if status['state'] == job_queue.FAILED:
+        return html.P('Sorry, something went wrong computing the data: {}'.format(status['error']),
+                        className='text-danger')
+
+    percent = int(status['progress'] * 100)
+    children = [
+        html.P(status['message'] or 'Waiting for the computation to start...'),
+        html.Div(className='progress',
+            children=html.Div(className='progress-bar progress-bar-striped progress-bar-animated',
+                                role='progressbar',
+                                style={'width': '{}%'.format(max(percent, 5))},
+                                children='{}%'.format(percent))
+        )
+    ]
+    if status['partial']:
+        children.append(html.P('Ready: {}'.format(', '.join(status['partial'])),
+                                className='mt-2'))
+    return html.Div(className='mt-4 mb-4', children=children)
+
+
 def bind_callbacks(app):
 
     @app.callback(
         Output('signal-data', 'children'),
-        [Input('initial-selection', 'children')]
+        [Input('initial-selection', 'children'),
+        Input('job-poll', 'n_intervals')],
+        [State('signal-data', 'children')]
     )
-    def start_main(selection_json):
+    def start_main(selection_json, n_polls, signal):
+        if signal: # data is ready already
+            raise PreventUpdate()
+
         # get wikis x metrics selection
         selection = json.loads(selection_json)
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
+        window = selection.get('window')
+
+        if not n_polls:
+            metric_names = [metric.text for metric in metrics]
+            wikis_names = [wiki['name'] for wiki in wikis]
+            print('--> Retrieving and computing data')
+            print( '\t for the following wikis: {}'.format( wikis_names ))
+            print( '\tof the following metrics: {}'.format( metric_names ))
+
+        # data is computed in a background job, polled until it is done
+        job_id = data_controller.submit_compute_job(wikis, metrics, window)
+        status = data_controller.get_job_status(job_id)
+        if not status or status['state'] != job_queue.DONE:
+            raise PreventUpdate()
 
-        metric_names = [metric.text for metric in metrics]
-        wikis_names = [wiki['name'] for wiki in wikis]
-        print('--> Retrieving and computing data')
-        print( '\t for the following wikis: {}'.format( wikis_names ))
-        print( '\tof the following metrics: {}'.format( metric_names ))
-        data = data_controller.load_and_compute_data(wikis, metrics)
         print('<-- Done retrieving and computing data!')
         return True
 
 
+    @app.callback(
+        [Output('job-progress', 'children'),
+        Output('job-poll', 'disabled')],
+        [Input('job-poll', 'n_intervals'),
+        Input('signal-data', 'children')],
+        [State('initial-selection', 'children')]
+    )
+    def update_job_progress(_, signal, selection_json):
+        if signal:
+            return (None, True)
+
+        selection = json.loads(selection_json)
+        wikis = selection['wikis']
+        metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
+        window = selection.get('window')
+
+        job_id = data_controller.submit_compute_job(wikis, metrics, window)
+        status = data_controller.get_job_status(job_id)
+        # stop polling a failed job, otherwise it'd be retried once its
+        #  failed status expires, for as long as the page is open
+        failed = bool(status) and status['state'] == job_queue.FAILED
+        return (job_progress(status), failed)
+
+
     @app.callback(
         Output('time-axis', 'children'),
         [Input('signal-data', 'children'),
@@ -449,8 +519,9 @@ def bind_callbacks(app):
         selection = json.loads(selection_json)
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
+        window = selection.get('window')
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.load_and_compute_data(wikis, metrics, window)
 
         # get time axis of the oldest one and use it as base numbers for the slider:
         time_axis_index = data_controller.generate_longest_time_axis([ wiki for wiki in data[0] ],
@@ -503,8 +574,9 @@ def bind_callbacks(app):
         selection = json.loads(selection_json)
         wikis = selection['wikis']
         metrics = extract_metrics_objs_from_metrics_codes(selection['metrics'])
+        window = selection.get('window')
 
-        data = data_controller.load_and_compute_data(wikis, metrics)
+        data = data_controller.load_and_compute_data(wikis, metrics, window)
 
         if debug:
             print('Updating graphs. Selection: [{}, {}, {}, {}]'.format(selected_wikis, selected_metrics, selected_timerange, selected_timeaxis))
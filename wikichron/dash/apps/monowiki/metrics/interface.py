@@ -14,6 +14,8 @@ import numpy as np
 import time
 import os
 
+import wikichron.utils.metrics_engine as metrics_engine
+import wikichron.utils.data_registry as data_registry
 from .monowiki_stats import calculate_index_all_months
 from . import metrics_generator
 
@@ -44,23 +46,45 @@ Return a dictionary where every key is a MetricCategory object and every value
     return _metrics_by_category
 
 
-def compute_metrics_on_dataframe(metrics, df):
+def compute_metrics_on_dataframe(metrics, df, window=None):
     """
         Get the requested metrics computed on a dataframe in relative dates.
 
         metrics -- list of metric objects
         df -- Dataframe to compute and calculate the metrics on.
+        window -- time window to compute the metrics for (see
+            wikichron.utils.time_window), or None for the whole history.
         Return a list of panda series corresponding to the provided metrics.
     """
     index = calculate_index_all_months(df) #TOIMPROVE
     metrics_data = []
-    for metric in metrics:
-        metric_series = metric.calculate(df, index)
+    # compute all metrics at once, so they share their intermediate results
+    metrics_series = metrics_engine.compute_metrics(metrics, df, index, window)
+    for (metric, metric_series) in zip(metrics, metrics_series):
         #~ metric_series.name = '{}<>{}'.format(df.index.name,metric.code) #TOFIX for monowiki metrics
         metrics_data.append(metric_series)
     return metrics_data
 
 
+def compute_metrics_on_wiki(wiki, metrics_codes, window=None):
+    """ Get the requested metrics, by code, computed on the data of a wiki. """
+    df = data_registry.read_data(wiki)
+    metrics = [_metrics_dict_by_code[code] for code in metrics_codes]
+    return compute_metrics_on_dataframe(metrics, df, window)
+
+
+def compute_metrics_on_wikis(wikis_metrics_codes):
+    """
+        Get the requested metrics computed on the data of every wiki.
+
+        wikis_metrics_codes -- list of (wiki, metrics codes, time window)
+            tuples. See compute_metrics_on_dataframe() for the window.
+        Return, for every tuple, the list of its computed metrics.
+    """
+    return [compute_metrics_on_wiki(wiki, metrics_codes, window)
+                for (wiki, metrics_codes, window) in wikis_metrics_codes]
+
+
 def compute_data(dataframes, metrics):
     """
         One wiki only, so one dimensional array where every element
@@ -64,6 +64,10 @@ def generate_classic_metrics():
     metrics.append(Metric('ratio_percentiles_5_10', 'Participants prctl. 5 / 10', MetricCategory.DISTRIBUTION, classic_stats.ratio_percentiles_5_10, 'Ratio between contributions of the 5th user and the 10th top user'))
     metrics.append(Metric('ratio_percentiles_10_20', 'Participants prctl. 10 / 20', MetricCategory.DISTRIBUTION, classic_stats.ratio_percentiles_10_20, 'Ratio between contributions of the 10th user and the 20th top user'))
 
+    # every metric of classic_stats computes just the months of the index it gets
+    for metric in metrics:
+        metric.windowed = True
+
     return metrics
 
 
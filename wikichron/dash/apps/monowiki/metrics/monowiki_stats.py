@@ -13,14 +13,16 @@
 import pandas as pd
 import numpy as np
 import math
-import datetime as d
-from dateutil.relativedelta import relativedelta
+
+import wikichron.utils.derived_columns as derived_columns
+import wikichron.utils.contributor_months as contributor_months
+import wikichron.utils.heatmap as heatmap
+import wikichron.utils.cohorts as cohorts
+from wikichron.utils.metrics_engine import shared_intermediate
 
 
 def calculate_index_all_months(data):
-    monthly_data = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    index = monthly_data.size().index
-    return index
+    return derived_columns.get_months_index(data)
 
 
 
@@ -30,142 +32,84 @@ def calculate_index_all_months(data):
 ###### Helper Functions ######
 
 def filter_anonymous(data):
-    data = data[data['contributor_name'] != 'Anonymous']
+    data = data[~data['is_anonymous']]
     return data
 
 #### Helper metric users active ####
 
 def users_active_more_than_x_editions(data, index, x):
-    monthly_edits = data.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_name']).size()
-    monthly_edits_filtered = monthly_edits[monthly_edits > x].to_frame(name='pages_edited').reset_index()
-    series = monthly_edits_filtered.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    monthly_edits = data.groupby(['month', 'contributor_name'], observed=True).size()
+    monthly_edits_filtered = monthly_edits[monthly_edits > x]
+    series = monthly_edits_filtered.groupby(level='month').size()
+    return derived_columns.as_monthly_series(series, index)
 
 #### Helper metric 2 ####
 
-def add_x_months(data, months):
-    return data['timestamp'].apply(lambda x: x + relativedelta(months = +months))
-
-def displace_x_months_per_user(data, months):
-    return data.shift(months)
-
-def current_streak_x_or_y_months_in_a_row(data, index, z, y):
-    data = filter_anonymous(data)
-    mothly = data.groupby(['contributor_id',pd.Grouper(key = 'timestamp', freq = 'MS')]).size().to_frame('size').reset_index()
-    mothly['add_months'] = add_x_months(mothly, z)
-    lista = ['contributor_id']
-    lista.append('add_months')
-    if y > 0:
-      mothly['add_y_months'] = add_x_months(mothly, y)
-      lista.append('add_y_months')
-    group_users = mothly[lista].groupby(['contributor_id'])
-    displace_z_month = displace_x_months_per_user(group_users['add_months'], z)
-    mothly['displace']= displace_z_month
-    if y > 0:
-      displace_y_month = displace_x_months_per_user(group_users['add_y_months'], y)
-      mothly['displace_y_month']= displace_y_month
-      current_streak = mothly[(mothly['displace'] == mothly['timestamp']) & (mothly['displace_y_month'] != mothly['timestamp'])]
-    elif z == 1:
-      current_streak = mothly[mothly['displace'] != mothly['timestamp']]
-    elif z == 6:
-      current_streak = mothly[mothly['displace'] == mothly['timestamp']]
-    series = current_streak.groupby(pd.Grouper(key = 'timestamp', freq = 'MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+# this helper counts, per month, the editors who have been editing for between shortest and longest consecutive months until that month (see streaks in utils/contributor_months.py). Only edits in the main namespace are taken into account if only_mains is set.
+def current_streak_x_or_y_months_in_a_row(data, index, shortest, longest, only_mains=False):
+    matrix = contributor_month_matrix(data, False, only_mains)
+    included = (matrix.streaks >= shortest) & (matrix.streaks <= longest)
+    return matrix.as_series(matrix.count_by_month(included), index)
 
 def edition_concrete(data, index, pagType):
     filterData = data[data['page_ns'] == pagType]
-    series = filterData.groupby([pd.Grouper(key ='timestamp', freq='MS')]).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    return derived_columns.count_by_month(filterData, index)
 def rest_edition(data, index, listP):
-    filterData = data
-    for i in listP:
-        filterData= filterData[filterData['page_ns'] != i]
-    series = filterData.groupby([pd.Grouper(key ='timestamp', freq='MS')]).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    filterData = data[~data['page_ns'].isin(listP)]
+    return derived_columns.count_by_month(filterData, index)
+
+#### Helper for metrics 3, 4, 5 and the participation of user categories ####
+
+# edits of every contributor in every month (see utils/contributor_months.py), shared by all the metrics which classify the editors by their history of edits
+@shared_intermediate
+def contributor_month_matrix(data, include_anonymous, only_mains=False):
+    if not include_anonymous:
+        data = filter_anonymous(data)
+    if only_mains:
+        data = data[data['page_ns'] == 0]
+    return contributor_months.ContributorMonthMatrix(data['contributor_code'].values, data['month'].values)
+
+# cells of the contributors who had made between y and x editions before that month, or x or more if y is 0 (x = 0 and y = 0 are the cells of the first month of every contributor)
+def edits_before_in_range(matrix, x, y):
+    if (y == 0) and (x > 0):
+        return matrix.edits_before >= x
+    return (matrix.edits_before >= y) & (matrix.edits_before <= x)
 
 #### Helper metric 3 ####
 
-# this function is a helper for the functions in the metric 3 section: it filters the editors according to a condition which depends on the numbers x and y, passed as parameters by the caller functions.
+# this function is a helper for the functions in the metric 3 section: it counts, per month, the editors whose first edition was made between x and y months before (both included, counting the current month as the first one), or more than x months before if y is 0.
 def filter_users_first_edition(data, index, x, y):
-    data = filter_anonymous(data)
-# 1) Get the index of the dataframe to analyze: it must include all the months recorded in the history of the wiki.
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
-# 2) create a dataframe in which we have the cumulative sum of the editions the user has made all along the history of the wiki.
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits').reindex(new_index, fill_value=0).cumsum()).reset_index()
-# 3) add a new column to the dataframe ('position') in which the number of each row depending on the contributor ID is computed: note that the count isn't restarted until nEdits > 0.
-    cond = users_month_edits['nEdits'] == 0
-    users_month_edits['position'] = np.where(cond, 0, users_month_edits.groupby([cond, 'contributor_id']).cumcount() + 1)
-
+    matrix = contributor_month_matrix(data, False)
+    position = matrix.months - matrix.first_month + 1
     if y > 0:
-        condition = ((users_month_edits['position'] >= x) & (users_month_edits['position'] <= y)) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift())
+        included = (position >= x) & (position <= y)
     else:
-        condition = (users_month_edits['position'] > x) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift())
-
-    users_month_edits['included'] = np.where(condition, 1,0)
-# 4) count the number of appereances each timestamp has in the 'included' column:
-    series = pd.Series(users_month_edits.groupby(['timestamp']).sum()['included'], new_index)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+        included = position > x
+    return matrix.as_series(matrix.count_by_month(included), index, 'included')
 
 
 #### Helper metric 4 ####
 
-# this function is a helper for the functions in the metric 4 section: it filters the editors according to a condition which depends on the number x , passed as parameter by the caller functions.
+# this function is a helper for the functions in the metric 4 section: it counts, per month, the editors who made their previous edition x months before, or more than 6 months before if x is 6.
 def filter_users_last_edition(data, index, x):
-    data = filter_anonymous(data)
-# 1) Get the index of the dataframe to analyze: it must include all the months recorded in the history of the wiki.
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
-# 2) create a dataframe in which we have the cumulative sum of the editions the user has made all along the history of the wiki.
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits').reindex(new_index, fill_value=0).cumsum()).reset_index()
-# 3) add a new column to the dataframe ('position') in which the number of each row depending grouping by contributor ID is computed: note that the count isn't restarted until nEdits > 0.
-    cond = users_month_edits['nEdits'] == 0
-    users_month_edits['position'] = np.where(cond, 0, users_month_edits.groupby([cond, 'contributor_id', 'nEdits']).cumcount() + 1)
-# 4) add a new column, 'included', which will contain two possible values: 0 if the user didn't edit in month X or edited in month X but not in months specified by caller function, and 1 if the user edited in month X and made his last edition in month X-1
-
+    matrix = contributor_month_matrix(data, False)
+    has_previous = matrix.previous_month >= 0
+    months_since_previous = matrix.months - matrix.previous_month
     if x != 6:
-        cond1 = ((users_month_edits['position'] == 1) & (users_month_edits['position'].shift() == x)) & (users_month_edits['contributor_id'] == users_month_edits['contributor_id'].shift())
+        included = has_previous & (months_since_previous == x)
     else:
-        cond1 = ((users_month_edits['position'] == 1) & (users_month_edits['position'].shift() > x)) & (users_month_edits['contributor_id'] == users_month_edits['contributor_id'].shift())
-
-    users_month_edits['included'] = np.where(cond1, 1, 0)
-# 5) create series
-    series = pd.Series(users_month_edits.groupby(['timestamp']).sum()['included'], new_index)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+        included = has_previous & (months_since_previous > x)
+    return matrix.as_series(matrix.count_by_month(included), index, 'included')
 
 
 
 #### Helper metric 5 ####
 
-# this helper functions filters the editors according to their number of editions, which can be in a range: [x, y] or >=x, with x and y specified by the caller functions
+# this helper functions filters the editors according to their number of editions until the previous month, which can be in a range: [y, x] or >=x, with x and y specified by the caller functions
 def filter_users_number_of_edits(data, index, x, y):
-# 1) Get the index of the dataframe to analyze: it must include all the months recorded in the history of the wiki.
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
-# 2) create a dataframe in which we have the cumulative sum of the editions the user has made all along the history of the wiki.
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS'))
-                                                        .size().to_frame('nEdits').reindex(new_index, fill_value=0).cumsum()).reset_index()
-# 3) add a new column to the dataframe ('included') in which 2 values are possible: 1. if the user has made between >=x and <=y editions in month x - 1 (shift function is used to access the previous row), a 1 appears. 2. Otherwise, the value in the 'included' column will be 0.
-
-    if y != 0:
-        cond1 = (users_month_edits['contributor_id'].shift() == users_month_edits['contributor_id']) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift()) & ((users_month_edits['nEdits'].shift()<=x) & (users_month_edits['nEdits'].shift()>=y))
-    else:
-        cond1 = (users_month_edits['contributor_id'].shift() == users_month_edits['contributor_id']) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift()) & (users_month_edits['nEdits'].shift()>=x)
-
-    users_month_edits['included'] = np.where(cond1, 1, 0)
-    series = pd.Series(users_month_edits.groupby(['timestamp']).sum()['included'], new_index)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    matrix = contributor_month_matrix(data, True)
+    included = edits_before_in_range(matrix, x, y)
+    return matrix.as_series(matrix.count_by_month(included), index, 'included')
 
 
 #### Helper metrics 9 and 10 ####
@@ -174,105 +118,76 @@ def filter_users_number_of_edits(data, index, x, y):
 def filter_users_pageNS(data, index, page_ns):
     data = filter_anonymous(data)
     edits_page = data[data['page_ns'] == page_ns]
-    series = edits_page.groupby(pd.Grouper(key = 'timestamp', freq = 'MS'))['contributor_id'].nunique()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    series = edits_page.groupby('month')['contributor_code'].nunique()
+    return derived_columns.as_monthly_series(series, index)
 
 
 #### Helper metrics to calculate the number of edits and the percentage of edits done by user categories ####
 
 #this function calculates the number of editions done on each month by each user category (users that are new to the wiki, users that have done between 1 and 4, 5 and 24, 25 and 99 and more or equal to 100 editions in all the history of the wiki)
 def number_of_edits_by_user_category(data, index, x, y):
-    data = filter_anonymous(data)
-# 1) Get the index of the dataframe to analyze: it must include all the months recorded in the history of the wiki.
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
-# 2) create a dataframe in which we have the cumulative sum of the editions the user has made all along the history of the wiki.
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits').reindex(new_index, fill_value=0).cumsum()).reset_index()
-# 3) add a new column, edits_per_month, which is equal to the substraction of the number of edits in month X minus the number of edits in month X-1
-    cond = (users_month_edits['contributor_id'] == users_month_edits['contributor_id'].shift())
-    users_month_edits['nEdits_per_month'] = np.where(cond, users_month_edits['nEdits'] - users_month_edits['nEdits'].shift(), users_month_edits['nEdits'])
-# 4) add a new column to the dataframe ('included') in which 2 values are possible: 1. if the user has made between >=x and <=y editions in month x - 1 (shift function is used to access the previous row), a 1 appears. 2. Otherwise, the value in the 'included' column will be 0.
-    if (y != 0) and (x > 0):
-        cond1 = (users_month_edits['contributor_id'].shift() == users_month_edits['contributor_id']) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift()) & ((users_month_edits['nEdits'].shift()<=x) & (users_month_edits['nEdits'].shift()>=y))
-    elif (y == 0) and (x == 0):
-        cond1 = (((users_month_edits['nEdits'] > 0) & (users_month_edits['nEdits'].shift() == 0)) & (users_month_edits['contributor_id'] == users_month_edits['contributor_id'].shift())) | ((users_month_edits['contributor_id'] != users_month_edits['contributor_id'].shift()) & (users_month_edits['nEdits'] > 0))
-    else:
-        cond1 = (users_month_edits['contributor_id'].shift() == users_month_edits['contributor_id']) & (users_month_edits['nEdits'] != users_month_edits['nEdits'].shift()) & (users_month_edits['nEdits'].shift()>=x)
-    users_month_edits['included'] = np.where(cond1, 1, 0)
-    # 5) we want to get the total number of edits done by all the users in a group, by timestamp: calculate how many edits were done by the users included in the group, and by the users not included in the group
-    num_edits_of_groups = users_month_edits.groupby([pd.Grouper(key ='timestamp', freq='MS'),'included'])['nEdits_per_month'].sum().reset_index(name='nEditsgroup')
-    return num_edits_of_groups
+    matrix = contributor_month_matrix(data, False)
+    included = edits_before_in_range(matrix, x, y)
+    return matrix.as_series(matrix.sum_by_month(included), index, 'n_edits')
 
 #this function calculates the percentage of editions done on each month by each user category (users that are new to the wiki, users that have done between 1 and 4, 5 and 24, 25 and 99 and more or equal to 100 editions in all the history of the wiki)
 def percentage_of_edits_by_user_category(data, index, x, y):
-    num_edits_of_groups = number_of_edits_by_user_category(data, index, x, y)
-    num_edits_of_groups['total_edits'] = num_edits_of_groups.groupby(pd.Grouper(key ='timestamp', freq='MS'))['nEditsgroup'].transform(sum)
-    cond = (num_edits_of_groups['included'] == 1)
-    percentage_of_edits_group = np.where(cond, (num_edits_of_groups['nEditsgroup'].div(num_edits_of_groups['total_edits']) * 100), 0)
-    percentage_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': percentage_of_edits_group}).groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-    series = percentage_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    matrix = contributor_month_matrix(data, False)
+    edits_group = matrix.sum_by_month(edits_before_in_range(matrix, x, y))
+    total_edits = matrix.sum_by_month()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage = np.where(total_edits > 0, (edits_group / total_edits) * 100, 0)
+    return matrix.as_series(percentage, index, 'n_edits')
 
 ###### Callable Functions ######
 
 ############################ METRIC 1: USERS NEW AND USERS REINCIDENT ###############################################################
 
 def users_new(data, index):
-    users = data.drop_duplicates('contributor_id')
-    series = users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    users = data[data['is_first_contributor_edit']]
+    return derived_columns.count_by_month(users, index)
 
 #users who make their second edition in the wiki (we want the count for this kind of users per month)
 def users_reincident(data, index):
-    data['test_duplicated'] = data['contributor_id'].duplicated()
-    data = data[data['contributor_name'] != 'Anonymous']
-    users_reincident = data[data['test_duplicated'] == True]
+    data = filter_anonymous(data)
+    users_reincident = data[~data['is_first_contributor_edit']]
 #determine in which month each user performed their second edition-> can be the same month as the first one
 #1) get number of editions per month for every user
-    users_reincident = users_reincident.groupby(['contributor_id', pd.Grouper(key='timestamp', freq='MS')]).size().to_frame('edits_count').reset_index()
+    users_reincident = users_reincident.groupby(['contributor_code', 'month']).size().to_frame('edits_count').reset_index()
 #2) get the accum. number of edits per user each month
-    users_reincident['accum_edit_count'] = users_reincident.groupby('contributor_id')['edits_count'].transform(lambda x: x.cumsum())
+    users_reincident['accum_edit_count'] = users_reincident.groupby('contributor_code')['edits_count'].cumsum()
 #3) drop rows in which the accum_edit_count is less than 2
     users_reincident = users_reincident[users_reincident['accum_edit_count'] > 1]
 #4) now, we just want the first month in which the user became reincident: (drop_duplicates drops all rows but first, so as it is sorted, for sure we will keep the first month)
-    users_reincident = users_reincident.drop_duplicates('contributor_id')
-#5) group by timestamp and get the count of reincident users per month
-    series = users_reincident.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    users_reincident = users_reincident.drop_duplicates('contributor_code')
+#5) group by month and get the count of reincident users per month
+    series = users_reincident.groupby('month').size()
+    return derived_columns.as_monthly_series(series, index)
 
 
 ############################ METRIC 2 #################################################################################################
 
-def current_streak_this_month(data, index):
-    return current_streak_x_or_y_months_in_a_row(data, index, 1, 0)
-    
+def current_streak_this_month(data, index, only_mains=False):
+    return current_streak_x_or_y_months_in_a_row(data, index, 1, 1, only_mains)
 
-def current_streak_2_or_3_months_in_a_row(data, index):
-    return current_streak_x_or_y_months_in_a_row(data, index, 1, 3)
-    
 
+def current_streak_2_or_3_months_in_a_row(data, index, only_mains=False):
+    return current_streak_x_or_y_months_in_a_row(data, index, 2, 3, only_mains)
 
-def current_streak_4_or_6_months_in_a_row(data, index):
-    return current_streak_x_or_y_months_in_a_row(data, index, 3, 6)
-    
 
+def current_streak_4_or_6_months_in_a_row(data, index, only_mains=False):
+    return current_streak_x_or_y_months_in_a_row(data, index, 4, 6, only_mains)
+
+
+def current_streak_more_than_six_months_in_a_row(data, index, only_mains=False):
+    return current_streak_x_or_y_months_in_a_row(data, index, 7, np.inf, only_mains)
 
-def current_streak_more_than_six_months_in_a_row(data, index):
-    return current_streak_x_or_y_months_in_a_row(data, index, 6, 0)
-    
 
-def current_streak(data, index):
-    this_month = current_streak_this_month(data, index)
-    two_three_months = current_streak_2_or_3_months_in_a_row(data, index)
-    four_six_months = current_streak_4_or_6_months_in_a_row(data, index)
-    more_six = current_streak_more_than_six_months_in_a_row(data, index)
+def current_streak(data, index, only_mains=False):
+    this_month = current_streak_this_month(data, index, only_mains)
+    two_three_months = current_streak_2_or_3_months_in_a_row(data, index, only_mains)
+    four_six_months = current_streak_4_or_6_months_in_a_row(data, index, only_mains)
+    more_six = current_streak_more_than_six_months_in_a_row(data, index, only_mains)
     this_month.name = '1 month editing'
     two_three_months.name = 'btw. 2 and 3 consecutive months'
     four_six_months.name = 'btw. 4 and 6 consecutive months'
@@ -280,16 +195,7 @@ def current_streak(data, index):
     return [this_month, two_three_months, four_six_months, more_six, 'Bar']
 
 def current_streak_only_mains(data, index):
-    data = data[data['page_ns']==0]
-    this_month = current_streak_this_month(data, index)
-    two_three_months = current_streak_2_or_3_months_in_a_row(data, index)
-    four_six_months = current_streak_4_or_6_months_in_a_row(data, index)
-    more_six = current_streak_more_than_six_months_in_a_row(data, index)
-    this_month.name = '1 month editing'
-    two_three_months.name = 'btw. 2 and 3 consecutive months'
-    four_six_months.name = 'btw. 4 and 6 consecutive months'
-    more_six.name = 'more than 6 consecutive months'
-    return [this_month, two_three_months, four_six_months, more_six, 'Bar']
+    return current_streak(data, index, True)
 
 
 def edition_on_type_pages(data, index):
@@ -464,10 +370,8 @@ def users_other_page(data,index):
     aux['timestamp'] = index
     
     for i in range(len(category_list)):
-        print(category_list[i])
         serie = filter_users_pageNS(data, index, category_list[i])
-        serie = pd.DataFrame(serie).reset_index()
-        aux['page_ns_' + str(category_list[i])] = serie['contributor_id']
+        aux['page_ns_' + str(category_list[i])] = serie.values
     
     aux['final_result'] = aux.sum(axis=1)
     series = pd.Series(index=aux['timestamp'], data=aux['final_result'].values)
@@ -495,73 +399,23 @@ def type_page_users_edit(data, index):
 
 #this metric gets the total number of editions per month that were done by users ho have made between 1 and 4 editions in all the history of the wiki
 def number_of_edits_by_beginner_users(data, index):
-    num_edits_of_groups = number_of_edits_by_user_category(data, index, 4, 1) 
-# 1) we only want to know how many edits were done by the included users
-    cond = (num_edits_of_groups['included'] == 1)
-    edits_group_final = np.where(cond, num_edits_of_groups['nEditsgroup'], 0)
-    num_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': edits_group_final})
-# 2) It is possible that the same month is repeated twice in the dataframe: 1. for the not included users (in which the n_edits column will always have a value of 0), 2. For the included users, in which the value of the n_edits column will be = number of edits done by the users in the category
-    num_edits_group_per_month = num_edits_group_per_month.groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-    series = num_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    return number_of_edits_by_user_category(data, index, 4, 1)
 
 #this metric gets the total number of editions per month that were done by users ho have made between 5 and 24 editions in all the history of the wiki
 def number_of_edits_by_advanced_users(data, index):
-    num_edits_of_groups = number_of_edits_by_user_category(data, index, 24, 5) 
-# 1) we only want to know how many edits were done by the included users
-    cond = (num_edits_of_groups['included'] == 1)
-    edits_group_final = np.where(cond, num_edits_of_groups['nEditsgroup'], 0)
-    num_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': edits_group_final})
-# 2) It is possible that the same month is repeated twice in the dataframe: 1. for the not included users (in which the n_edits column will always have a value of 0), 2. For the included users, in which the value of the n_edits column will be = number of edits done by the users in the category
-    num_edits_group_per_month = num_edits_group_per_month.groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-    series = num_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-    if index is not None:
-        series = series.reindex(index, fill_value=0)
-    return series
+    return number_of_edits_by_user_category(data, index, 24, 5)
 
 #this metric gets the total number of editions per month that were done by users ho have made between 25 and 99 editions in all the history of the wiki
 def number_of_edits_by_experimented_users(data, index):
-     num_edits_of_groups = number_of_edits_by_user_category(data, index, 99, 25) 
-# 1) we only want to know how many edits were done by the included users
-     cond = (num_edits_of_groups['included'] == 1)
-     edits_group_final = np.where(cond, num_edits_of_groups['nEditsgroup'], 0)
-     num_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': edits_group_final})
-# 2) It is possible that the same month is repeated twice in the dataframe: 1. for the not included users (in which the n_edits column will always have a value of 0), 2. For the included users, in which the value of the n_edits column will be = number of edits done by the users in the category
-     num_edits_group_per_month = num_edits_group_per_month.groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-     series = num_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-     if index is not None:
-         series = series.reindex(index, fill_value=0)
-     return series
+    return number_of_edits_by_user_category(data, index, 99, 25)
 
 #this metric gets the total number of editions per month that were done by users ho have made more or equal to 100 editions in all the history of the wiki
 def number_of_edits_by_highly_experimented_users(data, index):
-     num_edits_of_groups = number_of_edits_by_user_category(data, index, 100, 0) 
-# 1) we only want to know how many edits were done by the included users
-     cond = (num_edits_of_groups['included'] == 1)
-     edits_group_final = np.where(cond, num_edits_of_groups['nEditsgroup'], 0)
-     num_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': edits_group_final})
-# 2) It is possible that the same month is repeated twice in the dataframe: 1. for the not included users (in which the n_edits column will always have a value of 0), 2. For the included users, in which the value of the n_edits column will be = number of edits done by the users in the category
-     num_edits_group_per_month = num_edits_group_per_month.groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-     series = num_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-     if index is not None:
-         series = series.reindex(index, fill_value=0)
-     return series
+    return number_of_edits_by_user_category(data, index, 100, 0)
 
 #this metric gets the total number of editions per month that were done by new users (X = number of edits in all the history of the wiki -> x = 0 before the current month)
 def number_of_edits_by_new_users(data, index):
-     num_edits_of_groups = number_of_edits_by_user_category(data, index, 0, 0) 
-# 1) we only want to know how many edits were done by the included users
-     cond = (num_edits_of_groups['included'] == 1)
-     edits_group_final = np.where(cond, num_edits_of_groups['nEditsgroup'], 0)
-     num_edits_group_per_month = pd.DataFrame({'timestamp': num_edits_of_groups['timestamp'], 'n_edits': edits_group_final})
-# 2) It is possible that the same month is repeated twice in the dataframe: 1. for the not included users (in which the n_edits column will always have a value of 0), 2. For the included users, in which the value of the n_edits column will be = number of edits done by the users in the category
-     num_edits_group_per_month = num_edits_group_per_month.groupby(pd.Grouper(key='timestamp', freq='MS')).sum().reset_index()
-     series = num_edits_group_per_month.set_index('timestamp')['n_edits'].rename_axis(None)
-     if index is not None:
-         series = series.reindex(index, fill_value=0)
-     return series
+    return number_of_edits_by_user_category(data, index, 0, 0)
 
 
 def number_of_edits_by_category(data, index):
@@ -618,56 +472,26 @@ def percentage_of_edits_by_category(data, index):
 
     return [pctage_category5, pctage_category1, pctage_category2, pctage_category3, pctage_category4, 'Bar']
 
-def returning_new_editor(data, index):
-    data.reset_index(drop=True, inplace=True)
-    #remove anonymous users
+# registered editors and their edits relative to their first edition (see utils/cohorts.py), shared by the retention metrics
+@shared_intermediate
+def new_editors_cohort(data):
     registered_users = filter_anonymous(data)
-    #add up 7 days to the date on which each user registered
-    seven_days_after_registration = registered_users.groupby(['contributor_id']).agg({'timestamp':'first'}).apply(lambda x: x+d.timedelta(days=7)).reset_index()
-    #change the name to the timestamp column
-    seven_days_after_registration=seven_days_after_registration.rename(columns = {'timestamp':'seven_days_after'})
-    #merge two dataframes by contributor_id
-    registered_users = pd.merge(registered_users, seven_days_after_registration, on ='contributor_id')
-    #edits of each user within 7 days of being registered
-    registered_users = registered_users[registered_users['timestamp'] <=registered_users['seven_days_after']]
-    #to order by date
-    registered_users = registered_users.sort_values(['timestamp'])
-    #get the timestamp and contributor_id and group by contributor_id
-    timestamp_and_contributor_id = registered_users[['timestamp', 'contributor_id']].groupby(['contributor_id'])
-    #displace the timestamp a position 
-    displace_timestamp = timestamp_and_contributor_id.apply(lambda x: x.shift())
-    registered_users['displace_timestamp'] = displace_timestamp['timestamp']
-    #compare the origin timestamp with the displace_timestamp
-    registered_users['comp'] = (registered_users.timestamp-registered_users.displace_timestamp)
-    #convert to seconds and replace the NAT for 31 because the NAT indicate the first edition
-    registered_users['comp'] = registered_users['comp'].apply(lambda y: y.total_seconds()/60).fillna(61)
-    #take the edit sessions
-    edits_sessions = registered_users[(registered_users['comp']>60) ]
-    num_edits_sessions = edits_sessions.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size()
-    #users with at least two editions
-    returning_users = num_edits_sessions[num_edits_sessions >1].to_frame('returning_users').reset_index()
-    #minimum month in which each user has made two editions
-    returning_new_users = returning_users.groupby(['contributor_id'])['timestamp'].min().reset_index()
-    returning_new_users = returning_new_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        returning_new_users = returning_new_users.reindex(index, fill_value=0)
-    return [returning_new_users, 'Scatter']
-	
+    return cohorts.get_cohort_table(registered_users['contributor_code'].values, registered_users['timestamp'].values)
+
+# new editors who complete at least two edit sessions within the 7 days after their first edition, counted in the month of those sessions
+def returning_new_editor(data, index):
+    cohort = new_editors_cohort(data)
+    edits_sessions = cohort['is_session_start'].values & cohorts.in_window(cohort, pd.Timedelta(0), pd.Timedelta(days=7))
+    #minimum month in which each user has started two edit sessions
+    returning_new_users = cohorts.month_of_activity(cohort, edits_sessions, min_edits=2)
+    return [cohorts.count_by_month(returning_new_users, index), 'Scatter']
+
+# new editors who edit between 30 and 60 days after their first edition, counted in the month of their last edition in that period
 def surviving_new_editor(data, index):
-    data.reset_index(drop=True, inplace=True)
-    registered_users = filter_anonymous(data)
-    #add up 30 days to the date on which each user registered
-    thirty_days_after_registration = registered_users.groupby(['contributor_id']).agg({'timestamp':'first'}).apply(lambda x: x+d.timedelta(days=30)).reset_index()
-    thirty_days_after_registration=thirty_days_after_registration.rename(columns = {'timestamp':'thirty_days_after'})
-    registered_users = pd.merge(registered_users, thirty_days_after_registration, on ='contributor_id')
-    registered_users['survival period'] = registered_users['thirty_days_after'].apply(lambda x: x+d.timedelta(days=30))
-    survival_users = registered_users[(registered_users['timestamp'] >= registered_users['thirty_days_after']) & (registered_users['timestamp'] <= registered_users['survival period'])]
-    survival_users = survival_users.groupby([pd.Grouper(key='timestamp', freq='MS'), 'contributor_id']).size().to_frame('num_editions_in_survival_period').reset_index()
-    survival_new_users = survival_users.groupby(['contributor_id'])['timestamp'].max().reset_index()
-    survival_new_users = survival_new_users.groupby(pd.Grouper(key='timestamp', freq='MS')).size()
-    if index is not None:
-        survival_new_users = survival_new_users.reindex(index, fill_value=0)
-    return [survival_new_users, 'Scatter']
+    cohort = new_editors_cohort(data)
+    survival_period = cohorts.in_window(cohort, pd.Timedelta(days=30), pd.Timedelta(days=60))
+    survival_new_users = cohorts.month_of_activity(cohort, survival_period, last=True)
+    return [cohorts.count_by_month(survival_new_users, index), 'Scatter']
 
 ############################# HEATMAP METRICS ##############################################
 
@@ -679,220 +503,50 @@ def edit_distributions_across_editors(data, index):
 
     """
     users_registered = filter_anonymous(data)
-    mothly = users_registered.groupby([pd.Grouper(key ='timestamp', freq='MS'),'contributor_id']).size()
-    max_contributions = max(mothly)
-    mothly = mothly.to_frame('num_contributions').reset_index()
-    mothly = mothly.groupby([pd.Grouper(key ='timestamp', freq='MS'),'num_contributions']).size().to_frame('num_editors').reset_index()
-    max_persons = max(mothly['num_editors'])
-    round_max = round((max_contributions+5), -1)
-    list_range = list(range(0, round_max+1, 10))
-    max_range = max(list_range)
-    mothly['range'] = pd.cut(mothly['num_contributions'], bins = list_range).astype(str)
-    months_range = mothly.groupby([pd.Grouper(key ='timestamp', freq='MS'), 'range']).size()
-    graphs_list = [[0 for j in range(max_range+1)] for i in range(len(index))]
-    before = pd.to_datetime(0)
-    j = -1
-    for i, v in months_range.iteritems(): 
-        i = list(i)
-        current = i[0]
-        p = i[1]
-        p = p.split(']')[0]
-        p = p.split('(')[1]
-        p = p.split(',')
-        num_min = int(float(p[0]))
-        num_max = int(float(p[1]))
-        num_min = (num_min+1) 
-        num_max = (num_max) 
-        resta = current - before
-        resta = int(resta / np.timedelta64(1, 'D'))
-        while (resta > 31 and before != pd.to_datetime(0)):
-            j = j+1
-            resta = resta-31
-        if (before != current):
-            j = j +1
-            before = current
-        for num in range(num_min,num_max+1):
-            graphs_list[j][num] = v
-    
-    
-    wiki_by_metrics = []
-    for metric_idx in range(max_contributions+1):
-        metric_row = [graphs_list[wiki_idx].pop(0) for wiki_idx in range(len(graphs_list))]
-        wiki_by_metrics.append(metric_row) 
-    return [index,list(range(max_contributions)), wiki_by_metrics, months_range, 'Heatmap']
+    mothly = users_registered.groupby(['month', 'contributor_code']).size()
+    max_contributions = int(mothly.max())
+    # each month, we count the different numbers of contributions made by its editors
+    mothly = mothly.reset_index(name='num_contributions')[['month', 'num_contributions']].drop_duplicates()
+    round_max = int(round((max_contributions+5), -1))
+    list_range = range(0, round_max+1, 10)
+    return heatmap.build_heatmap(mothly['month'], mothly['num_contributions'], index, list_range, 0, max_contributions)
 
 def bytes_difference_across_articles(data, index):
-    data.set_index(data['timestamp'], inplace=True)
     users_registered = filter_anonymous(data)
     mains = users_registered[users_registered['page_ns'] == 0]
-    order = mains.sort_index()
-    group_by_page_id = order[['page_id', 'bytes']].groupby(['page_id'])
-    frame_bytes = group_by_page_id.apply(lambda x: (x.bytes-x.bytes.shift()).fillna(x.bytes)).to_frame('dif')
-    #frame_bytes['dif'] = group_by_page_id.apply(lambda x: x.bytes-x.bytes.shift())
-    #frame_bytes['dif'] = frame_bytes['dif'].fillna(frame_bytes['bytes'])
-    frame_bytes['dif'] = frame_bytes['dif'].apply(lambda x: int(x))
-    frame_bytes = frame_bytes.reset_index()
-    max_dif_bytes = int(max(frame_bytes['dif']))
-    min_dif_bytes = int(min(frame_bytes['dif'])-1)
-    round_max = (max_dif_bytes+100)
-    list_range = list(range(min_dif_bytes, round_max, 100))
-    max_range = max(list_range)
-    frame_bytes['range'] = pd.cut(frame_bytes['dif'], bins = list_range).astype(str)
-    months_range = frame_bytes.groupby([pd.Grouper(key ='timestamp', freq='MS'), 'range']).size()
-    min_dif_bytes_a = abs(min_dif_bytes+1)
-    max_range = max_range + min_dif_bytes_a
-    graphs_list = [[0 for j in range(max_range)] for i in range(len(index))]
-    before = pd.to_datetime(0)
-    j = -1
-    for i, v in months_range.iteritems(): 
-        i = list(i)
-        current = i[0]
-        p = i[1]
-        p = p.split(']')[0]
-        p = p.split('(')[1]
-        p = p.split(',')
-        num_min = int(float(p[0]))
-        num_max = int(float(p[1]))
-        num_min = (num_min+1) 
-        num_max = (num_max) 
-        resta = current - before
-        resta = int(resta / np.timedelta64(1, 'D'))
-        while (resta > 31 and before != pd.to_datetime(0)):
-            j = j+1
-            resta = resta-31
-        if (before != current):
-            j = j +1
-            before = current
-        for num in range(num_min,num_max):
-            graphs_list[j][num] = v
-    
-    wiki_by_metrics = []
-    for metric_idx in range(max_dif_bytes+1):
-        metric_row = [graphs_list[wiki_idx].pop(0) for wiki_idx in range(len(graphs_list))]
-        wiki_by_metrics.append(metric_row) 
-    return [index, list(range(min_dif_bytes, max_dif_bytes)), wiki_by_metrics, months_range, 'Heatmap']
+    max_dif_bytes = int(mains['bytes_delta'].max())
+    min_dif_bytes = int(mains['bytes_delta'].min()-1)
+    list_range = range(min_dif_bytes, max_dif_bytes+100, 100)
+    return heatmap.build_heatmap(mains['month'], mains['bytes_delta'], index, list_range, min_dif_bytes, max_dif_bytes)
 
 def edition_on_pages(data, index):
     users_registered = filter_anonymous(data)
-    groupTP=users_registered.groupby([pd.Grouper(key ='timestamp', freq='MS'),'page_id']).size().to_frame('ediciones').reset_index()
-    maxEditors=max(groupTP['ediciones'])
-    round_max = (maxEditors+5)
-    list_range = list(range(0, round_max+1, 5))
-    max_range = max(list_range)
-    groupTP['range'] = pd.cut(groupTP['ediciones'], bins = list_range).astype(str)
-    z = groupTP.groupby([pd.Grouper(key ='timestamp', freq='MS'), 'range']).size()
-    graphs_list = [[0 for j in range(max_range+1)] for i in range(len(index))]
-    before = pd.to_datetime(0)
-    j = -1
-    for i, v in z.iteritems(): 
-        i = list(i)
-        current = i[0]
-        p = i[1]
-        p = p.split(']')[0]
-        p = p.split('(')[1]
-        p = p.split(',')
-        num_min = int(float(p[0]))
-        num_max = int(float(p[1]))
-        num_min = (num_min+1) 
-        num_max = (num_max) 
-        resta = current - before
-        resta = int(resta / np.timedelta64(1, 'D'))
-        while (resta > 31 and before != pd.to_datetime(0)):
-            j = j+1
-            resta = resta-31
-        if (before != current):
-            j = j +1
-            before = current
-        for num in range(num_min,num_max+1):
-            graphs_list[j][num] = v
-    wiki_by_metrics = []
-    for metric_idx in range(maxEditors+1):
-            metric_row = [graphs_list[wiki_idx].pop(0) for wiki_idx in range(len(graphs_list))]
-            wiki_by_metrics.append(metric_row) 
-    return [index,list(range(maxEditors)),wiki_by_metrics, z, 'Heatmap']
+    groupTP = users_registered.groupby(['month', 'page_code']).size().reset_index(name='ediciones')
+    maxEditors = int(groupTP['ediciones'].max())
+    list_range = range(0, maxEditors+6, 5)
+    return heatmap.build_heatmap(groupTP['month'], groupTP['ediciones'], index, list_range, 0, maxEditors)
 
 def revision_on_pages(data, index):
     users_registered = filter_anonymous(data)
-    without_first_edition = users_registered.groupby([pd.Grouper(key ='timestamp', freq='MS'),'page_id']).apply(lambda x:x.iloc[1:,1:])
-    z=without_first_edition.groupby([pd.Grouper(key ='timestamp', freq='MS'),'page_id']).size().to_frame('revisiones').reset_index()
-    maxRevision= max(z['revisiones'])
-    round_max = (maxRevision+5)
-    list_range = list(range(0, round_max+1, 5))
-    max_range = max(list_range)
-    z['range'] = pd.cut(z['revisiones'], bins = list_range).astype(str)
-    z = z.groupby([pd.Grouper(key ='timestamp', freq='MS'), 'range']).size()
-    graphs_list = [[0 for j in range(max_range+1)] for i in range(len(index))]
-    before = pd.to_datetime(0)
-    j = -1
-    for i, v in z.iteritems(): 
-        i = list(i)
-        current = i[0]
-        p = i[1]
-        p = p.split(']')[0]
-        p = p.split('(')[1]
-        p = p.split(',')
-        num_min = int(float(p[0]))
-        num_max = int(float(p[1]))
-        num_min = (num_min+1) 
-        num_max = (num_max) 
-        resta = current - before
-        resta = int(resta / np.timedelta64(1, 'D'))
-        while (resta > 31 and before != pd.to_datetime(0)):
-            j = j+1
-            resta = resta-31
-        if (before != current):
-            j = j +1
-            before = current
-        for num in range(num_min,num_max+1):
-            graphs_list[j][num] = v
-    wiki_by_metrics = []
-    for metric_idx in range(maxRevision+1):
-            metric_row = [graphs_list[wiki_idx].pop(0) for wiki_idx in range(len(graphs_list))]
-            wiki_by_metrics.append(metric_row)
-    return [index,list(range(maxRevision)),wiki_by_metrics, z, 'Heatmap']
+    # revisions of a page in a month are all its editions but the first one
+    z = users_registered.groupby(['month', 'page_code']).size().reset_index(name='revisiones')
+    z['revisiones'] = z['revisiones'] - 1
+    z = z[z['revisiones'] > 0]
+    maxRevision = int(z['revisiones'].max())
+    list_range = range(0, maxRevision+6, 5)
+    return heatmap.build_heatmap(z['month'], z['revisiones'], index, list_range, 0, maxRevision)
 
 def  distribution_editors_between_articles_edited_each_month(data, index):
     users_registered = filter_anonymous(data)
     #main namespace
     users_registered = users_registered[users_registered['page_ns']==0]
 
-    users_per_article = users_registered.groupby([pd.Grouper(key ='timestamp', freq='MS'),'page_id'])['contributor_id'].nunique().reset_index(name='editor_count')
+    users_per_article = users_registered.groupby(['month', 'page_code'])['contributor_code'].nunique().reset_index(name='editor_count')
 
-    max_editors = max(users_per_article['editor_count'])
-    
-    z_articles_by_y_editors = users_per_article.groupby([pd.Grouper(key ='timestamp', freq='MS'),'editor_count']).size()
-
-
-    #y parameter
-    y_param = list(range(max_editors))
-
-    #z parameter
-    graphs_list = [[0 for j in range(max_editors+1)] for i in range(len(index))]
-    anterior = pd.to_datetime(0)
-    j = -1
-    print('first for starts')
-    for i, v in z_articles_by_y_editors.iteritems(): 
-        i = list(i)
-        actual = i[0]
-        num = i[1]
-        resta = actual - anterior
-        resta = int(resta / np.timedelta64(1, 'D'))
-        while (resta > 31 and anterior != pd.to_datetime(0)):
-            j = j+1
-            resta = resta-31
-        if (anterior != actual):   
-            j = j +1
-            anterior = actual
-        if(j <= len(index)):
-            graphs_list[j][num] = v
-
-  
-    print('second for starts')
-    z_param = []
-    for i in range(max_editors+1):
-            row = [graphs_list[j].pop(0) for j in range(len(graphs_list))]
-            z_param.append(row)  
-    return [index,y_param,z_param, z_articles_by_y_editors, 'Heatmap']
+    max_editors = int(users_per_article['editor_count'].max())
+
+    # one bin per number of editors
+    return heatmap.build_heatmap(users_per_article['month'], users_per_article['editor_count'], index, range(0, max_editors+1), 0, max_editors)
 
 def changes_in_absolute_size_of_editor_classes(data, index):
     class1 = users_number_of_edits_between_1_and_4(data, index).to_frame('one_four')
@@ -903,33 +557,30 @@ def changes_in_absolute_size_of_editor_classes(data, index):
     concatenate['suma'] = concatenate[['one_four', '5_24', '25_99', 'highEq_100']].sum(axis=1)
     concatenate = concatenate.transpose()
     # With this data, we can start calculating the heatmap axises:
-    months = data.groupby(pd.Grouper(key ='timestamp', freq='MS'))
-    months = months.size()
+    months = derived_columns.get_months_index(data)
     classes = ['between 1 and 4 edits', 'between 5 and 24 edits', 'between 25 and 99 edits', '>= 100 edits' ]
-    graphs_list = [[0 for j in range(len(index))] for i in range(len(classes))]
-    print(concatenate)
-
-    for i in range(len(classes)):
-        
-        for j in range(len(index)):
-            
-            if (j == 0):
-                graphs_list[i][j] = concatenate.iloc[i, j]
-                
-            else:
-                
-                if (concatenate.iloc[i, j] == concatenate.iloc[i, j - 1]):
-                        graphs_list[i][j] = 0
-
-                elif (concatenate.iloc[i, j] < concatenate.iloc[i, j - 1]):
-                    graphs_list[i][j] = -(concatenate.iloc[i, j - 1] - concatenate.iloc[i, j])
-                        
-                elif (concatenate.iloc[i, j] > concatenate.iloc[i, j - 1]):
-                        graphs_list[i][j] = concatenate.iloc[i, j] - concatenate.iloc[i, j - 1]
-    return[months.index, classes, graphs_list, concatenate, 'Heatmap']
+    # size of every class in the first month, and its change in the next ones
+    sizes = concatenate.iloc[:len(classes), :len(index)].values
+    sizes = np.hstack([np.zeros((len(classes), 1), dtype=sizes.dtype), sizes])
+    graphs_list = np.diff(sizes, axis=1).tolist()
+    return[months, classes, graphs_list, concatenate, 'Heatmap']
 
 ########################### FILLED-AREA CHART METRICS ###########################################
 
+# helper for the filled-area chart metrics: given the edits of some contributors, sorted from the most to the least active, it calculates which % of them have contributed to the creation of the first 50%, 80%, 90%, 99% and the rest of those edits.
+def contributors_per_contributions_pctg(edits):
+    edits_pctg_accum = np.cumsum((edits / edits.sum()) * 100)
+    num_contributors = len(edits)
+    categories = [(0, 50), (50, 80), (80, 90), (90, 99), (99, np.inf)]
+    return [(np.count_nonzero((edits_pctg_accum > lower) & (edits_pctg_accum <= upper)) / num_contributors) * 100
+            for (lower, upper) in categories]
+
+def contributions_pctg_areachart(months, categories_per_month):
+    categories_per_month = np.array(categories_per_month, dtype=float).reshape(-1, 5)
+    names = ["50% of edits", "80% of edits", "90% of edits", "99% of edits", "100% of edits"]
+    months = pd.DatetimeIndex(months, name='timestamp')
+    return [pd.Series(index=months, data=categories_per_month[:, i], name=name) for (i, name) in enumerate(names)] + ['Areachart']
+
 def contributor_pctg_per_contributions_pctg(data, index):
     """
     Function which calculates which % of contributors has contributed
@@ -938,111 +589,23 @@ def contributor_pctg_per_contributions_pctg(data, index):
     returns an array of pandas Series, one per category to visualize.
 
     """
-    data = filter_anonymous(data)
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
-
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits_cumulative').reindex(new_index, fill_value=0).cumsum()).reset_index()
-
-# 2) Add a new column which contains the total number of edits on each month (this value is cumulative aswell)
-    users_month_edits = users_month_edits.groupby([pd.Grouper(key='timestamp', freq='MS'),'contributor_id']).sum().reset_index()
-    users_month_edits['nEdits_month'] = users_month_edits.groupby(pd.Grouper(key='timestamp', freq='MS'))['nEdits_cumulative'].transform('sum')
-
-# 3) Now, we want to calculate the percentage of edits that each user has done on each month: add a new column, 'edits_pctg'
-    users_month_edits['edits%'] = (users_month_edits['nEdits_cumulative']/users_month_edits['nEdits_month'])*100
-
-# 4) Order the dataframe in ascending order according to the column 'edit_pctg' and according to the timestamp, as we want to keep the order inside each group:
-    users_month_edits = users_month_edits.sort_values(['timestamp', 'edits%'], ascending=[True, False])
-
-# 5) calculate the cumulative percentage per month, in a new column: 'edit_cumulative_pctg'
-    users_month_edits['edits%_accum'] = users_month_edits.groupby(pd.Grouper(key='timestamp', freq='MS'))['edits%'].cumsum()
-
-# 6) traverse the dataframe: we want to calculate the %X of contributors that does a %Y of contributions (being Y = 50%, 80%, 90% and 99%) PER MONTH.
-# 6.1) Note: final is the final dataframe, of shape: timestamp, category50, category80, category90, category99. These columns contain the %X of contributors that have contributed each month to create 50, 80, 90 and 99% of editions
-
-    users_month_edits = users_month_edits.set_index('timestamp')
-    lst_dict = []
-    cols = ['timestamp', 'category50%', 'category80%', 'category90%', 'category99%', 'category_upper']
-
-    for idx in users_month_edits.index.unique():
-        group = users_month_edits.loc[idx]
-        #on each month, for the total contributors we don't count the contributors whose collaboration is 0%.
-        group = group[group['edits%'] > 0]
-        num_contributors = group.shape[0]
-        category50 = group[(group['edits%_accum'] <= 50) & (group['edits%_accum'] > 0)].shape[0]
-        category80 = group[(group['edits%_accum'] <= 80) & (group['edits%_accum'] > 50)].shape[0]
-        category90 = group[(group['edits%_accum'] <= 90) & (group['edits%_accum'] > 80)].shape[0]
-        category99 = group[(group['edits%_accum'] <= 99) & (group['edits%_accum'] > 90)].shape[0]
-        cat_upper = group[group['edits%_accum'] > 99].shape[0]
-        daux = {'timestamp':idx, 'category50%':(category50/num_contributors)*100, 'category80%':(category80/num_contributors) * 100, 'category90%':(category90/num_contributors) * 100,'category99%':(category99/num_contributors) * 100, 'category_upper':(cat_upper/num_contributors) * 100}
-        lst_dict.append(daux)
-        
-    final_df = pd.DataFrame(columns = cols, data = lst_dict)
-    category_50 = pd.Series(index=final_df['timestamp'], data=final_df['category50%'].values)
-    category_80 = pd.Series(index=final_df['timestamp'], data=final_df['category80%'].values)
-    category_90 = pd.Series(index=final_df['timestamp'], data=final_df['category90%'].values)
-    category_99 = pd.Series(index=final_df['timestamp'], data=final_df['category99%'].values)
-    category_upper = pd.Series(index=final_df['timestamp'], data=final_df['category_upper'].values)
-    category_50.name = "50% of edits"
-    category_80.name = "80% of edits"
-    category_90.name = "90% of edits"
-    category_99.name = "99% of edits"
-    category_upper.name = "100% of edits"
-
-    return[category_50, category_80, category_90, category_99, category_upper, 'Areachart']
+    matrix = contributor_month_matrix(data, False)
+    categories_per_month = []
+    for distribution in matrix.iter_accumulated_distributions():
+        # edits of every contributor until the month, from the most to the least active
+        edits = np.repeat(distribution.values[::-1], distribution.frequencies[::-1])
+        categories_per_month.append(contributors_per_contributions_pctg(edits))
 
-def contributor_pctg_per_contributions_pctg_per_month(data, index):
-    data = filter_anonymous(data)
-    new_index = data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('months').index
+    return contributions_pctg_areachart(matrix.index, categories_per_month)
 
-    users_month_edits =data.groupby(['contributor_id']).apply(lambda x: x.groupby(pd.Grouper(key='timestamp', freq='MS')).size().to_frame('nEdits_cumulative').reindex(new_index, fill_value=0).cumsum()).reset_index()
-    
-    # 2.1) Get the non accum value of edits
-    cond = (users_month_edits['contributor_id'] == users_month_edits['contributor_id'].shift())
-    users_month_edits['nEdits_non_accum'] = np.where(cond, users_month_edits['nEdits_cumulative'] - users_month_edits['nEdits_cumulative'].shift(), users_month_edits['nEdits_cumulative'])
-
-    # 2) Add a new column which contains the total number of edits on each month (this value is NOT accumulated)
-    users_month_edits = users_month_edits.groupby([pd.Grouper(key='timestamp', freq='MS'),'contributor_id']).sum().reset_index()
-    users_month_edits['nEdits_month'] = users_month_edits.groupby(pd.Grouper(key='timestamp', freq='MS'))['nEdits_non_accum'].transform('sum')
-    
-    # 3) Now, we want to calculate the percentage of edits that each user has done on each month: add a new column, 'edits_pctg'
-    users_month_edits['edits%'] = (users_month_edits['nEdits_non_accum']/users_month_edits['nEdits_month'])*100
-
-    # 4) Order the dataframe in ascending order according to the column 'edit_pctg' and according to the timestamp, as we want to keep the order inside each group:
-    users_month_edits = users_month_edits.sort_values(['timestamp', 'edits%'], ascending=[True, False])
-
-    # 5) calculate the cumulative percentage per month, in a new column: 'edit_cumulative_pctg'
-    users_month_edits['edits%_accum'] = users_month_edits.groupby(pd.Grouper(key='timestamp', freq='MS'))['edits%'].cumsum()
-
-    # 6) traverse the dataframe: we want to calculate the %X of contributors that does a %Y of contributions (being Y = 50%, 80%, 90% and 99%) PER MONTH.
-    # 6.1) Note: final is the final dataframe, of shape: timestamp, category50, category80, category90, category99. These columns contain the %X of contributors that have contributed each month to create 50, 80, 90 and 99% of editions
-    users_month_edits = users_month_edits.set_index('timestamp')
-    lst_dict = []
-    cols = ['timestamp', 'category50%', 'category80%', 'category90%', 'category99%', 'category_upper']
-    for idx in users_month_edits.index.unique():
-        group = users_month_edits.loc[idx]
-        #on each month, for the total contributors we don't count the contributors whose collaboration is 0%.    
-        group = group[group['edits%'] > 0]
-        num_contributors = group.shape[0]
-        if (num_contributors > 0):
-            category50 = group[(group['edits%_accum'] <= 50) & (group['edits%_accum'] > 0)].shape[0]
-            category80 = group[(group['edits%_accum'] <= 80) & (group['edits%_accum'] > 50)].shape[0]
-            category90 = group[(group['edits%_accum'] <= 90) & (group['edits%_accum'] > 80)].shape[0]
-            category99 = group[(group['edits%_accum'] <= 99) & (group['edits%_accum'] > 90)].shape[0]
-            cat_upper = group[group['edits%_accum'] > 99].shape[0]
-            daux = {'timestamp':idx, 'category50%':(category50/num_contributors)*100, 'category80%':(category80/num_contributors) * 100, 'category90%':(category90/num_contributors) * 100,'category99%':(category99/num_contributors) * 100, 'category_upper':(cat_upper/num_contributors) * 100}
-            lst_dict.append(daux)
-        
-    final = pd.DataFrame(columns = cols, data = lst_dict)
-
-    category_50 = pd.Series(index=final['timestamp'], data=final['category50%'].values)
-    category_80 = pd.Series(index=final['timestamp'], data=final['category80%'].values)
-    category_90 = pd.Series(index=final['timestamp'], data=final['category90%'].values)
-    category_99 = pd.Series(index=final['timestamp'], data=final['category99%'].values)
-    category_upper = pd.Series(index=final['timestamp'], data=final['category_upper'].values)
-    category_50.name = "50% of edits"
-    category_80.name = "80% of edits"
-    category_90.name = "90% of edits"
-    category_99.name = "99% of edits"
-    category_upper.name = "100% of edits"
-
-    return[category_50, category_80, category_90, category_99, category_upper, 'Areachart']
\ No newline at end of file
+def contributor_pctg_per_contributions_pctg_per_month(data, index):
+    matrix = contributor_month_matrix(data, False)
+    months = []
+    categories_per_month = []
+    for (month, edits) in zip(matrix.index, matrix.iter_monthly_edits()):
+        #on each month, we only count the contributors who have edited in that month.
+        if len(edits) > 0:
+            months.append(month)
+            categories_per_month.append(contributors_per_contributions_pctg(np.sort(edits)[::-1]))
+
+    return contributions_pctg_areachart(months, categories_per_month)
@@ -40,6 +40,7 @@ from .utils import get_mode_config
 from .networks import interface
 from . import cache
 from . import data_controller
+import wikichron.utils.warm_up as warm_up
 from .main import bind_callbacks as bind_main_callbacks
 from .main_view import generate_main_content
 
@@ -65,8 +66,6 @@ selection_params = {'wikis', 'network', 'lower_bound', 'upper_bound'};
 
 # The folowing ones will be set later on
 global available_networks;
-global available_wikis;
-global available_wikis_dict;
 global side_bar
 
 
@@ -122,7 +121,7 @@ def get_network_name_from_code(network_code):
 
 
 def extract_wikis_from_selection_dict(selection):
-    wikis = [ available_wikis_dict[wiki_url] for wiki_url in selection['wikis'] ]
+    wikis = [ data_controller.get_wiki_by_domain(wiki_url) for wiki_url in selection['wikis'] ]
     return (wikis)
 
 
@@ -206,6 +205,7 @@ def app_bind_callbacks(app):
             if selection.get('wikis') and selection.get('network'):
 
                 (wikis) = extract_wikis_from_selection_dict(selection)
+                warm_up.record_requests(wikis)
 
                 network = {}
                 network['code'] = selection['network']
@@ -274,7 +274,7 @@ def app_bind_callbacks(app):
                     # since user can select only one network at a time
                     pre_selected_network = selection['network'][0] if 'network' in selection else None
 
-                    return side_bar.generate_side_bar(available_wikis, available_networks,
+                    return side_bar.generate_side_bar(data_controller.get_available_wikis(), available_networks,
                                                         pre_selected_wikis, pre_selected_network)
 
                 else: # if app hasn't loaded the path yet, wait to load sidebar later
@@ -372,12 +372,8 @@ def create_dash_app(server):
 
 def _init_global_vars():
     global available_networks;
-    global available_wikis;
-    global available_wikis_dict;
 
     available_networks = interface.get_available_networks()
-    available_wikis = data_controller.get_available_wikis()
-    available_wikis_dict = {wiki['domain']: wiki for wiki in available_wikis}
 
 
 def _init_app_callbacks(app):
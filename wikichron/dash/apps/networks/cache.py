@@ -1,5 +1,7 @@
 from flask_caching import Cache
 
+import wikichron.utils.cache_invalidation as cache_invalidation
+
 global cache;
 cache = None;
 
@@ -8,11 +10,15 @@ def set_up_cache(app, debug):
 
     if not debug:
         cache = Cache(app.server, config={
-            # try 'filesystem' if you don't want to setup redis
-            'CACHE_TYPE': 'redis',
+            # try 'filesystem' if you don't want to setup redis.
+            # layered_redis is 'redis' with a per-process LRU in front of it
+            'CACHE_TYPE': 'wikichron.utils.layered_cache.layered_redis',
             'CACHE_REDIS_URL': app.server.config['REDIS_URL']
         })
     else:
         cache = Cache(app.server, config={'CACHE_TYPE': 'simple'})
 
+    # to drop the entries of a wiki when its data is replaced
+    cache_invalidation.register_cache(cache)
+
     return cache
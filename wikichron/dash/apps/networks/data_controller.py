@@ -14,13 +14,16 @@ WikiChron code.
 # Built-in imports
 import pandas as pd
 import os
-import numpy as np
 import time
 from datetime import datetime
-from warnings import warn
-import json
 
 # Local imports:
+import wikichron.utils.data_registry as data_registry
+import wikichron.utils.wiki_catalog as wiki_catalog
+import wikichron.utils.data_version as data_version
+import wikichron.utils.derived_columns as derived_columns
+import wikichron.utils.job_queue as job_queue
+import wikichron.utils.warm_up as warm_up
 from .networks import interface
 
 # get csv data location (data/ by default)
@@ -35,18 +38,13 @@ def set_cache(cache):
 
     # we need to declare as *global* all the cached functions we want to be
     #  available to be used from outside of this file.
-    global read_data
     global get_network
+    global submit_network_job
+    global get_job_status
+    global warm_up_wiki
 
-    @cache.memoize()
-    def read_data(wiki):
-        df = get_dataframe_from_csv(wiki['data'])
-        prepare_data(df)
-        df = clean_up_bot_activity(df, wiki)
-        return df
-
-
-    @cache.memoize(timeout=3600)
+    # memoized by the data version of the wiki, not by all its metadata
+    @data_version.memoize_by_data_version(cache, timeout=3600)
     def get_network(wiki, network_code, lower_bound = '', upper_bound = ''):
         """
         Parameters
@@ -71,12 +69,62 @@ def set_cache(cache):
         return network
 
 
+    def submit_network_job(wiki, network_code, lower_bound = '', upper_bound = ''):
+        """
+            Build the network in a background job (see job_queue), which
+            leaves it in the cache for get_network(), and return the id of
+            the job.
+        """
+        def build(job):
+            job.report(0, 'Building the network of {}'.format(wiki['name']))
+            get_network(wiki, network_code, lower_bound, upper_bound)
+
+        return job_queue.submit(cache, 'network',
+                    get_network_job_params(wiki, network_code, lower_bound, upper_bound),
+                    build, tags=[data_version.get_wiki_tag(wiki)])
+
+
+    def get_job_status(job_id):
+        return job_queue.get_status(cache, job_id)
+
+
+    def warm_up_wiki(wiki):
+        """ Build every network of the wiki for the default range of the slider """
+        (begining_index, end_index) = calculate_indices_all_months(wiki)
+        # bounds as the page gets them from the dates-index divs
+        upper = min(int(2 + len(begining_index) / 10), len(end_index) - 1)
+        lower_bound = str(begining_index[0].date())
+        upper_bound = str(end_index[upper].date())
+        for network_type in interface.get_available_networks():
+            get_network(wiki, network_type.CODE, lower_bound, upper_bound)
+
+    warm_up.register_task('networks', warm_up_wiki, cache)
+
+
 ### OTHER DATA-RELATED FUNCTIONS ###
 
+def get_network_job_params(wiki, network_code, lower_bound = '', upper_bound = ''):
+    return {'wiki': data_version.get_data_version(wiki), 'network': network_code,
+            'lower_bound': lower_bound, 'upper_bound': upper_bound}
+
+
+def get_network_job_id(wiki, network_code, lower_bound = '', upper_bound = ''):
+    return job_queue.get_job_id('network',
+                get_network_job_params(wiki, network_code, lower_bound, upper_bound),
+                tags=[data_version.get_wiki_tag(wiki)])
+
+
+def read_data(wiki):
+    """ Return the data of wiki, shared with the other WikiChron apps """
+    return data_registry.read_data(wiki)
+
+
 def get_available_wikis():
-    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
-    wikis = json.load(wikis_json_file)
-    return wikis
+    return wiki_catalog.get_available_wikis()
+
+
+def get_wiki_by_domain(domain):
+    return wiki_catalog.get_wiki_by_domain(domain)
 
 
 def get_first_entry(wiki):
@@ -87,65 +135,9 @@ def get_last_entry(wiki):
     return wiki['last_edit']['date']
 
 
-def remove_bots_activity(df, bots_ids):
-    """
-       Filter out bots activity from pandas dataframe.
-
-       df -- data to be filtered. It'll be modified in place
-       bots_ids -- numpy array with the userid for every bot
-       Return a dataframe derived from the original but with all the
-          editions made by bot users removed
-    """
-    bots = np.array(bots_ids)
-    return df[~df['contributor_id'].isin(bots)]
-
-
-def prepare_data(df):
-    """
-       Prepare data in the correct input format for the metric
-       calculation functions.
-
-       df -- data to be prepared.
-       Modifies inplace the input data as well as returns that data
-       in the appropiate format for further calling of metric functions.
-    """
-    return df.sort_values(by='timestamp', inplace=True)
-
-
-def get_dataframe_from_csv(csv):
-    """ Read and parse a csv and return the corresponding pandas dataframe"""
-
-    print('Loading csv for ' + csv)
-    time_start_loading_one_csv = time.perf_counter()
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    print('!!Loaded csv for ' + csv)
-    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
-    print(' * [Timing] Loading {} : {} seconds'
-                    .format(csv, time_end_loading_one_csv))
-    df.index.name = csv
-    return df
-
-
-def clean_up_bot_activity(df, wiki):
-    if 'bots' in wiki:
-        botsids = [bot['id'] for bot in wiki['bots']]
-        return remove_bots_activity(df, botsids)
-    else:
-        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
-    return df
-
-
-def get_bot_names(wiki: dict) -> set:
-    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
-    wikis = json.load(wikis_json_file)
-    di_wiki = {}
-    for i in range(len(wikis)):
-        if wikis[i]['name'] == wiki:
-            di_wiki = wikis[i]
-            break
+def get_bot_names(wiki: str) -> set:
+    """ Return the names of the bots of the wiki with name `wiki` """
+    di_wiki = wiki_catalog.get_wiki_by_name(wiki)
 
     if not di_wiki or 'bots' not in di_wiki:
         return {}
@@ -155,10 +147,8 @@ def get_bot_names(wiki: dict) -> set:
 
 def calculate_indices_all_months(wiki):
     data = read_data(wiki)
-    monthly_data_align_begining = data.groupby(pd.Grouper(key='timestamp', freq='MS'))
-    monthly_data_align_end = data.groupby(pd.Grouper(key='timestamp', freq='M'))
-    begining_index = monthly_data_align_begining.size().index
-    end_index = monthly_data_align_end.size().index
+    begining_index = derived_columns.get_months_index(data)
+    end_index = begining_index + pd.offsets.MonthEnd(0)
     return (begining_index, end_index)
 
 
@@ -11,7 +11,6 @@
 
 # Built-in imports
 import os
-import time
 import json
 from datetime import datetime
 import pandas as pd
@@ -28,6 +27,7 @@ from urllib.parse import parse_qs, urlencode
 # Local imports:
 from .utils import get_mode_config
 from . import data_controller
+import wikichron.utils.job_queue as job_queue
 from .networks.models import networks_generator as net_factory
 from .networks.CytoscapeStylesheet import CytoscapeStylesheet
 from .networks.models.BaseNetwork import BaseNetwork
@@ -56,26 +56,60 @@ def update_query_by_time(query_string, up_val, low_val):
     return urlencode(selection,  doseq=True)
 
 
+def get_network_selection(slider, selection_json, time_index_beg, time_index_end):
+    """ Return (wiki, network code, lower bound, upper bound) of the selection """
+    selection = json.loads(selection_json)
+    time_index_beg = json.loads(time_index_beg)
+    time_index_end = json.loads(time_index_end)
+    return (selection['wikis'][0], selection['network'],
+            time_index_beg[slider[0]], time_index_end[slider[1]])
+
+
+def network_progress(status):
+    """ Progress of the job building the network of the selection """
+    if not status or status['state'] == job_queue.DONE:
+        return None
+
+    if status['state'] == job_queue.FAILED:
+        return html.P('Sorry, something went wrong building the network: {}'.format(status['error']),
+                        className='text-danger')
+
+    return html.Div(className='mt-2 mb-2', children=[
+        html.P(status['message'] or 'Waiting for the network to be built...'),
+        html.Div(className='progress',
+            children=html.Div(className='progress-bar progress-bar-striped progress-bar-animated',
+                                role='progressbar', style={'width': '100%'}))
+    ])
+
+
 def bind_callbacks(app):
 
     @app.callback(
-        Output('network-ready', 'value'),
-        [Input('dates-slider', 'value')],
+        [Output('network-ready', 'value'),
+        Output('network-job', 'children')],
+        [Input('dates-slider', 'value'),
+        Input('network-poll', 'n_intervals')],
         [State('initial-selection', 'children'),
         State('dates-index', 'children'),
-        State('dates-index-end', 'children')]
+        State('dates-index-end', 'children'),
+        State('network-job', 'children')]
     )
-    def update_network(slider, selection_json, time_index_beg, time_index_end):
+    def update_network(slider, _, selection_json, time_index_beg, time_index_end,
+                        shown_job_id):
         if not slider:
             raise PreventUpdate()
 
-        time_index_beg = json.loads(time_index_beg)
-        time_index_end = json.loads(time_index_end)
+        (wiki, network_code, lower_bound, upper_bound) = get_network_selection(
+                        slider, selection_json, time_index_beg, time_index_end)
 
-        # get network instance from selection
-        selection = json.loads(selection_json)
-        wiki = selection['wikis'][0]
-        network_code = selection['network']
+        # the network is built in a background job, polled until it is done
+        job_id = data_controller.submit_network_job(wiki, network_code,
+                                            lower_bound, upper_bound)
+        if job_id == shown_job_id: # this network is shown already
+            raise PreventUpdate()
+        status = data_controller.get_job_status(job_id)
+        if not status or status['state'] != job_queue.DONE:
+            raise PreventUpdate()
 
         if debug:
             print(f'Updating network with values:\
@@ -83,19 +117,55 @@ def bind_callbacks(app):
             \n\t- network: {network_code}\
             \n\t- slider: ({slider[0]},{slider[1]})')
 
-        print(' * [Info] Building the network....')
-        time_start_calculations = time.perf_counter()
-
-        lower_bound = time_index_beg[slider[0]]
-        upper_bound = time_index_end[slider[1]]
-
         network = data_controller.get_network(wiki, network_code,
                                             lower_bound, upper_bound)
+        print(' * [Info] Network ready')
+
+        return (network.to_cytoscape_dict(), job_id)
+
+
+    @app.callback(
+        Output('network-poll', 'disabled'),
+        [Input('dates-slider', 'value'),
+        Input('network-job', 'children'),
+        Input('network-poll', 'n_intervals')],
+        [State('initial-selection', 'children'),
+        State('dates-index', 'children'),
+        State('dates-index-end', 'children')]
+    )
+    def stop_network_poll(slider, shown_job_id, _, selection_json, time_index_beg,
+                            time_index_end):
+        if not slider:
+            raise PreventUpdate()
 
-        time_end_calculations = time.perf_counter() - time_start_calculations
-        print(f' * [Timing] Network ready in {time_end_calculations} seconds')
+        job_id = data_controller.get_network_job_id(*get_network_selection(
+                        slider, selection_json, time_index_beg, time_index_end))
+        if job_id == shown_job_id:
+            return True
+        # stop polling a failed job until the selection changes
+        status = data_controller.get_job_status(job_id)
+        return bool(status) and status['state'] == job_queue.FAILED
+
+
+    @app.callback(
+        Output('network-progress', 'children'),
+        [Input('network-poll', 'n_intervals'),
+        Input('network-job', 'children')],
+        [State('dates-slider', 'value'),
+        State('initial-selection', 'children'),
+        State('dates-index', 'children'),
+        State('dates-index-end', 'children')]
+    )
+    def update_network_progress(_, shown_job_id, slider, selection_json,
+                                time_index_beg, time_index_end):
+        if not slider:
+            raise PreventUpdate()
 
-        return network.to_cytoscape_dict()
+        job_id = data_controller.submit_network_job(*get_network_selection(
+                        slider, selection_json, time_index_beg, time_index_end))
+        if job_id == shown_job_id:
+            return None
+        return network_progress(data_controller.get_job_status(job_id))
 
 
     @app.callback(
@@ -359,13 +429,15 @@ def bind_callbacks(app):
     @app.callback(
         Output('distribution-graph', 'figure'),
         [Input('scale', 'value'),
-        Input('dates-slider', 'value')],
-        [State('initial-selection', 'children'),
+        Input('network-ready', 'value')],
+        [State('dates-slider', 'value'),
+        State('initial-selection', 'children'),
         State('dates-index', 'children'),
         State('dates-index-end', 'children')]
     )
-    def update_graph(scale_type, slider, selection_json, time_index_beg, time_index_end):
-        if not slider:
+    def update_graph(scale_type, ready, slider, selection_json, time_index_beg, time_index_end):
+        # wait for the network to be built
+        if not ready or not slider:
             raise PreventUpdate()
 
         selection = json.loads(selection_json)
@@ -27,6 +27,7 @@ from .networks.CytoscapeStylesheet import CytoscapeStylesheet
 from .networks.models import networks_generator as net_factory
 from .networks.models.BaseNetwork import BaseNetwork
 from . import data_controller
+import wikichron.utils.job_queue as job_queue
 
 RANKING_EMPTY_HEADER = [{'name': 'Editor', 'id': 'name'},
                         {'name': 'Metric', 'id': 'metric'}]
@@ -501,6 +502,7 @@ def generate_main_content(wikis_arg, network_type_arg, query_string):
                 html.Div(id='initial-selection', style={'display': 'none'},
                             children=args_selection),
                 build_network_controls(network_type_code),
+                html.Div(id='network-progress'),
                 html.Div([
                     html.Div([
                         build_legend(network_type_code),
@@ -511,6 +513,8 @@ def generate_main_content(wikis_arg, network_type_arg, query_string):
 
                 # Signal data
                 html.Div(id='network-ready', style={'display': 'none'}),
+                html.Div(id='network-job', style={'display': 'none'}),
+                dcc.Interval(id='network-poll', interval=job_queue.POLL_INTERVAL),
                 html.Div(id='old-state-node', style={'display': 'none'}),
                 html.Div(id='highlight-node', style={'display': 'none'}),
                 html.Div(id='dates-index', className='time-index', children=time_index_beginning, style={'display': 'none'}),
@@ -486,7 +486,7 @@ class BaseNetwork(metaclass=abc.ABCMeta):
     def filter_anonymous(self, df: pd.DataFrame) -> pd.DataFrame:
         dff = df
         if not dff.empty:
-            dff = dff['Anonymous' != dff['contributor_name']]
+            dff = dff[~dff['is_anonymous']]
 
         return dff
 
@@ -22,6 +22,12 @@ import shutil
 # local imports
 import wikichron.utils.data_manager as data_manager
 import wikichron.utils.utils as utils
+import wikichron.utils.wiki_logos as wiki_logos
+import wikichron.utils.wiki_catalog as wiki_catalog
+import wikichron.utils.data_registry as data_registry
+import wikichron.utils.layered_cache as layered_cache
+import wikichron.utils.warm_up as warm_up
+import wikichron.utils.cache_invalidation as cache_invalidation
 
 # Imports from dash apps
 # classic
@@ -37,6 +43,27 @@ ALLOWED_EXTENSIONS = set(['csv'])
 server_bp = Blueprint('main', __name__)
 
 
+# max number of wikis per page of the catalog api
+MAX_WIKIS_PAGE_SIZE = 200
+
+
+def get_first_wikis_page(pre_selected_wikis):
+    """
+        Return the first page of the catalog for the selection screens, plus
+        the pre-selected wikis not in it, so they start checked, the cursor
+        of the next page and the total number of wikis.
+    """
+    (wikis, next_cursor, total) = wiki_catalog.search_wikis()
+    page_domains = {wiki['domain'] for wiki in wikis}
+    for domain in pre_selected_wikis:
+        if domain not in page_domains:
+            try:
+                wikis.append(wiki_catalog.get_wiki_by_domain(domain))
+            except KeyError:
+                pass
+    return (wikis, next_cursor, total)
+
+
 @server_bp.route('/')
 @server_bp.route('/welcome')
 def index():
@@ -61,8 +88,6 @@ def compare_app():
 
     config = current_app.config;
 
-    wikis = data_manager.get_available_wikis()
-
     metrics_by_category_backend = classic_interface.get_available_metrics_by_category()
     # transform metric objects to a dict with the info we need for metrics:
     categories_frontend = {}
@@ -74,11 +99,15 @@ def compare_app():
     selected_wikis   = set(request.args.getlist('wikis'))
     selected_metrics = set(request.args.getlist('metrics'))
 
+    (wikis, wikis_next_cursor, wikis_total) = get_first_wikis_page(selected_wikis)
+
     return flask.render_template("classic/selection/selection.html",
                                 title = 'WikiChron Compare - selection',
                                 mode = 'classic',
                                 development = config["DEBUG"],
                                 wikis = wikis,
+                                wikis_next_cursor = wikis_next_cursor,
+                                wikis_total = wikis_total,
                                 categories = categories_frontend,
                                 pre_selected_wikis = selected_wikis,
                                 pre_selected_metrics = selected_metrics,
@@ -91,8 +120,6 @@ def networks_app():
 
     config = current_app.config;
 
-    wikis = data_manager.get_available_wikis()
-
     network_backend_objects = networks_interface.get_available_networks()
     networks_frontend = []
     for nw in network_backend_objects:
@@ -102,11 +129,16 @@ def networks_app():
     selected_wikis    = request.args.get('wikis', default=set(), type=str)
     selected_networks = request.args.get('network', default=set(), type=str)
 
+    (wikis, wikis_next_cursor, wikis_total) = get_first_wikis_page(
+                                        [selected_wikis] if selected_wikis else [])
+
     return flask.render_template("networks/selection/selection.html",
                                 title = 'WikiChron Networks - selection',
                                 mode = 'networks',
                                 development = config["DEBUG"],
                                 wikis = wikis,
+                                wikis_next_cursor = wikis_next_cursor,
+                                wikis_total = wikis_total,
                                 networks = networks_frontend,
                                 pre_selected_wikis = selected_wikis,
                                 pre_selected_networks = selected_networks
@@ -125,8 +157,6 @@ def monowiki_app():
 
     config = current_app.config;
 
-    wikis = data_manager.get_available_wikis()
-
     metrics_by_category_backend = monowiki_interface.get_available_metrics_by_category()
     # transform metric objects to a dict with the info we need for metrics:
     categories_frontend = {}
@@ -138,11 +168,15 @@ def monowiki_app():
     selected_wikis   = set(request.args.getlist('wikis'))
     selected_metrics = set(request.args.getlist('metrics'))
 
+    (wikis, wikis_next_cursor, wikis_total) = get_first_wikis_page(selected_wikis)
+
     return flask.render_template("monowiki/selection/selection.html",
                                 title = 'WikiChron Monowiki - selection',
                                 mode = 'monowiki',
                                 development = config["DEBUG"],
                                 wikis = wikis,
+                                wikis_next_cursor = wikis_next_cursor,
+                                wikis_total = wikis_total,
                                 categories = categories_frontend,
                                 pre_selected_wikis = selected_wikis,
                                 pre_selected_metrics = selected_metrics,
@@ -269,11 +303,21 @@ def upload_post():
         new_wiki.update(wiki_stats)
 
         # update wikis.json
-        wikis.append(new_wiki)
+        if overwriting_existing:
+            wikis[domains.index(wiki_domain)] = new_wiki
+        else:
+            wikis.append(new_wiki)
 
         if not data_manager.update_wikis_metadata(wikis):
             return upload_error('Error updating wikis metadata. Please, try again.')
 
+        # drop everything cached from the data replaced, in every app and worker
+        if overwriting_existing:
+            cache_invalidation.invalidate_wiki(existing_wiki)
+
+        # compute its data in background, so it's ready for its first users
+        warm_up.warm_wiki(new_wiki)
+
 
     else:
         msg = 'HTTP method not expected'
@@ -292,14 +336,16 @@ def upload_post():
 @server_bp.route('/data')
 @server_bp.route('/list_data')
 def list_data():
-    wikis = data_manager.get_available_wikis()
+    (wikis, wikis_next_cursor, wikis_total) = get_first_wikis_page([])
 
     config = current_app.config
 
     return flask.render_template("data.html",
                             title = 'WikiChron - available wikis',
                             development = config["DEBUG"],
-                            wikis = wikis
+                            wikis = wikis,
+                            wikis_next_cursor = wikis_next_cursor,
+                            wikis_total = wikis_total
                             )
 
 
@@ -314,6 +360,70 @@ def serve_wikis_time_lifes():
     return jsonify(time_spans)
 
 
+@server_bp.route('/api/wikis')
+def serve_wikis_catalog():
+    """
+        Paginated search of the available wikis.
+
+        Query parameters: q (text to look for in the name and url), sort (one
+        of wiki_catalog.SORT_KEYS), order (asc or desc), cursor (next_cursor
+        of the previous page), limit, and <stat>_min and <stat>_max to filter
+        by users, articles, pages or edits.
+    """
+    def transform_wiki_in_wiki_frontend(wiki):
+        wiki_frontend = {key: wiki.get(key) for key in
+                            ('domain', 'name', 'url', 'users', 'articles', 'pages',
+                            'edits', 'lastUpdated', 'verified', 'color')}
+        if 'logo' in wiki:
+            wiki_frontend['logo'] = url_for('main.serve_wiki_logo', logo_file=wiki['logo'])
+        return wiki_frontend
+
+    limit = request.args.get('limit', default=wiki_catalog.DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_WIKIS_PAGE_SIZE))
+    filters = {}
+    for stat in wiki_catalog.NUMERIC_SORT_KEYS:
+        bounds = (request.args.get(f'{stat}_min', type=int),
+                    request.args.get(f'{stat}_max', type=int))
+        if bounds != (None, None):
+            filters[stat] = bounds
+
+    try:
+        (wikis, next_cursor, total) = wiki_catalog.search_wikis(
+                                search = request.args.get('q', ''),
+                                sort_by = request.args.get('sort', 'lastUpdated'),
+                                descending = request.args.get('order', 'desc') != 'asc',
+                                cursor = request.args.get('cursor') or None,
+                                limit = limit,
+                                filters = filters)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({'wikis': [transform_wiki_in_wiki_frontend(wiki) for wiki in wikis],
+                    'next_cursor': next_cursor,
+                    'total': total})
+
+
+@server_bp.route('/logos/<logo_file>')
+def serve_wiki_logo(logo_file):
+    # logos are named after their content, so they can be cached forever
+    response = flask.send_from_directory(wiki_logos.logos_dir, logo_file,
+                                cache_timeout=wiki_logos.LOGO_CACHE_TIMEOUT)
+    response.headers['Cache-Control'] += ', immutable'
+    return response
+
+
+@server_bp.route('/stats.json')
+def serve_cache_stats():
+    """
+        Sizes and hit rates of the caches of this process. They reveal what
+        is loaded and cached, so they are only served in debug mode.
+    """
+    if not current_app.config['DEBUG']:
+        flask.abort(404)
+    return jsonify({'cache': layered_cache.get_cache_stats(),
+                    'data_registry': data_registry.get_registry_stats()})
+
+
 @server_bp.route('/app/')
 def redirect_app_to_classic():
     print('Redirecting user from old endpoint "/app" to /compare/app...')
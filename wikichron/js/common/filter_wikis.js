@@ -1,25 +1,161 @@
-var wikisList;
+/* Wikis are searched, sorted, filtered and paginated in the server, through
+ * the /api/wikis catalog endpoint. The first page comes rendered with the
+ * html, and the next ones are loaded as the user scrolls down. */
 
-/* List.js */
-init_list_js = function() {
-    var options = {
-        valueNames: [ 'wiki-name', 'wiki-url',  'wiki-lastUpdated', 'wiki-users',
-                    'wiki-edits', 'wiki-pages']
-    };
+var wikisQuery = {
+    q: '',
+    sort: 'lastUpdated',
+    order: 'desc'
+};
+var wikisFilters = {};
+var nextWikisCursor = null;
+var loadingWikis = false;
+var wikisRequestNo = 0;
 
-    wikisList = new List('wiki-cards-container', options);
+var searchDelay = 250; // ms since last key pressed to search
+var searchTimeout;
 
-    onlySearch = ['wiki-name', 'wiki-url']
 
+/* Wiki cards */
+
+escapeHtml = function(text) {
+    return $('<div>').text(text === undefined || text === null ? '' : text).html();
+}
+
+
+isWikiSelected = function(domain) {
+    return $('.current-selected-wiki').filter(function() {
+        return this.dataset.code === domain;
+    }).length > 0;
+}
+
+
+renderWikiCard = function(wiki) {
+    var domain = escapeHtml(wiki.domain);
+    var name = escapeHtml(wiki.name);
+    var imgSrc = wiki.logo ? escapeHtml(wiki.logo) : '/static/assets/wiki_img_fallback.svg';
+    var domainHtml = wiki.url ?
+        `<a href="${escapeHtml(wiki.url)}" class="card-link" target="_blank"><span class="wiki-domain">${domain}</span></a>`
+        : domain;
+    var verifiedHtml = wiki.verified ? `
+        <div>
+            <span class="card-text card-verified-text">
+                <img height="16px" src="/static/assets/ico_verified.svg" alt="verified icon"></img>
+                &nbsp;
+                <em>Verified</em>
+            </span>
+        </div>` : '';
+    var stat = function(value) { return escapeHtml(value || 'NA'); };
+
+    return `
+<div class="card m-2 mb-5" style="width: 18rem;">
+  <div class="card-body">
+    <h4 class="card-title">
+        <div class="custom-control custom-checkbox">
+            <input class="custom-control-input wiki-input" type="checkbox" id="checkbox-${domain}" value="${domain}" data-name="${name}" name="wikis" ${isWikiSelected(wiki.domain) ? 'checked' : ''}>
+            <label class="custom-control-label wiki-name" for="checkbox-${domain}">${name}</label>
+        </div>
+    </h4>
+    <div class="card-image-container" style="background-color: ${escapeHtml(wiki.color || 'white')};">
+        <div class="card-image-wrapper">
+            <img src="${imgSrc}" alt="Wiki image" />
+        </div>
+    </div>
+    <p class="card-text mt-0">
+        <span class="wiki-item"><span>Users:</span> <span class="font-weight-bold wiki-users">${stat(wiki.users)}</span></span>
+        <span class="wiki-item"><span>Articles:</span> <span class="font-weight-bold wiki-articles">${stat(wiki.articles)}</span></span>
+        <span class="wiki-item"><span>Pages:</span> <span class="font-weight-bold wiki-pages">${stat(wiki.pages)}</span></span>
+        <span class="wiki-item"><span>Edits:</span> <span class="font-weight-bold wiki-edits">${stat(wiki.edits)}</span></span>
+        <span class="wiki-item"><span><em>Data last updated:</em></span> <span class="wiki-lastUpdated"><em>${stat(wiki.lastUpdated)}</em></span></span>
+    </p>
+    <p class="card-text font-weight-bold mb-0" >${domainHtml}</p>
+    ${verifiedHtml}
+  </div>
+</div>`;
+}
+
+
+/* Loading of wikis from the catalog api */
+
+updateLoadMoreButton = function() {
+    $('#load-more-wikis').toggleClass('d-none', !nextWikisCursor);
+}
+
+
+// reset -- whether to replace the current cards with the first page of
+//          the current query, or to append the next page to them.
+loadWikis = function(reset) {
+    var cardsList = $('#wiki-cards-list');
+    var params;
+    var requestNo;
+
+    if (!reset && (loadingWikis || !nextWikisCursor))
+        return;
+
+    params = Object.assign({}, wikisQuery, wikisFilters);
+    if (!reset)
+        params.cursor = nextWikisCursor;
+
+    requestNo = ++wikisRequestNo;
+    loadingWikis = true;
+
+    $.getJSON('/api/wikis', params)
+        .done(function(data) {
+            if (requestNo !== wikisRequestNo) // a newer query is on its way
+                return;
+
+            if (reset)
+                cardsList.empty();
+            for (let wiki of data.wikis) {
+                // pre-selected wikis might have been rendered already
+                if (!reset && document.getElementById(`checkbox-${wiki.domain}`))
+                    continue;
+                cardsList.append(renderWikiCard(wiki));
+            }
+            cardsList[0].dataset.total = data.total;
+            nextWikisCursor = data.next_cursor;
+            updateLoadMoreButton();
+        })
+        .fail(function(jqXHR, textStatus) {
+            console.log('Request for wikis failed: ' + textStatus);
+        })
+        .always(function() {
+            if (requestNo === wikisRequestNo)
+                loadingWikis = false;
+        });
+}
+
+
+/* Infinite scroll */
+initInfiniteScroll = function() {
+    var loadMoreButton = $('#load-more-wikis');
+
+    loadMoreButton.on('click', function() {
+        loadWikis(false);
+    });
+
+    if ('IntersectionObserver' in window) {
+        var observer = new IntersectionObserver(function(entries) {
+            if (entries[0].isIntersecting)
+                loadWikis(false);
+        }, {rootMargin: '400px'});
+        observer.observe(loadMoreButton[0]);
+    }
+}
+
+
+/* Search */
+initSearch = function() {
     $('#search-wiki-input').on('keyup', function() {
         let searchString = $(this).val();
-        wikisList.search(searchString, onlySearch);
+        clearTimeout(searchTimeout);
+        searchTimeout = setTimeout(function() {
+            if (searchString !== wikisQuery.q) {
+                wikisQuery.q = searchString;
+                loadWikis(true);
+            }
+        }, searchDelay);
     });
-
-    // Start list sorted by last update value
-    wikisList.sort('wiki-lastUpdated', {
-        order: 'desc'
-    })
 }
 
 
@@ -27,13 +163,9 @@ init_list_js = function() {
 setSortBy = function() {
 
     $('.dropdown-item').on('click', function () {
-        console.log( $( this ).data()['order'] )
-        by = $( this ).data()['by']
-        order = $( this ).data()['order']
-
-        wikisList.sort(`wiki-${by}`, {
-            order: order
-        })
+        wikisQuery.sort = $( this ).data()['by'];
+        wikisQuery.order = $( this ).data()['order'];
+        loadWikis(true);
     })
 
 }
@@ -55,7 +187,6 @@ updateHandleLabels = function(property, lower, upper, maxValue) {
 createFilterSlider = function(property, maxValue) {
     var lower;
     var upper;
-    var handle_lower, handle_upper;
 
     let sliderVar = $( `#${property}-slider` ).slider({
         range: true,
@@ -64,24 +195,21 @@ createFilterSlider = function(property, maxValue) {
         values: [ 0, maxValue],
         step : maxValue / 200, // number of marks
         slide: function( event, ui ) {
+            // Update display numbers
+            updateHandleLabels(property, ui.values[ 0 ], ui.values[ 1 ], maxValue);
+        },
+        change: function( event, ui ) {
             lower = ui.values[ 0 ]
             upper = ui.values[ 1 ]
 
-            // Update display numbers
-            updateHandleLabels(property, lower, upper, maxValue);
-
-            // Filter wikis by those numbers
-            wikisList.filter(function(item) {
-
-                if (upper == maxValue && item.values()[`wiki-${property}`] >= lower) {
-                    return true;
-                } else if (item.values()[`wiki-${property}`] >= lower
-                    && item.values()[`wiki-${property}`] <= upper) {
-                   return true;
-                } else {
-                   return false;
-                }
-            });
+            // Filter wikis by those numbers, once the handle is released
+            delete wikisFilters[`${property}_min`];
+            delete wikisFilters[`${property}_max`];
+            if (lower > 0)
+                wikisFilters[`${property}_min`] = Math.round(lower);
+            if (upper < maxValue)
+                wikisFilters[`${property}_max`] = Math.round(upper);
+            loadWikis(true);
         }
     });
 
@@ -96,9 +224,10 @@ createFilterSlider = function(property, maxValue) {
 
 // functions to run when DOM is ready
 $(function()  {
-    init_list_js();
+    nextWikisCursor = $('#wiki-cards-list')[0].dataset.nextCursor || null;
+    initSearch();
+    initInfiniteScroll();
     createFilterSlider('users', 20000);
     createFilterSlider('pages', 50000);
     setSortBy();
 });
-
@@ -20,12 +20,10 @@ function unselect_badge(target) {
     var target_badge = target.parentNode;
     var code = target_badge.dataset.code;
 
-    // Clear search in order to uncheck a wiki card
-    // Because of https://github.com/javve/list.js/issues/380
-    wikisList.search('')
-    document.getElementById('search-wiki-input').value = "";
-
-    $(`input[id="checkbox-${code}"]`)[0].checked = false;
+    // the card might not be loaded with the current search
+    var input = document.getElementById(`checkbox-${code}`);
+    if (input)
+        input.checked = false;
     target_badge.remove();
     check_enable_action_button();
 
@@ -79,8 +77,8 @@ $('.metric-input').click(function(event) {
 });
 
 
-// onclick for wikis checkboxes inputs
-$('.wiki-input').click(function(event) {
+// onclick for wikis checkboxes inputs, even for the cards loaded later on
+$(document).on('click', '.wiki-input', function(event) {
     var checked = $(this).is(':checked');
     check_input({"input": event.target, "checked": checked, "type": 'wiki'});
 });
@@ -163,6 +161,5 @@ $('#selection-footer-button').on ("click", function() {
 
 // functions to run when DOM is ready
 $(function()  {
-    init_list_js();
     init_current_selection();
 });
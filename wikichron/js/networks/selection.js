@@ -56,8 +56,8 @@ $('.networks-radiobutton').on( "click", function({target}) {
 });
 
 
-// onclick for wikis checkboxes input
-$('.wiki-input').on( "click", function({target}) {
+// onclick for wikis checkboxes input, even for the cards loaded later on
+$(document).on( "click", '.wiki-input', function({target}) {
     var wikiCode = target.value;
     var badgesContainer = $('#wiki-badges-container');
     var sameWiki = false;
@@ -69,12 +69,10 @@ $('.wiki-input').on( "click", function({target}) {
         if (sameWiki) { // if same as previous selected, clean current selection
            badgesContainer.html('');
         } else { // if different, unselect previous wiki
-            // Clear search in order to uncheck a wiki card
-            // Because of https://github.com/javve/list.js/issues/380
-            wikisList.search('')
-            document.getElementById('search-wiki-input').value = "";
-
-            $(`input[id="checkbox-${currentWikiCode}"]`)[0].checked = false;
+            // the card might not be loaded with the current search
+            var currentInput = document.getElementById(`checkbox-${currentWikiCode}`);
+            if (currentInput)
+                currentInput.checked = false;
         }
     }
 
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   accumulated_distribution.py
+
+   Descp: Incremental computation of the distribution of the contributions
+       per contributor of a wiki accumulated until every month.
+
+       Instead of grouping again all the data accumulated so far every month,
+       the edits are traversed only once, in chronological order, keeping the
+       number of contributions of every contributor and a histogram of these
+       numbers (how many contributors have made n contributions), which works
+       as the order statistics structure: the distribution of every month is
+       read from it in O(number of different contribution counts), which is
+       at most sqrt(2 * number of edits).
+
+       Gini coefficient and top/rest and percentile ratios are then computed
+       on these distributions with the same formulas the
+       inequality_coefficients package uses.
+
+   Created on: 16-oct-2026
+"""
+
+import math
+
+import numpy as np
+
+
+class ContributionsDistribution:
+    """
+        Distribution of the contributions per contributor at a given time:
+        the different numbers of contributions, in ascending order, and how
+        many contributors have made each of them.
+    """
+
+    def __init__(self, values: np.ndarray, frequencies: np.ndarray):
+        self.values = values
+        self.frequencies = frequencies
+        self.cumulative_frequencies = np.cumsum(frequencies)
+        self.cumulative_totals = np.cumsum(values * frequencies)
+        self.n_users = int(self.cumulative_frequencies[-1]) if len(values) else 0
+        self.total = int(self.cumulative_totals[-1]) if len(values) else 0
+
+
+    def nth_smallest(self, n: int) -> int:
+        """ Contributions of the n-th (1-based) contributor in ascending order """
+        return int(self.values[np.searchsorted(self.cumulative_frequencies, n)])
+
+
+    def nth_largest(self, n: int) -> int:
+        """ Contributions of the n-th (1-based) top contributor """
+        return self.nth_smallest(self.n_users - n + 1)
+
+
+    def sum_of_smallest(self, n: int) -> int:
+        """ Contributions of the n contributors who contributed the least """
+        if n <= 0:
+            return 0
+        i = np.searchsorted(self.cumulative_frequencies, n)
+        users_before = self.cumulative_frequencies[i-1] if i > 0 else 0
+        total_before = self.cumulative_totals[i-1] if i > 0 else 0
+        return int(total_before + (n - users_before) * self.values[i])
+
+
+    def gini_corrected(self) -> float:
+        """ Same as inequality_coefficients.gini_corrected() on the contributions """
+        n = self.n_users
+        if n < 2 or self.total == 0:
+            return np.NaN
+
+        # sum of i * x_i for the contributions x_i sorted in ascending order,
+        #  where contributors with the same value take consecutive positions.
+        positions_before = self.cumulative_frequencies - self.frequencies
+        weighted_total = int(np.sum(self.values * (self.frequencies * positions_before
+                                + self.frequencies * (self.frequencies + 1) // 2)))
+
+        sum_numerator = (n + 1) * self.total - weighted_total
+        g_coeff = n + 1 - 2 * (sum_numerator / self.total)
+        return g_coeff * (1.0 / (n - 1))
+
+
+    def ratio_top_rest(self, percentage: float) -> float:
+        """ Same as inequality_coefficients.ratio_top_rest() on the contributions """
+        rest_users = math.floor(self.n_users * (1 - percentage * 0.01))
+        edits_rest = self.sum_of_smallest(rest_users)
+        return np.float64(self.total - edits_rest) / edits_rest
+
+
+def accumulate(contributor_codes: np.ndarray, month_ends: np.ndarray):
+    """
+        Generator of the distribution of contributions per contributor of the
+        data accumulated until every month.
+
+        contributor_codes -- dense int code (0..n-1) of the contributor of
+            every edit, in chronological order.
+        month_ends -- position where the data after every month starts, as
+            returned by derived_columns.get_month_ends(). All the edits before
+            the first month end are added at once, so the months don't need to
+            start at the first month of the data.
+    """
+    if len(contributor_codes):
+        final_counts = np.bincount(contributor_codes)
+    else:
+        final_counts = np.zeros(1, dtype=np.int64)
+
+    counts = np.zeros(len(final_counts), dtype=np.int64)
+    # frequencies[c] is the number of contributors with c contributions.
+    #  frequencies[0] is meaningless, since contributors who haven't
+    #  contributed yet don't count.
+    frequencies = np.zeros(final_counts.max() + 1, dtype=np.int64)
+
+    start = 0
+    for end in month_ends:
+        if end > start:
+            (contributors, new_contributions) = np.unique(
+                            contributor_codes[start:end], return_counts=True)
+            previous_counts = counts[contributors]
+            counts[contributors] = previous_counts + new_contributions
+            np.subtract.at(frequencies, previous_counts, 1)
+            np.add.at(frequencies, previous_counts + new_contributions, 1)
+            start = end
+
+        values = np.flatnonzero(frequencies[1:]) + 1
+        yield ContributionsDistribution(values, frequencies[values])
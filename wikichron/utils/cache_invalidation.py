@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   cache_invalidation.py
+
+   Descp: Targeted invalidation of the cached data of a wiki.
+
+       Every cache key of the data of a wiki (metric cells, networks, job
+       status...) includes the tag of the wiki between colons (see
+       data_version.get_wiki_tag), so when the data of a wiki is replaced,
+       its entries can be dropped from the caches of all the apps without
+       flushing the rest.
+
+       invalidate_wiki() deletes those entries from every cache registered
+       with register_cache() and, for Redis caches, publishes the tag of the
+       wiki in `CHANNEL`. Every worker listens to that channel and drops its
+       own copies of the wiki data: the local tier of its cache (see
+       layered_cache) and the data registry.
+
+       The metrics of the wiki kept in the durable metric store (see
+       metric_store) are removed as well.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from warnings import warn
+
+from . import data_version
+from . import data_registry
+from . import layered_cache
+from . import metric_store
+
+CHANNEL = 'wikichron:invalidate'
+
+# keys deleted per redis DEL command
+DELETE_BATCH_SIZE = 1000
+
+_caches = []
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def _get_backend(cache):
+    """ Return the backend of a Flask-Caching cache object """
+    return getattr(cache, 'cache', cache)
+
+
+def _escape_glob(text: str) -> str:
+    return re.sub(r'([*?\[\]\\])', r'\\\1', text)
+
+
+def get_tag_substring(tag: str) -> str:
+    return ':{}:'.format(tag)
+
+
+def delete_tagged_keys(client, tag: str, key_prefix: str = '') -> int:
+    """
+        Delete every key of a redis server tagged with tag.
+
+        client -- redis client.
+        key_prefix -- prefix of the keys of the Flask-Caching cache.
+        Return the number of keys deleted.
+    """
+    pattern = '{}*{}*'.format(_escape_glob(key_prefix or ''),
+                            _escape_glob(get_tag_substring(tag)))
+    deleted = 0
+    batch = []
+    for key in client.scan_iter(match=pattern, count=DELETE_BATCH_SIZE):
+        batch.append(key)
+        if len(batch) == DELETE_BATCH_SIZE:
+            deleted += client.delete(*batch)
+            batch = []
+    if batch:
+        deleted += client.delete(*batch)
+    return deleted
+
+
+def publish_invalidation(client, wiki: dict):
+    """ Tell every worker listening to client to drop its copies of wiki """
+    message = {'tag': data_version.get_wiki_tag(wiki), 'data': wiki['data']}
+    client.publish(CHANNEL, json.dumps(message))
+
+
+def _drop_local(tag: str, data: str):
+    """ Drop the copies of the wiki data kept by this process """
+    evicted = layered_cache.evict_local(get_tag_substring(tag))
+    data_registry.evict_wiki({'data': data})
+    print(' * [Info] Dropped local data of {} ({} cache entries)'.format(tag, evicted))
+
+
+def _listen(client):
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+            for message in pubsub.listen():
+                if message['type'] == 'message':
+                    invalidation = json.loads(message['data'].decode('utf-8'))
+                    _drop_local(invalidation['tag'], invalidation['data'])
+        except Exception as e:
+            warn('Listener of cache invalidations failed: {}'.format(e))
+            time.sleep(5)
+
+
+def _ensure_listener(client):
+    global _listener_pid
+    with _listener_lock:
+        if _listener_pid != os.getpid():
+            threading.Thread(target=_listen, args=(client,),
+                            name='cache-invalidation', daemon=True).start()
+            _listener_pid = os.getpid()
+
+
+def register_cache(cache):
+    """ Register a Flask-Caching cache object whose entries can be invalidated """
+    _caches.append(cache)
+    client = getattr(_get_backend(cache), '_write_client', None)
+    if client is not None:
+        _ensure_listener(client)
+
+
+def invalidate_wiki(wiki: dict) -> int:
+    """
+        Drop the cached data of a wiki, whatever its version, from the caches
+        of every app and from every worker.
+
+        wiki -- wiki metadata dict, as in wikis.json.
+        Return the number of cache entries deleted.
+    """
+    tag = data_version.get_wiki_tag(wiki)
+    deleted = 0
+    published_to = set()
+    for cache in _caches:
+        backend = _get_backend(cache)
+        client = getattr(backend, '_write_client', None)
+        if client is None: # one-process cache, like the 'simple' one
+            keys = [key for key in list(getattr(backend, '_cache', {}))
+                        if get_tag_substring(tag) in key]
+            if keys:
+                backend.delete_many(*keys)
+            deleted += len(keys)
+            continue
+
+        deleted += delete_tagged_keys(client, tag, backend.key_prefix)
+        server = repr(client.connection_pool.connection_kwargs)
+        if server not in published_to:
+            publish_invalidation(client, wiki)
+            published_to.add(server)
+
+    _drop_local(tag, wiki['data'])
+    metric_store.delete_wiki(wiki)
+    print(' * [Info] Invalidated {} cache entries of {}'.format(deleted, tag))
+    return deleted
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   cohorts.py
+
+   Descp: Cohort table of the editors of a wiki, for retention metrics.
+
+       Retention metrics (returning and surviving new editors...) look at
+       the activity of every editor within some time window after they
+       joined the wiki, i.e. after their first edit. The cohort table holds
+       every edit along with what these metrics need about it, computed in
+       one vectorized pass over the edits sorted by contributor:
+
+         * contributor_code: contributor of the edit.
+         * month: month code of the edit (see derived_columns).
+         * since_joining: time elapsed since the first edit of the
+           contributor, as a timedelta.
+         * is_session_start: whether the edit starts an edit session, i.e.
+           whether it's the first edit of the contributor or comes more than
+           the session gap after the previous one.
+
+       Every retention metric is then a projection of this table: a time
+       window after joining (in_window()) and how contributors are
+       counted by month (month_of_activity()).
+
+   Created on: 16-oct-2026
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import derived_columns
+
+SESSION_GAP = pd.Timedelta(minutes=60)
+
+
+def get_cohort_table(contributor_codes, timestamps,
+                    session_gap: pd.Timedelta = SESSION_GAP) -> pd.DataFrame:
+    """
+        Return the cohort table of some edits.
+
+        contributor_codes -- dense int code of the contributor of every edit.
+        timestamps -- timestamp of every edit, in chronological order.
+        session_gap -- longest time between two edits of the same session.
+    """
+    contributor_codes = np.asarray(contributor_codes)
+    timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+
+    # stable sort, so the edits of every contributor keep their order
+    order = np.argsort(contributor_codes, kind='stable')
+    contributors = contributor_codes[order]
+    timestamps = timestamps[order]
+
+    is_first_edit = np.ones(len(order), dtype=bool)
+    is_first_edit[1:] = contributors[1:] != contributors[:-1]
+    first_edits = np.maximum.accumulate(
+                        np.where(is_first_edit, np.arange(len(order)), 0))
+    since_previous = np.zeros(len(order), dtype='timedelta64[ns]')
+    since_previous[1:] = timestamps[1:] - timestamps[:-1]
+
+    return pd.DataFrame({
+        'contributor_code': contributors,
+        'month': derived_columns.get_month_codes(timestamps),
+        'since_joining': timestamps - timestamps[first_edits],
+        'is_session_start': is_first_edit | (since_previous > np.timedelta64(session_gap)),
+    })
+
+
+def in_window(cohort: pd.DataFrame, start: pd.Timedelta, end: pd.Timedelta) -> np.ndarray:
+    """ Mask of the edits made between start and end after joining, both included """
+    since_joining = cohort['since_joining'].values
+    return (since_joining >= np.timedelta64(start)) & \
+            (since_joining <= np.timedelta64(end))
+
+
+def month_of_activity(cohort: pd.DataFrame, mask: np.ndarray, min_edits: int = 1,
+                        last: bool = False) -> pd.Series:
+    """
+        Return, for every contributor, the first month (or the last one if
+        last is set) with at least min_edits edits in mask. Contributors
+        without any such month are left out.
+    """
+    edits = cohort[mask].groupby(['contributor_code', 'month']).size()
+    edits = edits[edits >= min_edits].reset_index()
+    months = edits.groupby('contributor_code')['month']
+    return months.max() if last else months.min()
+
+
+def count_by_month(months: pd.Series, index: pd.DatetimeIndex) -> pd.Series:
+    """ Number of contributors in every month of index, given their months """
+    counts = pd.Series(months.values).value_counts()
+    counts.name = None
+    return derived_columns.as_monthly_series(counts, index)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   columnar_store.py
+
+   Descp: Columnar on-disk cache for the wiki csv data.
+
+       Parsing the `|`-quoted csvs and their timestamps is, by far, the most
+       expensive part of loading a wiki. So, the first time a csv is loaded
+       (or when running scripts/generate_columnar_cache.py) the parsed
+       dataframe is written into a Feather file, which keeps the column
+       types and the already parsed timestamps.
+
+       Sidecar files are named after the size and the mtime of the csv they
+       come from, so a replaced or modified csv never gets served from an old
+       sidecar.
+
+       Data is also stored in a compact layout (see compact_dataframe()), so
+       loaded dataframes are already small in memory, in the cache backends
+       and on disk.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import re
+import time
+import importlib.util
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+
+# pyarrow is needed by pandas for reading/writing feather files
+columnar_available = importlib.util.find_spec('pyarrow') is not None
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+columnar_dir = os.getenv('WIKICHRON_COLUMNAR_DIR', os.path.join(data_dir, 'columnar'))
+
+COLUMNAR_EXTENSION = '.feather'
+# Increase it whenever the layout produced by parse_csv() changes, so
+#  sidecars written with the previous layout get regenerated.
+COLUMNAR_FORMAT_VERSION = 2
+
+CATEGORICAL_COLUMNS = ['contributor_name', 'page_title']
+INT_COLUMNS_DTYPES = {
+    'page_id': np.int32,
+    'page_ns': np.int16,
+    'revision_id': np.int32,
+    'bytes': np.int32,
+}
+
+
+def get_csv_signature(csv: str) -> str:
+    """ Return a string which changes whenever the csv file changes """
+    csv_stat = os.stat(os.path.join(data_dir, csv))
+    return '{}-{}-v{}'.format(csv_stat.st_size, csv_stat.st_mtime_ns,
+                            COLUMNAR_FORMAT_VERSION)
+
+
+def get_columnar_path(csv: str, signature: str = None) -> str:
+    if signature is None:
+        signature = get_csv_signature(csv)
+    name = os.path.splitext(os.path.basename(csv))[0]
+    return os.path.join(columnar_dir,
+                        '{}.{}{}'.format(name, signature, COLUMNAR_EXTENSION))
+
+
+def downcast_int_column(series: pd.Series, dtype) -> pd.Series:
+    """ Cast series to the int dtype only if all its values fit in it """
+    if not pd.api.types.is_integer_dtype(series) or series.empty:
+        return series
+    dtype_info = np.iinfo(dtype)
+    if series.min() < dtype_info.min or series.max() > dtype_info.max:
+        return series
+    return series.astype(dtype)
+
+
+def compact_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+        Turn the revisions dataframe into a compact representation:
+         * names and titles become categoricals.
+         * ids, namespaces and bytes are downcasted to small ints.
+         * contributor_code and page_code columns are added, with dense
+           int32 codes (0..n-1) for every contributor and page.
+
+        Note that contributor_id can not be downcasted when the wiki has
+        anonymous activity, since the ip is used as id for anonymous users.
+
+        df -- data to be compacted. It'll be modified in place
+        Return the compacted dataframe.
+    """
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
+
+    for (column, dtype) in INT_COLUMNS_DTYPES.items():
+        df[column] = downcast_int_column(df[column], dtype)
+    df['contributor_id'] = downcast_int_column(df['contributor_id'], np.int32)
+
+    df['contributor_code'] = pd.factorize(df['contributor_id'])[0].astype(np.int32)
+    df['page_code'] = pd.factorize(df['page_id'])[0].astype(np.int32)
+    return df
+
+
+def get_memory_footprint(df: pd.DataFrame) -> int:
+    """ Return the number of bytes taken up by a dataframe in memory """
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def parse_csv(csv: str) -> pd.DataFrame:
+    """ Read and parse a wiki csv file into a compact dataframe. """
+    df = pd.read_csv(os.path.join(data_dir, csv),
+                    delimiter=',', quotechar='|',
+                    index_col=False)
+    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
+    return compact_dataframe(df)
+
+
+def remove_stale_columnar_files(csv: str, keep: str = None):
+    """ Remove the sidecars of a csv, but `keep`, if provided. """
+    if not os.path.isdir(columnar_dir):
+        return
+    name = os.path.splitext(os.path.basename(csv))[0]
+    sidecar_regex = re.compile(r'^{}\.\d+-\d+(-v\d+)?{}$'.format(re.escape(name),
+                                                re.escape(COLUMNAR_EXTENSION)))
+    for filename in os.listdir(columnar_dir):
+        path = os.path.join(columnar_dir, filename)
+        if sidecar_regex.match(filename) and path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def write_columnar(csv: str, df: pd.DataFrame, signature: str = None) -> str:
+    """
+        Write the parsed dataframe of a csv into its columnar sidecar.
+
+        The file is written first under a temporary name and then renamed,
+        so concurrent workers never read a half-written sidecar.
+        Return the path of the written file.
+    """
+    path = get_columnar_path(csv, signature)
+    os.makedirs(columnar_dir, exist_ok=True)
+
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    # feather only supports the default index
+    df.reset_index(drop=True).to_feather(tmp_path)
+    os.replace(tmp_path, path)
+
+    remove_stale_columnar_files(csv, keep=path)
+    return path
+
+
+def build_columnar(csv: str) -> str:
+    """ (Re)generate the columnar sidecar of a csv from scratch """
+    signature = get_csv_signature(csv)
+    df = parse_csv(csv)
+    return write_columnar(csv, df, signature)
+
+
+def load_dataframe(csv: str) -> pd.DataFrame:
+    """
+        Load the data of a wiki csv, from its columnar sidecar if it is up
+        to date, or parsing the csv (and writing the sidecar) otherwise.
+    """
+    if not columnar_available:
+        return parse_csv(csv)
+
+    signature = get_csv_signature(csv)
+    path = get_columnar_path(csv, signature)
+
+    if os.path.isfile(path):
+        try:
+            return pd.read_feather(path)
+        except Exception as e:
+            warn('Unable to read columnar file {}: {}. Falling back to csv.'
+                    .format(path, e))
+
+    df = parse_csv(csv)
+    try:
+        time_start_writing = time.perf_counter()
+        write_columnar(csv, df, signature)
+        time_end_writing = time.perf_counter() - time_start_writing
+        print(' * [Timing] Writing columnar cache for {} : {} seconds'
+                    .format(csv, time_end_writing))
+    except Exception as e:
+        warn('Unable to write columnar file for {}: {}'.format(csv, e))
+    return df
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   compute_pool.py
+
+   Descp: Optional process pool to compute the metrics of several wikis in
+       parallel, one task per wiki.
+
+       Tasks don't get the data of their wiki, but the wiki metadata. Workers
+       read the data from their own data_registry, which maps the prepared
+       data of the wiki from its mapped store (see mapped_store). So, frames
+       are never pickled between processes, and all the workers share the
+       same physical pages of the data. Only the computed metrics are sent
+       back to the parent.
+
+       The number of worker processes is set in the environment variable
+       WIKICHRON_COMPUTE_PROCESSES. If it is 0 (the default), metrics are
+       computed in the calling thread, one wiki after another.
+
+       Workers are started by a forkserver, never forked straight from a
+       gunicorn worker: its other threads (warm-up, jobs, cache listener)
+       may hold the locks of the data registry at that moment, and a forked
+       child would inherit them locked and block forever reading a wiki.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+compute_processes = int(os.getenv('WIKICHRON_COMPUTE_PROCESSES', 0))
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+# modules imported once in the forkserver, so workers forked from it have
+#  them already
+PRELOAD_MODULES = ['wikichron.dash.apps.classic.metrics.interface']
+
+
+def is_enabled() -> bool:
+    return compute_processes > 0
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+        Return the process pool of this process, creating it the first time.
+
+        The pool is created lazily, so every gunicorn worker gets its own.
+        Its workers are forked from a clean forkserver process instead of
+        from the gunicorn worker, so they don't inherit the state of its
+        threads. The forkserver imports PRELOAD_MODULES once, so the tasks
+        don't pay for importing them in every worker.
+    """
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(PRELOAD_MODULES)
+            _executor = ProcessPoolExecutor(max_workers=compute_processes,
+                                            mp_context=context)
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def map_tasks(func, tasks: list) -> list:
+    """
+        Return [func(*args) for args in tasks], running every call in the
+        process pool when it is enabled and there are several tasks.
+
+        func -- module-level function, so it can be sent to the workers.
+    """
+    if not is_enabled() or len(tasks) < 2:
+        return [func(*args) for args in tasks]
+
+    executor = get_executor()
+    futures = [executor.submit(func, *args) for args in tasks]
+    return [future.result() for future in futures]
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   contributor_months.py
+
+   Descp: Sparse matrix of the edits of every contributor in every month.
+
+       Many monowiki metrics classify, month by month, the contributors of
+       a wiki by their editing history: when they made their first edit,
+       how long ago they made their previous one, how many edits they had
+       made before... Instead of building a dense contributors x months
+       frame with a python-level groupby().apply() per contributor for every
+       one of these metrics, the edits are counted once into this matrix,
+       which only keeps the (contributor, month) cells with edits, and
+       metrics are computed from it with vectorized operations.
+
+       Cells are kept in coordinate format, sorted by contributor and month,
+       along with what these metrics need about every cell: the edits
+       accumulated by the contributor until that month and before it, the
+       month of its previous edit, the month of its first edit and its
+       current streak of consecutive months editing.
+
+       Months are positions in the index of the matrix: every month from the
+       first to the last month of the data.
+
+   Created on: 16-oct-2026
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import derived_columns
+from . import accumulated_distribution
+
+
+class ContributorMonthMatrix:
+    """ Edits per contributor and month, only for the cells with edits """
+
+    def __init__(self, contributor_codes: np.ndarray, month_codes: np.ndarray):
+        """
+            contributor_codes -- dense int code of the contributor of every
+                edit, as in the contributor_code column.
+            month_codes -- month code of every edit (see derived_columns).
+        """
+        contributor_codes = np.asarray(contributor_codes, dtype=np.int64)
+        month_codes = np.asarray(month_codes, dtype=np.int64)
+        # edits without contributor (code -1) belong to no row
+        valid = contributor_codes >= 0
+        if not valid.all():
+            (contributor_codes, month_codes) = (contributor_codes[valid], month_codes[valid])
+        if len(month_codes):
+            first_month = month_codes.min()
+            self.n_months = int(month_codes.max() - first_month) + 1
+            self.index = pd.date_range(
+                        start=derived_columns.months_to_datetime([first_month])[0],
+                        periods=self.n_months, freq='MS', name='timestamp')
+        else:
+            first_month = 0
+            self.n_months = 0
+            self.index = pd.DatetimeIndex([], freq='MS', name='timestamp')
+
+        cell_keys = contributor_codes * max(self.n_months, 1) + (month_codes - first_month)
+        (cell_keys, self.edits) = np.unique(cell_keys, return_counts=True)
+        self.contributors = cell_keys // max(self.n_months, 1)
+        self.months = cell_keys % max(self.n_months, 1)
+
+        # position of the first cell of the contributor of every cell
+        is_row_start = np.ones(len(cell_keys), dtype=bool)
+        is_row_start[1:] = self.contributors[1:] != self.contributors[:-1]
+        row_starts = np.maximum.accumulate(
+                        np.where(is_row_start, np.arange(len(cell_keys)), 0))
+
+        totals = np.cumsum(self.edits)
+        self.cumulative = totals - (totals - self.edits)[row_starts]
+        self.edits_before = self.cumulative - self.edits
+        self.first_month = self.months[row_starts]
+        self.previous_month = np.where(is_row_start, -1,
+                                        np.concatenate([[-1], self.months[:-1]]))
+
+        # number of consecutive months the contributor has been editing until
+        #  the month of every cell, that month included
+        is_streak_start = is_row_start | (self.months - self.previous_month != 1)
+        streak_starts = np.maximum.accumulate(
+                        np.where(is_streak_start, np.arange(len(cell_keys)), 0))
+        self.streaks = np.arange(len(cell_keys)) - streak_starts + 1
+
+
+    def count_by_month(self, mask: np.ndarray) -> np.ndarray:
+        """ Number of cells where mask is True in every month """
+        return np.bincount(self.months[mask], minlength=self.n_months)
+
+
+    def sum_by_month(self, mask: np.ndarray = None) -> np.ndarray:
+        """ Number of edits of the cells where mask is True in every month """
+        if mask is None:
+            return np.bincount(self.months, weights=self.edits,
+                                minlength=self.n_months)
+        return np.bincount(self.months[mask], weights=self.edits[mask],
+                            minlength=self.n_months)
+
+
+    def as_series(self, values: np.ndarray, index: pd.DatetimeIndex = None,
+                    name: str = None) -> pd.Series:
+        """
+            Turn an array with a value for every month of the matrix into a
+            series, reindexed to index (with 0 for its months out of the
+            matrix) if it's given.
+        """
+        series = pd.Series(values, index=self.index, name=name)
+        if index is not None:
+            series = series.reindex(index, fill_value=0)
+        return series
+
+
+    def iter_monthly_edits(self):
+        """
+            Generator of the edits of every contributor who edited in every
+            month, as an array.
+        """
+        order = np.argsort(self.months, kind='stable')
+        month_ends = np.searchsorted(self.months[order], np.arange(self.n_months),
+                                    side='right')
+        edits = self.edits[order]
+        start = 0
+        for end in month_ends:
+            yield edits[start:end]
+            start = end
+
+
+    def iter_accumulated_distributions(self):
+        """
+            Generator of the distribution of the edits per contributor
+            accumulated until every month (see accumulated_distribution).
+        """
+        order = np.argsort(self.months, kind='stable')
+        contributor_codes = np.repeat(self.contributors[order], self.edits[order])
+        month_ends = np.cumsum(self.sum_by_month()).astype(np.int64)
+        return accumulated_distribution.accumulate(contributor_codes, month_ends)
@@ -17,13 +17,14 @@ import json
 import os
 import zc.lockfile
 
+from . import columnar_store
+from . import wiki_catalog
+
 data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
 
 
 def get_available_wikis():
-    wikis_json_file = open(os.path.join(data_dir, 'wikis.json'))
-    wikis = json.load(wikis_json_file)
-    return wikis
+    return wiki_catalog.get_available_wikis()
 
 
 def get_max_wiki_stats():
@@ -46,6 +47,8 @@ def update_wikis_metadata(new_metadata):
     # update file with new metadata and release file
     try:
         json.dump(new_metadata, wikis_json_file, indent='\t')
+        wikis_json_file.flush()
+        wiki_catalog.invalidate()
         return True
     except:
         return False
@@ -56,11 +59,7 @@ def update_wikis_metadata(new_metadata):
 
 
 def load_dataframe_from_csv(csv: str):
-    df = pd.read_csv(os.path.join(data_dir, csv),
-                    delimiter=',', quotechar='|',
-                    index_col=False)
-    df['timestamp']=pd.to_datetime(df['timestamp'],format='%Y-%m-%dT%H:%M:%SZ')
-    return df
+    return columnar_store.load_dataframe(csv)
 
 
 def get_stats(data : pd.DataFrame) -> dict:
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   data_registry.py
+
+   Descp: Process-wide registry of the loaded wiki data.
+
+       The classic, monowiki and networks Dash apps run in the same process,
+       so they all read the wiki data from here. This way, a wiki is loaded
+       (and its bots activity filtered out) only once per process, no matter
+       how many apps use it.
+
+       Loaded wikis are kept in memory until the total size of the loaded
+       data exceeds `memory_budget`. Then, the least recently used wikis are
+       dropped.
+
+       Note that the dataframes returned are shared by everyone, so they
+       must be treated as read-only. Besides, they are built on top of
+       memory-mapped files (see mapped_store), so their memory is also
+       shared by the other worker processes running in the same host.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from warnings import warn
+
+import numpy as np
+
+from . import columnar_store
+from . import data_version
+from . import derived_columns
+from . import mapped_store
+
+# memory budget for the loaded wikis, in MB
+memory_budget = int(os.getenv('WIKICHRON_DATA_MEMORY_BUDGET', 2048)) * 2**20
+
+_wikis_data = OrderedDict() # key -> dataframe, in LRU order
+_wikis_sizes = {}           # key -> bytes taken up by the dataframe
+_registry_lock = threading.Lock()
+_loading_locks = {}         # key -> lock held while the wiki is being loaded
+
+
+### LOAD PATH ###
+
+def get_dataframe_from_csv(csv):
+    """ Read and parse a csv and return the corresponding pandas dataframe"""
+
+    print('Loading csv for ' + csv)
+    time_start_loading_one_csv = time.perf_counter()
+    df = columnar_store.load_dataframe(csv)
+    print('!!Loaded csv for ' + csv)
+    time_end_loading_one_csv = time.perf_counter() - time_start_loading_one_csv
+    print(' * [Timing] Loading {} : {} seconds'
+                    .format(csv, time_end_loading_one_csv))
+    df.index.name = csv
+    return df
+
+
+def prepare_data(df):
+    """
+       Prepare data in the correct input format for the metric
+       calculation functions.
+
+       df -- data to be prepared, already without bots activity.
+       Return that data sorted by timestamp and with the derived columns
+       (see derived_columns) the metric functions rely on.
+    """
+    df = df.sort_values(by='timestamp')
+    return derived_columns.add_derived_columns(df)
+
+
+def remove_bots_activity(df, bots_ids):
+    """
+       Filter out bots activity from pandas dataframe.
+
+       df -- data to be filtered.
+       bots_ids -- numpy array with the userid for every bot
+       Return a dataframe derived from the original but with all the
+          editions made by bot users removed
+    """
+    bots = np.array(bots_ids)
+    return df[~df['contributor_id'].isin(bots)]
+
+
+def clean_up_bot_activity(df, wiki):
+    if 'bots' in wiki:
+        return remove_bots_activity(df, data_version.get_bots_ids(wiki))
+    else:
+        warn("Warning: Missing information of bots ids. Note that graphs can be polluted of non-human activity.")
+    return df
+
+
+def build_wiki_data(wiki):
+    """ Load the csv of a wiki and prepare its data """
+    df = get_dataframe_from_csv(wiki['data'])
+    # bots are filtered out first, so first edit flags ignore them
+    df = clean_up_bot_activity(df, wiki)
+    return prepare_data(df)
+
+
+def load_wiki_data(wiki):
+    """
+        Load the data of a wiki without going through the registry.
+
+        The prepared data is read from its mapped store (see mapped_store),
+        so it is shared with the other worker processes of this host. If the
+        wiki is not there yet, it is built and written into it first.
+    """
+    csv = wiki['data']
+    try:
+        path = mapped_store.get_mapped_path(csv, data_version.get_bots_ids(wiki))
+        if not mapped_store.is_mapped(path):
+            mapped_store.write_mapped(csv, build_wiki_data(wiki), path)
+        df = mapped_store.read_mapped(path)
+    except Exception as e:
+        warn('Unable to use the mapped store for {}: {}. Loading it in private memory.'
+                .format(csv, e))
+        return build_wiki_data(wiki)
+    df.index.name = csv
+    return df
+
+
+### REGISTRY ###
+
+def get_wiki_key(wiki):
+    """ Key which identifies the data of a wiki in the registry """
+    return (wiki['data'], data_version.get_data_version(wiki))
+
+
+def _evict_over_budget(keep):
+    """ Drop least recently used wikis until we are within the budget """
+    total_size = sum(_wikis_sizes.values())
+    for key in list(_wikis_data.keys()):
+        if total_size <= memory_budget:
+            break
+        if key == keep:
+            continue
+        print(' * [Info] Evicting {} from the wikis data registry'.format(key[0]))
+        del _wikis_data[key]
+        total_size -= _wikis_sizes.pop(key)
+
+
+def read_data(wiki):
+    """
+        Return the data of a wiki, loading it if it is not in the registry.
+
+        wiki -- wiki metadata dict, as in wikis.json
+        Return a read-only dataframe with the revisions of the wiki, sorted
+        by timestamp and without the activity of its bots.
+    """
+    key = get_wiki_key(wiki)
+
+    with _registry_lock:
+        if key in _wikis_data:
+            _wikis_data.move_to_end(key)
+            return _wikis_data[key]
+        loading_lock = _loading_locks.setdefault(key, threading.Lock())
+
+    # Only one thread loads a wiki, the other ones wait for it
+    with loading_lock:
+        with _registry_lock:
+            if key in _wikis_data:
+                _wikis_data.move_to_end(key)
+                return _wikis_data[key]
+
+        df = load_wiki_data(wiki)
+        size = columnar_store.get_memory_footprint(df)
+        print(' * [Memory] {} takes up {:.2f} MB'.format(wiki['data'], size / 2**20))
+
+        with _registry_lock:
+            _wikis_data[key] = df
+            _wikis_sizes[key] = size
+            _loading_locks.pop(key, None)
+            _evict_over_budget(keep=key)
+
+    return df
+
+
+def evict_wiki(wiki):
+    """ Drop every registry entry holding data of the csv of wiki """
+    with _registry_lock:
+        for key in [key for key in _wikis_data if key[0] == wiki['data']]:
+            del _wikis_data[key]
+            del _wikis_sizes[key]
+
+
+def get_registry_stats():
+    """ Return the memory taken up by every loaded wiki and the totals """
+    with _registry_lock:
+        wikis = [{'data': key[0], 'bytes': _wikis_sizes[key]}
+                    for key in _wikis_data.keys()]
+    return {
+        'wikis': wikis,
+        'total_bytes': sum(wiki['bytes'] for wiki in wikis),
+        'budget_bytes': memory_budget
+    }
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   data_version.py
+
+   Descp: Cheap and stable keys for the data of a wiki.
+
+       The wiki metadata dicts of wikis.json include things like the logo
+       of the wiki as a base64 image, so they are expensive to serialize
+       and hash as cache keys, and any change in them (a new logo, a typo
+       fixed in the name) would invalidate all the cached data of the wiki.
+
+       Instead, every cache of WikiChron keys the data of a wiki by its data
+       version: the domain of the wiki, the signature (size and mtime) of
+       its csv and a digest of the ids of its bots, which are filtered out
+       of the data. So, it only changes when the data the metrics are
+       computed on changes.
+
+       Data versions start with the tag of the wiki, its domain, so the cache
+       entries of a wiki can also be dropped on purpose, whatever their
+       version, when its data is replaced.
+
+   Created on: 16-oct-2026
+"""
+
+import functools
+
+from . import columnar_store
+from . import mapped_store
+from . import single_flight
+
+
+def get_bots_ids(wiki: dict) -> list:
+    return [bot['id'] for bot in wiki.get('bots', [])]
+
+
+def get_wiki_tag(wiki: dict) -> str:
+    """
+        Return the tag of the cache entries of a wiki. Every cache key built
+        for the data of a wiki includes it between colons, so all of them
+        can be found and invalidated together (see cache_invalidation).
+    """
+    return wiki.get('domain', wiki['data'])
+
+
+def get_data_version(wiki: dict) -> str:
+    """ Return a string which changes whenever the data of the wiki changes """
+    return '{}:{}:{}'.format(get_wiki_tag(wiki),
+                        columnar_store.get_csv_signature(wiki['data']),
+                        mapped_store.get_bots_digest(get_bots_ids(wiki)))
+
+
+def memoize_by_data_version(cache, timeout: int = None):
+    """
+        Decorator like cache.memoize(), for functions whose first argument is
+        a wiki metadata dict, which is keyed by its data version instead of
+        by all its metadata.
+
+        The rest of arguments must have a stable repr().
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(wiki, *args, **kwargs):
+            key = 'memoize:{}.{}:{}:{!r}:{!r}'.format(func.__module__,
+                        func.__qualname__, get_data_version(wiki), args,
+                        sorted(kwargs.items()))
+            # concurrent calls with the same arguments compute it only once
+            return single_flight.get_or_compute(cache, key,
+                        lambda: func(wiki, *args, **kwargs), timeout=timeout)
+        return wrapper
+    return decorator
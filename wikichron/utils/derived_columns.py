@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   derived_columns.py
+
+   Descp: Columns derived from the revisions of a wiki, which are computed
+       only once, when the wiki is loaded (see data_registry.prepare_data()),
+       and helpers for the metrics to work with them:
+
+       * month: month of the edit, as number of months since 1970-01.
+         Grouping by this int column is much cheaper than grouping with
+         pd.Grouper(key='timestamp', freq='MS') every time.
+       * is_anonymous: whether the edit was made by an anonymous user.
+       * is_first_page_edit: whether the edit is the first one of its page.
+       * is_first_contributor_edit: whether the edit is the first one of its
+         contributor.
+       * bytes_delta: bytes added (or removed, if negative) by the edit to
+         its page, i.e. the size of the page minus its size in the previous
+         edit of that page. The whole size for the first edit of a page.
+
+       Note that first edit flags refer to the whole history of the wiki,
+       not to any subset of its data.
+
+   Created on: 16-oct-2026
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def get_month_codes(timestamps) -> np.ndarray:
+    """ Return the number of months since 1970-01 of every timestamp """
+    timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+    return timestamps.astype('datetime64[M]').astype(np.int32)
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+        Add the derived columns to the revisions data.
+
+        df -- data sorted by timestamp. It'll be modified in place.
+        Return df.
+    """
+    df['month'] = get_month_codes(df['timestamp'])
+    df['is_anonymous'] = (df['contributor_name'] == 'Anonymous').values
+    df['is_first_page_edit'] = ~df['page_id'].duplicated().values
+    df['is_first_contributor_edit'] = ~df['contributor_id'].duplicated().values
+    df['bytes_delta'] = get_bytes_delta(df['page_code'].values, df['bytes'].values)
+    return df
+
+
+def get_bytes_delta(page_codes: np.ndarray, page_bytes: np.ndarray) -> np.ndarray:
+    """
+        Return the difference between the size of the page of every edit and
+        its size in the previous edit of that page, or the whole size for
+        the first edit of every page.
+
+        page_codes -- dense int code of the page of every edit, in
+            chronological order.
+        page_bytes -- size of the page after every edit.
+    """
+    # stable sort, so the edits of every page keep their chronological order
+    order = np.argsort(page_codes, kind='stable')
+    sorted_pages = page_codes[order]
+    sorted_bytes = page_bytes[order]
+    is_first_page_edit = np.ones(len(order), dtype=bool)
+    is_first_page_edit[1:] = sorted_pages[1:] != sorted_pages[:-1]
+
+    sorted_delta = sorted_bytes.copy()
+    sorted_delta[1:] -= sorted_bytes[:-1]
+    sorted_delta[is_first_page_edit] = sorted_bytes[is_first_page_edit]
+
+    delta = np.empty_like(sorted_delta)
+    delta[order] = sorted_delta
+    return delta
+
+
+def months_to_datetime(months) -> pd.DatetimeIndex:
+    """ Return the first day of every month code in months """
+    months = np.asarray(months, dtype=np.int64).astype('datetime64[M]')
+    return pd.DatetimeIndex(months.astype('datetime64[ns]'), name='timestamp')
+
+
+def get_months_index(data: pd.DataFrame) -> pd.DatetimeIndex:
+    """
+        Return the first day of every month from the first month to the last
+        month of data, both included.
+
+        It's the same index as
+        data.groupby(pd.Grouper(key='timestamp', freq='MS')).size().index
+    """
+    if data.empty:
+        return pd.DatetimeIndex([], freq='MS', name='timestamp')
+    months = data['month'].values
+    return pd.date_range(start=months_to_datetime([months.min()])[0],
+                        periods=int(months.max() - months.min()) + 1,
+                        freq='MS', name='timestamp')
+
+
+def as_monthly_series(series: pd.Series, index: pd.DatetimeIndex) -> pd.Series:
+    """
+        Turn a series indexed by month code into a series indexed by the
+        first day of every month.
+
+        series -- series indexed by month code, as returned by
+            data.groupby('month').
+        index -- months for the returned series. If None, every month from
+            the first to the last one of series.
+        Return the series reindexed, with 0 for the months not in series.
+    """
+    if index is not None:
+        months = get_month_codes(index)
+    elif series.empty:
+        months = np.array([], dtype=np.int32)
+    else:
+        months = np.arange(series.index.min(), series.index.max() + 1)
+
+    series = series.reindex(months, fill_value=0)
+    series.index = index if index is not None else months_to_datetime(months)
+    return series
+
+
+def accumulate_by_month(series: pd.Series, index: pd.DatetimeIndex) -> pd.Series:
+    """
+        Turn a series indexed by month code into the total accumulated until
+        every month of index.
+
+        Months of series before the first month of index are accumulated
+        too, so index can be just a window of the months of the data.
+
+        series -- series indexed by month code, as returned by
+            data.groupby('month').
+        index -- months for the returned series. If None, every month from
+            the first to the last one of series.
+    """
+    series = series.sort_index()
+    if index is not None:
+        months = get_month_codes(index)
+    elif series.empty:
+        months = np.array([], dtype=np.int32)
+    else:
+        months = np.arange(series.index.min(), series.index.max() + 1)
+
+    totals = np.concatenate([[0], np.cumsum(series.values)])
+    positions = np.searchsorted(series.index.values, months, side='right')
+    return pd.Series(totals[positions], name=series.name,
+                    index=index if index is not None else months_to_datetime(months))
+
+
+def count_by_month(data: pd.DataFrame, index: pd.DatetimeIndex) -> pd.Series:
+    """ Return the number of rows of data in every month """
+    return as_monthly_series(data.groupby('month').size(), index)
+
+
+def get_month_ends(data: pd.DataFrame, index: pd.DatetimeIndex) -> np.ndarray:
+    """
+        Return, for every month of index, the position where the data after
+        that month starts. So, data.iloc[:end] is the data accumulated until
+        that month.
+
+        data -- revisions data, sorted by timestamp.
+    """
+    return np.searchsorted(data['month'].values, get_month_codes(index),
+                            side='right')
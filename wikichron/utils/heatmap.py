@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   heatmap.py
+
+   Descp: Month x bin count matrices for the heatmap metrics of monowiki.
+
+       Heatmap metrics classify some items of every month (editors, pages,
+       revisions...) by a numeric value (their number of edits, their bytes
+       difference...) into bins, and plot how many items of every month fall
+       into every bin. Their result is
+
+         [months, y, z, month x bin counts, 'Heatmap']
+
+       where y is the range of values plotted, and z has one row for every
+       value from the first value of y to the last value of y plus one. The
+       row of a value holds, for every month, the count of the bin which
+       contains that value.
+
+       Counts are computed with a 2D histogram of the integer month codes
+       (see derived_columns) and the values of the items.
+
+       Bins are right-closed, like the ones of pd.cut(): the bin i holds the
+       values in (bin_edges[i], bin_edges[i+1]].
+
+   Created on: 16-oct-2026
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import derived_columns
+
+
+def count_by_month_and_bin(months, values, index: pd.DatetimeIndex,
+                            bin_edges) -> np.ndarray:
+    """
+        Return the number of items in every bin (rows) and every month of
+        index (columns).
+
+        months -- month code of every item.
+        values -- value of every item.
+        Items out of the months of index or out of the bins are not counted.
+    """
+    months = np.asarray(months)
+    values = np.asarray(values)
+    bin_edges = np.asarray(bin_edges)
+    index_months = derived_columns.get_month_codes(index)
+    n_bins = max(len(bin_edges) - 1, 0)
+    n_months = len(index_months)
+
+    month_positions = np.searchsorted(index_months, months)
+    in_index = month_positions < n_months
+    in_index[in_index] = index_months[month_positions[in_index]] == months[in_index]
+    bins = np.searchsorted(bin_edges, values, side='left') - 1
+    valid = in_index & (bins >= 0) & (bins < n_bins)
+
+    cells = bins[valid] * n_months + month_positions[valid]
+    counts = np.bincount(cells, minlength=n_bins * n_months)
+    return counts.reshape(n_bins, n_months)
+
+
+def expand_bins(counts: np.ndarray, bin_edges, first: int, last: int) -> np.ndarray:
+    """
+        Return a row for every value from first to last, both included, with
+        the counts of the bin of that value, or 0 if it's out of the bins.
+    """
+    bin_edges = np.asarray(bin_edges)
+    values = np.arange(first, last + 1)
+    rows = np.searchsorted(bin_edges, values, side='left') - 1
+    valid = (rows >= 0) & (rows < len(counts))
+    z = np.zeros((len(values), counts.shape[1]), dtype=counts.dtype)
+    z[valid] = counts[rows[valid]]
+    return z
+
+
+def build_heatmap(months, values, index: pd.DatetimeIndex, bin_edges,
+                    first: int, last: int) -> list:
+    """
+        Return the result of a heatmap metric whose y axis are the values
+        from first to last (not included) for the items given by months and
+        values (see count_by_month_and_bin()).
+
+        The month x bin counts are returned in a dataframe indexed by month
+        with a column for every bin.
+    """
+    counts = count_by_month_and_bin(months, values, index, bin_edges)
+    z = expand_bins(counts, bin_edges, first, last)
+    columns = pd.IntervalIndex.from_breaks(bin_edges, closed='right') \
+                if len(bin_edges) > 1 else pd.IntervalIndex([])
+    counts_by_bin = pd.DataFrame(counts.T, index=index, columns=columns)
+    return [index, list(range(first, last)), z, counts_by_bin, 'Heatmap']
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   job_queue.py
+
+   Descp: Background jobs for the long computations of metrics and networks.
+
+       Instead of computing a selection inside a Dash callback, which blocks
+       a gunicorn worker for as long as the computation takes, callbacks
+       submit a job and return right away, and the page polls the status of
+       the job until it is done. The job stores its results in the cache,
+       where the callbacks take them from afterwards.
+
+       Jobs run in a pool of `WIKICHRON_JOB_WORKERS` threads of every
+       worker process. Their status (state, progress and partial results)
+       is kept in the cache, so it's visible from every worker, and jobs are
+       identified by their kind and parameters, so submitting the same
+       selection again, from any worker, reuses the job already submitted.
+
+       While a job is queued or runs, its status is refreshed every few
+       seconds by a heartbeat thread of its worker. If the worker dies, the
+       status gets stale and the next submit of the same selection runs it
+       again.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+job_workers = int(os.getenv('WIKICHRON_JOB_WORKERS', 2))
+
+# milliseconds between two polls of the status of a job from the browser
+POLL_INTERVAL = 1000
+
+# seconds the status of a finished job is kept
+JOB_TIMEOUT = 3600
+# seconds the status of a failed job is kept. Until then, it isn't retried
+FAILED_TIMEOUT = 60
+
+# seconds after which a job whose status hasn't been refreshed is
+#  considered dead
+STALE_AFTER = 60
+HEARTBEAT_INTERVAL = 10
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+_active_jobs = {}   # job id -> Job queued or running in this process
+_active_jobs_lock = threading.Lock()
+_heartbeat = None
+_heartbeat_pid = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """ Thread pool of this process, created on first use """
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=max(1, job_workers))
+            _executor_pid = os.getpid()
+    return _executor
+
+
+def get_job_id(kind: str, params, tags: list = ()) -> str:
+    """
+        Id of the job of that kind and params, which must be json-serializable.
+        tags -- tags of the wikis the job computes (see data_version), so its
+            status is invalidated along with their data.
+    """
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str)
+                            .encode('utf-8')).hexdigest()
+    return ':'.join([kind] + list(tags) + [digest])
+
+
+def _status_key(job_id: str) -> str:
+    return 'job:' + job_id
+
+
+class Job:
+    """ Handle of a running job, to report its progress """
+
+    def __init__(self, cache, job_id: str):
+        self.cache = cache
+        self.id = job_id
+        self.status = {
+            'id': job_id,
+            'state': QUEUED,
+            'progress': 0.0,
+            'message': '',
+            'partial': [],
+            'error': None,
+            'updated_at': time.time()
+        }
+        self._lock = threading.Lock()
+
+    def _save(self, timeout=JOB_TIMEOUT, **changes):
+        with self._lock:
+            if self.status['state'] in (DONE, FAILED): # late heartbeat
+                return
+            self.status.update(changes, updated_at=time.time())
+            self.cache.set(_status_key(self.id), self.status, timeout=timeout)
+
+    def report(self, progress: float, message: str = None, partial=None):
+        """
+            Update the progress of the job.
+
+            progress -- fraction of the job done, from 0 to 1.
+            message -- description of what the job is doing now.
+            partial -- partial result just completed, added to the list of
+                partial results of the status of the job.
+        """
+        changes = {'progress': progress}
+        if message is not None:
+            changes['message'] = message
+        if partial is not None:
+            changes['partial'] = self.status['partial'] + [partial]
+        self._save(**changes)
+
+
+def _beat():
+    """ Refresh the status of the jobs queued or running in this process """
+    while True:
+        time.sleep(HEARTBEAT_INTERVAL)
+        with _active_jobs_lock:
+            jobs = list(_active_jobs.values())
+        for job in jobs:
+            job._save()
+
+
+def _ensure_heartbeat():
+    global _heartbeat, _heartbeat_pid
+    with _active_jobs_lock:
+        if _heartbeat is None or _heartbeat_pid != os.getpid():
+            _active_jobs.clear() # jobs of the parent process don't run here
+            _heartbeat = threading.Thread(target=_beat, name='job-heartbeat',
+                                            daemon=True)
+            _heartbeat.start()
+            _heartbeat_pid = os.getpid()
+
+
+def _run(job: Job, func):
+    job._save(state=RUNNING)
+    try:
+        func(job)
+    except Exception as e:
+        traceback.print_exc()
+        job._save(timeout=FAILED_TIMEOUT, state=FAILED, error=str(e))
+    else:
+        job._save(state=DONE, progress=1.0)
+    finally:
+        with _active_jobs_lock:
+            _active_jobs.pop(job.id, None)
+
+
+def _is_stale(status: dict) -> bool:
+    return status['state'] in (QUEUED, RUNNING) and \
+            time.time() - status['updated_at'] > STALE_AFTER
+
+
+def submit(cache, kind: str, params, func, tags: list = ()) -> str:
+    """
+        Submit a job, unless the same one is queued, running or done already,
+        or it failed less than FAILED_TIMEOUT seconds ago.
+
+        cache -- Flask-Caching cache object to keep the status of the job.
+        kind -- name of the type of job.
+        params -- json-serializable parameters which identify the job.
+        func -- function which does the job. It gets a Job to report its
+            progress, and must leave its results in the cache.
+        tags -- tags of the wikis the job computes.
+        Return the id of the job.
+    """
+    job_id = get_job_id(kind, params, tags)
+    _ensure_heartbeat()
+    with _active_jobs_lock:
+        if job_id in _active_jobs: # never run the same job twice at once
+            return job_id
+    status = cache.get(_status_key(job_id))
+    if status is not None and not _is_stale(status):
+        return job_id
+    if status is not None:
+        cache.delete(_status_key(job_id))
+
+    job = Job(cache, job_id)
+    # only one of the concurrent submits of the same job claims it
+    if cache.add(_status_key(job_id), job.status, timeout=JOB_TIMEOUT):
+        with _active_jobs_lock:
+            _active_jobs[job_id] = job
+        _get_executor().submit(_run, job, func)
+    return job_id
+
+
+def get_status(cache, job_id: str) -> dict:
+    """ Return the status dict of a job, or None if it is unknown """
+    return cache.get(_status_key(job_id))
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   layered_cache.py
+
+   Descp: Two-tier cache backend for Flask-Caching: a per-process LRU of
+       the unpickled values in front of Redis.
+
+       With a plain Redis backend, every Dash callback fetches and unpickles
+       again the same cached values (metrics series, whole networks...).
+       Here, values are first looked up in a local LRU, shared by all the
+       apps of the process and bounded by the size of the values in bytes
+       (`WIKICHRON_LOCAL_CACHE_BUDGET`, in MB, 256 by default), and only
+       fetched from Redis when they are not there.
+
+       Values are stored in Redis pickled and, if they are big enough,
+       compressed with zlib.
+
+       Local entries expire after `LOCAL_MAX_TIMEOUT` seconds at most, since
+       other processes may replace or delete them in Redis. Anyway, most
+       keys include the data version of their wiki (see data_version), so
+       they are never overwritten with different values.
+
+       Values returned are shared by everyone in the process, so they must
+       be treated as read-only.
+
+       Use it with CACHE_TYPE = 'wikichron.utils.layered_cache.layered_redis'.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import time
+import zlib
+import pickle
+import threading
+from collections import OrderedDict
+
+from flask_caching.backends.base import BaseCache
+
+# budget of the local tier, in MB
+local_budget = int(os.getenv('WIKICHRON_LOCAL_CACHE_BUDGET', 256)) * 2**20
+
+LOCAL_MAX_TIMEOUT = 600
+
+# values smaller than this (pickled, in bytes) are not compressed
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_LEVEL = 3
+
+# keys of values which are updated all the time, like the status of the
+#  background jobs, are never kept in the local tier
+VOLATILE_PREFIXES = ('job:',)
+
+PICKLED_PREFIX = b'!'       # as RedisCache does
+COMPRESSED_PREFIX = b'z'
+
+
+class TierStats:
+    """ Hit and miss counters of a cache tier """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else None
+        }
+
+
+class LocalTier:
+    """ LRU of unpickled values bounded by their size in bytes """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self._entries = OrderedDict() # key -> (value, size, expiration time)
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self.stats = TierStats()
+        self.evictions = 0
+
+    def get(self, key: str):
+        """ Return (True, value) if key is in the tier, (False, None) otherwise """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return (False, None)
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return (True, entry[0])
+
+    def set(self, key: str, value, size: int, timeout: int):
+        if size > self.budget:
+            self.delete(key)
+            return
+        if not timeout or timeout < 0 or timeout > LOCAL_MAX_TIMEOUT:
+            timeout = LOCAL_MAX_TIMEOUT
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + timeout)
+            self._total_size += size
+            while self._total_size > self.budget:
+                (lru_key, _) = next(iter(self._entries.items()))
+                self._remove(lru_key)
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry[1]
+
+    def delete(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self, key_prefix: str = ''):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(key_prefix)]:
+                self._remove(key)
+
+    def evict_matching(self, substring: str) -> int:
+        """ Drop every entry whose key contains substring """
+        with self._lock:
+            keys = [key for key in self._entries if substring in key]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def get_stats(self, n_largest: int = 10) -> dict:
+        with self._lock:
+            sizes = [(key, entry[1]) for (key, entry) in self._entries.items()]
+            total_size = self._total_size
+        sizes.sort(key=lambda key_size: key_size[1], reverse=True)
+        stats = self.stats.as_dict()
+        stats.update({
+            'entries': len(sizes),
+            'total_bytes': total_size,
+            'budget_bytes': self.budget,
+            'evictions': self.evictions,
+            'largest_entries': [{'key': key, 'bytes': size}
+                                    for (key, size) in sizes[:n_largest]]
+        })
+        return stats
+
+
+# the local tier is shared by the caches of all the apps of the process
+_local_tier = LocalTier(local_budget)
+_layered_caches = []
+
+
+class LayeredRedisCache(BaseCache):
+    """
+        Flask-Caching backend which looks up the local tier first and then
+        the Redis server of `redis_cache`, a flask_caching RedisCache.
+    """
+
+    def __init__(self, redis_cache, local_tier: LocalTier = None):
+        super().__init__(redis_cache.default_timeout)
+        self._redis = redis_cache
+        self._write_client = redis_cache._write_client
+        self._read_clients = redis_cache._read_clients
+        self.key_prefix = redis_cache.key_prefix
+        self.local_tier = local_tier or _local_tier
+        self.remote_stats = TierStats()
+        self._stats_lock = threading.Lock()
+        self.bytes_written = 0
+        self.bytes_written_compressed = 0
+        _layered_caches.append(self)
+
+    def _normalize_timeout(self, timeout):
+        return self._redis._normalize_timeout(timeout)
+
+    def _is_local(self, key):
+        return not key.startswith(VOLATILE_PREFIXES)
+
+    ### Serialization ###
+
+    def dump_object(self, value) -> tuple:
+        """ Return (dump for redis, size of the value pickled) """
+        if type(value) is int:
+            dump = str(value).encode('ascii')
+            return (dump, len(dump))
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(pickled) >= COMPRESSION_MIN_SIZE:
+            dump = COMPRESSED_PREFIX + zlib.compress(pickled, COMPRESSION_LEVEL)
+        else:
+            dump = PICKLED_PREFIX + pickled
+        with self._stats_lock:
+            self.bytes_written += len(pickled)
+            self.bytes_written_compressed += len(dump)
+        return (dump, len(pickled))
+
+    def load_object(self, dump) -> tuple:
+        """ Return (value, size of the value pickled), or (None, 0) """
+        if dump is None:
+            return (None, 0)
+        try:
+            if dump.startswith(COMPRESSED_PREFIX):
+                pickled = zlib.decompress(dump[1:])
+                return (pickle.loads(pickled), len(pickled))
+            if dump.startswith(PICKLED_PREFIX):
+                return (pickle.loads(dump[1:]), len(dump) - 1)
+        except (pickle.PickleError, zlib.error):
+            return (None, 0)
+        try:
+            return (int(dump), len(dump))
+        except ValueError:
+            return (dump, len(dump))
+
+    ### Lookups ###
+
+    def get(self, key):
+        return self.get_many(key)[0]
+
+    def get_many(self, *keys):
+        values = [None] * len(keys)
+        missing = []
+        for (i, key) in enumerate(keys):
+            if self._is_local(key):
+                (found, value) = self.local_tier.get(self.key_prefix + key)
+            else:
+                (found, value) = (False, None)
+            if found:
+                values[i] = value
+            else:
+                missing.append(i)
+
+        if not missing:
+            return values
+
+        dumps = self._read_clients.mget([self.key_prefix + keys[i] for i in missing])
+        with self._stats_lock:
+            for dump in dumps:
+                if dump is None:
+                    self.remote_stats.misses += 1
+                else:
+                    self.remote_stats.hits += 1
+
+        for (i, dump) in zip(missing, dumps):
+            (value, size) = self.load_object(dump)
+            if value is not None:
+                if self._is_local(keys[i]):
+                    self.local_tier.set(self.key_prefix + keys[i], value, size,
+                                        LOCAL_MAX_TIMEOUT)
+                values[i] = value
+        return values
+
+    def has(self, key):
+        found = self._is_local(key) and self.local_tier.get(self.key_prefix + key)[0]
+        return found or bool(self._read_clients.exists(self.key_prefix + key))
+
+    ### Writes ###
+
+    def set(self, key, value, timeout=None):
+        return self.set_many({key: value}, timeout)
+
+    def set_many(self, mapping, timeout=None):
+        timeout = self._normalize_timeout(timeout)
+        # Use transaction=False to batch without calling redis MULTI
+        pipe = self._write_client.pipeline(transaction=False)
+        for (key, value) in mapping.items():
+            (dump, size) = self.dump_object(value)
+            if timeout == -1:
+                pipe.set(name=self.key_prefix + key, value=dump)
+            else:
+                pipe.setex(name=self.key_prefix + key, value=dump, time=timeout)
+            if self._is_local(key):
+                self.local_tier.set(self.key_prefix + key, value, size, timeout)
+        return all(pipe.execute())
+
+    def add(self, key, value, timeout=None):
+        timeout = self._normalize_timeout(timeout)
+        (dump, size) = self.dump_object(value)
+        added = self._write_client.setnx(name=self.key_prefix + key, value=dump)
+        if added:
+            if timeout != -1:
+                self._write_client.expire(name=self.key_prefix + key, time=timeout)
+            if self._is_local(key):
+                self.local_tier.set(self.key_prefix + key, value, size, timeout)
+        return bool(added)
+
+    def delete(self, key):
+        self.local_tier.delete(self.key_prefix + key)
+        return self._write_client.delete(self.key_prefix + key)
+
+    def delete_many(self, *keys):
+        if not keys:
+            return
+        for key in keys:
+            self.local_tier.delete(self.key_prefix + key)
+        return self._write_client.delete(*[self.key_prefix + key for key in keys])
+
+    def clear(self):
+        self.local_tier.clear(self.key_prefix)
+        return self._redis.clear()
+
+    def inc(self, key, delta=1):
+        self.local_tier.delete(self.key_prefix + key)
+        return self._redis.inc(key, delta)
+
+    def dec(self, key, delta=1):
+        self.local_tier.delete(self.key_prefix + key)
+        return self._redis.dec(key, delta)
+
+    ### Stats ###
+
+    def get_stats(self) -> dict:
+        with self._stats_lock:
+            stats = self.remote_stats.as_dict()
+            stats.update({
+                'key_prefix': self.key_prefix,
+                'bytes_written': self.bytes_written,
+                'bytes_written_compressed': self.bytes_written_compressed,
+            })
+        return stats
+
+
+def evict_local(substring: str) -> int:
+    """ Drop from the local tier of this process the keys containing substring """
+    return _local_tier.evict_matching(substring)
+
+
+def get_cache_stats() -> dict:
+    """ Return the size and hit rates of the local tier and of every remote one """
+    return {
+        'local': _local_tier.get_stats(),
+        'remote': [cache.get_stats() for cache in _layered_caches]
+    }
+
+
+def layered_redis(app, config, args, kwargs):
+    """
+        Flask-Caching backend factory. It takes the same config as the
+        'redis' backend.
+    """
+    from flask_caching.backends import redis
+    return LayeredRedisCache(redis(app, config, args, kwargs))
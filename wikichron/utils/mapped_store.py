@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   mapped_store.py
+
+   Descp: Memory-mapped store of the prepared wiki data.
+
+       The prepared data of a wiki (sorted and without bots activity) is
+       written into a directory with a .npy file per group of columns of the
+       same dtype, in the same layout pandas keeps them in memory. These
+       files are then loaded with mmap in copy-on-write mode, and the
+       dataframe is built on top of the mapped arrays, without copying them.
+
+       This way, every gunicorn worker of a host reads the same physical
+       memory (the page cache of these files) for a wiki, instead of keeping
+       its own private copy of it. Only the columns which can't be mapped
+       (object columns, like contributor_id when the wiki has anonymous
+       activity) and the categories of the categorical columns are built in
+       private memory.
+
+       Directories are named after the signature of the csv and the bots
+       filtered out, so they are rebuilt whenever any of them changes.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (is_categorical_dtype, is_numeric_dtype,
+                                is_datetime64_dtype)
+from pandas.core.internals import BlockManager, make_block
+
+from . import columnar_store
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+mapped_dir = os.getenv('WIKICHRON_MAPPED_DIR', os.path.join(data_dir, 'mapped'))
+
+# Increase it whenever the layout written by write_mapped() changes.
+MAPPED_FORMAT_VERSION = 3
+METADATA_FILENAME = 'metadata.json'
+
+
+def get_bots_digest(bots_ids: list) -> str:
+    bots = ','.join(sorted(str(bot_id) for bot_id in bots_ids))
+    return hashlib.sha1(bots.encode('utf-8')).hexdigest()[:12]
+
+
+def get_mapped_path(csv: str, bots_ids: list, signature: str = None) -> str:
+    if signature is None:
+        signature = columnar_store.get_csv_signature(csv)
+    name = os.path.splitext(os.path.basename(csv))[0]
+    return os.path.join(mapped_dir, '{}.{}.m{}.{}'.format(name, signature,
+                            MAPPED_FORMAT_VERSION, get_bots_digest(bots_ids)))
+
+
+def is_mapped(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, METADATA_FILENAME))
+
+
+def remove_stale_mapped_dirs(csv: str, keep: str = None):
+    """ Remove the mapped directories of a csv, but `keep`, if provided. """
+    if not os.path.isdir(mapped_dir):
+        return
+    name = os.path.splitext(os.path.basename(csv))[0]
+    mapped_regex = re.compile(r'^{}\.\d+-\d+-v\d+\.m\d+\.[0-9a-f]+$'
+                                .format(re.escape(name)))
+    for filename in os.listdir(mapped_dir):
+        path = os.path.join(mapped_dir, filename)
+        if mapped_regex.match(filename) and path != keep:
+            # workers still mapping these files keep their pages
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _save(path: str, filename: str, values: np.ndarray) -> str:
+    np.save(os.path.join(path, filename), values, allow_pickle=False)
+    return filename
+
+
+def _save_objects(path: str, filename: str, values) -> str:
+    np.save(os.path.join(path, filename), np.asarray(values, dtype=object),
+            allow_pickle=True)
+    return filename
+
+
+def write_mapped(csv: str, df: pd.DataFrame, path: str) -> str:
+    """
+        Write the prepared dataframe of a wiki into the mapped directory
+        `path`.
+
+        The directory is written first under a temporary name and then
+        renamed, so concurrent workers never map a half-written directory.
+        Return path.
+    """
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    try:
+        _write_mapped_files(df, tmp_path)
+    except Exception:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        # another worker has just written it
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not is_mapped(path):
+            raise
+
+    remove_stale_mapped_dirs(csv, keep=path)
+    return path
+
+
+def _write_mapped_files(df: pd.DataFrame, tmp_path: str):
+    """ Write the arrays of df and their metadata into tmp_path """
+    metadata = {
+        'columns': list(df.columns),
+        'blocks': [],
+        'categoricals': [],
+        'objects': [],
+    }
+
+    # Group columns by dtype, as pandas does, so every group becomes a single
+    #  2-D block and the mapped dataframe is already consolidated.
+    dtype_groups = {}
+    for (position, column) in enumerate(df.columns):
+        series = df.iloc[:, position]
+        if is_categorical_dtype(series):
+            # codes are stored in the dtype pandas chose for them, so
+            #  from_codes() keeps the mapped array instead of casting it.
+            metadata['categoricals'].append({
+                'position': position,
+                'codes': _save(tmp_path, f'{position}.codes.npy', series.cat.codes.values),
+                'categories': _save_objects(tmp_path, f'{position}.categories.npy', series.cat.categories)
+            })
+        elif not (is_numeric_dtype(series) or is_datetime64_dtype(series)):
+            (codes, uniques) = pd.factorize(series)
+            metadata['objects'].append({
+                'position': position,
+                'codes': _save(tmp_path, f'{position}.codes.npy', codes.astype(np.int32)),
+                'uniques': _save_objects(tmp_path, f'{position}.uniques.npy', uniques)
+            })
+        else:
+            dtype_groups.setdefault(series.dtype.str, []).append(position)
+
+    for (i, positions) in enumerate(dtype_groups.values()):
+        values = np.vstack([df.iloc[:, position].values for position in positions])
+        metadata['blocks'].append({
+            'positions': positions,
+            'values': _save(tmp_path, f'block{i}.npy', values)
+        })
+
+    metadata['index_objects'] = bool(df.index.dtype == object)
+    if metadata['index_objects']:
+        metadata['index'] = _save_objects(tmp_path, 'index.npy', df.index.values)
+    else:
+        metadata['index'] = _save(tmp_path, 'index.npy', df.index.values)
+
+    with open(os.path.join(tmp_path, METADATA_FILENAME), 'w') as metadata_file:
+        json.dump(metadata, metadata_file)
+
+
+def read_mapped(path: str) -> pd.DataFrame:
+    """
+        Build a dataframe on top of the arrays mapped from `path`.
+
+        Arrays are mapped in copy-on-write mode: pages are shared with the
+        other processes mapping the same files, and writing to them would
+        only affect the current process.
+    """
+    with open(os.path.join(path, METADATA_FILENAME)) as metadata_file:
+        metadata = json.load(metadata_file)
+
+    def load(filename):
+        return np.asarray(np.load(os.path.join(path, filename), mmap_mode='c'))
+
+    def load_objects(filename):
+        return np.load(os.path.join(path, filename), allow_pickle=True)
+
+    blocks = []
+    for block in metadata['blocks']:
+        blocks.append(make_block(load(block['values']),
+                                placement=block['positions'], ndim=2))
+
+    for categorical in metadata['categoricals']:
+        values = pd.Categorical.from_codes(load(categorical['codes']),
+                                categories=load_objects(categorical['categories']))
+        blocks.append(make_block(values, placement=[categorical['position']],
+                                ndim=2))
+
+    for column in metadata['objects']:
+        codes = load(column['codes'])
+        values = load_objects(column['uniques']).take(codes)
+        values[codes == -1] = np.nan
+        blocks.append(make_block(values.reshape(1, -1),
+                                placement=[column['position']], ndim=2))
+
+    if metadata['index_objects']:
+        index = pd.Index(load_objects(metadata['index']))
+    else:
+        index = pd.Index(load(metadata['index']))
+
+    axes = [pd.Index(metadata['columns']), index]
+    return pd.DataFrame(BlockManager(blocks, axes))
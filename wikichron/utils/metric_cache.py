@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   metric_cache.py
+
+   Descp: Granular cache of the computed metrics.
+
+       Every metric computed for a wiki is cached as its own cell, keyed by
+       the app, the version of the wiki data (see data_version), the metric
+       code and the time resolution. The response to a selection of wikis and metrics is then
+       built from these cells, which are fetched in bulk with a single
+       multi-get, and only the missing cells are computed.
+
+       So, adding a metric or a wiki to the selection only computes the new
+       cells, and overlapping selections share their cells in the cache
+       backend instead of storing their own copy of them.
+
+       The missing cells of a wiki are computed inside the flight of the
+       wiki (see single_flight), so concurrent callbacks asking for the
+       same cells compute them only once.
+
+       Cells missing in the cache are looked up in the durable metric store
+       (see metric_store) before computing them, and every cell computed is
+       saved there too.
+
+       Cells can also be asked for a time window (see time_window). Those are
+       sliced from the cells of the whole history if there are any, or
+       computed for the window only.
+
+   Created on: 16-oct-2026
+"""
+
+from . import data_version
+from . import metric_store
+from . import time_window
+from . import single_flight
+
+# Metrics are only computed monthly so far
+MONTHLY = 'MS'
+
+CELL_TIMEOUT = 3600
+
+
+def get_cell_key(namespace: str, wiki: dict, metric_code: str,
+                    resolution: str = MONTHLY, version: str = None,
+                    window=None) -> str:
+    if version is None:
+        version = data_version.get_data_version(wiki)
+    key = 'metric:{}:{}:{}:{}'.format(namespace, version, metric_code,
+                                    resolution)
+    if window is not None:
+        key += ':' + time_window.get_window_key(window)
+    return key
+
+
+def get_cells(cache, namespace: str, wikis: list, metrics_codes: list,
+                compute_missing, resolution: str = MONTHLY,
+                window=None) -> list:
+    """
+        Return the cells of every wiki and metric, computing only the
+        missing ones.
+
+        cache -- Flask-Caching cache object.
+        namespace -- name of the app the cells belong to.
+        compute_missing -- function which gets a list of (wiki, metrics codes,
+            window) tuples and returns, for every tuple, the list of computed
+            metrics.
+        window -- time window of the cells (see time_window), or None for the
+            whole history. Cells of a window are sliced from the cells of the
+            whole history when these are cached or stored already, and
+            computed for the window only otherwise. They are cached, but not
+            stored.
+        Return a two dimensional array: cells[wiki][metric].
+    """
+    versions = [data_version.get_data_version(wiki) for wiki in wikis]
+    keys = []
+    for (wiki, version) in zip(wikis, versions):
+        keys.append([get_cell_key(namespace, wiki, code, resolution, version, window)
+                        for code in metrics_codes])
+
+    new_cells = {}
+    cells = _get_cached_cells(cache, keys)
+    if window is not None:
+        _slice_full_cells(cache, namespace, wikis, versions, metrics_codes,
+                        resolution, window, keys, cells, new_cells)
+    missing = _get_missing(cells)
+    if not missing:
+        if new_cells:
+            cache.set_many(new_cells, timeout=CELL_TIMEOUT)
+        return cells
+
+    # wait for whoever is computing the same wikis and take their cells
+    flight_keys = ['metric:{}:{}'.format(namespace, versions[wiki_idx])
+                        for (wiki_idx, _) in missing]
+    with single_flight.flights(cache, flight_keys):
+        cells = _get_cached_cells(cache, keys)
+        if window is not None:
+            _slice_full_cells(cache, namespace, wikis, versions, metrics_codes,
+                            resolution, window, keys, cells, new_cells)
+        missing = _get_missing(cells)
+
+        for (wiki_idx, idxs) in missing:
+            stored = metric_store.load_cells(namespace, wikis[wiki_idx],
+                            [metrics_codes[i] for i in idxs], resolution,
+                            versions[wiki_idx])
+            for (metric_idx, cell) in zip(idxs, stored):
+                if cell is not None:
+                    cell = time_window.slice_result(cell, window)
+                    cells[wiki_idx][metric_idx] = cell
+                    new_cells[keys[wiki_idx][metric_idx]] = cell
+        missing = _get_missing(cells)
+
+        if missing:
+            print(' * [Info] Computing {} of {} metric cells'.format(
+                    sum(len(idxs) for (_, idxs) in missing), len(wikis) * len(metrics_codes)))
+
+            computed = compute_missing([(wikis[wiki_idx], [metrics_codes[i] for i in idxs], window)
+                                            for (wiki_idx, idxs) in missing])
+            for ((wiki_idx, idxs), wiki_cells) in zip(missing, computed):
+                for (metric_idx, cell) in zip(idxs, wiki_cells):
+                    cells[wiki_idx][metric_idx] = cell
+                    new_cells[keys[wiki_idx][metric_idx]] = cell
+                if window is None:
+                    metric_store.save_cells(namespace, wikis[wiki_idx],
+                                [metrics_codes[i] for i in idxs], wiki_cells,
+                                resolution, versions[wiki_idx])
+
+        if new_cells:
+            cache.set_many(new_cells, timeout=CELL_TIMEOUT)
+    return cells
+
+
+def _slice_full_cells(cache, namespace, wikis, versions, metrics_codes,
+                        resolution, window, keys, cells, new_cells):
+    """
+        Fill the missing cells of a window with the slices of the cells of
+        the whole history in the cache, and add them to new_cells.
+    """
+    missing = _get_missing(cells)
+    if not missing:
+        return
+    full_keys = [[get_cell_key(namespace, wikis[wiki_idx], metrics_codes[i],
+                                resolution, versions[wiki_idx]) for i in idxs]
+                    for (wiki_idx, idxs) in missing]
+    full_cells = _get_cached_cells(cache, full_keys)
+    for ((wiki_idx, idxs), wiki_cells) in zip(missing, full_cells):
+        for (metric_idx, cell) in zip(idxs, wiki_cells):
+            if cell is not None:
+                cell = time_window.slice_result(cell, window)
+                cells[wiki_idx][metric_idx] = cell
+                new_cells[keys[wiki_idx][metric_idx]] = cell
+
+
+def _get_cached_cells(cache, keys: list) -> list:
+    """ Fetch the cells of keys[wiki][metric] with a single multi-get """
+    flat_keys = [key for wiki_keys in keys for key in wiki_keys]
+    flat_cells = cache.get_many(*flat_keys) if flat_keys else []
+    cells = []
+    for wiki_keys in keys:
+        cells.append(flat_cells[:len(wiki_keys)])
+        flat_cells = flat_cells[len(wiki_keys):]
+    return cells
+
+
+def _get_missing(cells: list) -> list:
+    """ Return [(wiki index, [metric indexes])] of the cells not cached """
+    missing = []
+    for (wiki_idx, wiki_cells) in enumerate(cells):
+        missing_idxs = [metric_idx for (metric_idx, cell) in enumerate(wiki_cells)
+                            if cell is None]
+        if missing_idxs:
+            missing.append((wiki_idx, missing_idxs))
+    return missing
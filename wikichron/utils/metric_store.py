@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   metric_store.py
+
+   Descp: Durable on-disk store of the computed metrics.
+
+       The cache backends only keep the metric cells (see metric_cache) for
+       a while, and a restart or a flush of Redis loses all of them. This
+       store keeps every cell computed in a file of its own, keyed by the
+       app, the data version of the wiki (see data_version), the metric code
+       and the time resolution, so it's never recomputed while the data of
+       the wiki doesn't change:
+
+         <store dir>/<app>/<wiki tag>/<digest of the data version>/<code>.<resolution>.pickle
+
+       The store lies in the directory `WIKICHRON_METRIC_STORE_DIR` (metrics/
+       in the data directory by default). It can be filled in advance, for
+       every wiki of wikis.json, with scripts/compute_metric_store.py.
+
+       Files of old versions of a wiki are never read again. They are removed
+       by the batch script and when the wiki is invalidated (see
+       cache_invalidation).
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import pickle
+import shutil
+import hashlib
+from urllib.parse import quote
+from warnings import warn
+
+from . import data_version
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+store_dir = os.getenv('WIKICHRON_METRIC_STORE_DIR', os.path.join(data_dir, 'metrics'))
+
+STORE_EXTENSION = '.pickle'
+# Increase it whenever the result of any metric changes, so the cells
+#  computed by the previous code are not served anymore.
+METRIC_STORE_FORMAT_VERSION = 3
+
+
+def get_wiki_dir(namespace: str, wiki: dict) -> str:
+    """ Directory with all the versions of the cells of a wiki in an app """
+    return os.path.join(store_dir, namespace,
+                        quote(data_version.get_wiki_tag(wiki), safe=''))
+
+
+def get_version_dir(namespace: str, wiki: dict, version: str = None) -> str:
+    """ Directory with the cells of a data version of a wiki in an app """
+    if version is None:
+        version = data_version.get_data_version(wiki)
+    digest = hashlib.sha1('{}:v{}'.format(version, METRIC_STORE_FORMAT_VERSION)
+                            .encode('utf-8')).hexdigest()
+    return os.path.join(get_wiki_dir(namespace, wiki), digest)
+
+
+def get_cell_path(namespace: str, wiki: dict, metric_code: str,
+                    resolution: str, version: str = None) -> str:
+    return os.path.join(get_version_dir(namespace, wiki, version),
+                        '{}.{}{}'.format(metric_code, resolution, STORE_EXTENSION))
+
+
+def load_cells(namespace: str, wiki: dict, metrics_codes: list,
+                resolution: str, version: str = None) -> list:
+    """
+        Return the stored cell of every metric of a wiki, or None for the
+        ones not in the store.
+    """
+    version_dir = get_version_dir(namespace, wiki, version)
+    if not os.path.isdir(version_dir):
+        return [None] * len(metrics_codes)
+
+    cells = []
+    for code in metrics_codes:
+        path = os.path.join(version_dir,
+                    '{}.{}{}'.format(code, resolution, STORE_EXTENSION))
+        try:
+            with open(path, 'rb') as cell_file:
+                cells.append(pickle.load(cell_file))
+        except FileNotFoundError:
+            cells.append(None)
+        except (OSError, pickle.PickleError, EOFError) as e:
+            warn('Unable to read {}: {}'.format(path, e))
+            cells.append(None)
+    return cells
+
+
+def save_cells(namespace: str, wiki: dict, metrics_codes: list, cells: list,
+                resolution: str, version: str = None):
+    """ Store the cell of every metric of a wiki """
+    version_dir = get_version_dir(namespace, wiki, version)
+    try:
+        os.makedirs(version_dir, exist_ok=True)
+    except OSError as e:
+        warn('Unable to create {}: {}'.format(version_dir, e))
+        return
+
+    for (code, cell) in zip(metrics_codes, cells):
+        path = os.path.join(version_dir,
+                    '{}.{}{}'.format(code, resolution, STORE_EXTENSION))
+        # write into a temporary file first, so other processes never read a
+        #  cell half written
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as cell_file:
+                pickle.dump(cell, cell_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PickleError) as e:
+            warn('Unable to write {}: {}'.format(path, e))
+
+
+def prune_wiki(namespace: str, wiki: dict, version: str = None) -> int:
+    """
+        Remove the stored cells of every version of a wiki in an app but the
+        current one. Return the number of versions removed.
+    """
+    wiki_dir = get_wiki_dir(namespace, wiki)
+    current = os.path.basename(get_version_dir(namespace, wiki, version))
+    try:
+        versions = os.listdir(wiki_dir)
+    except FileNotFoundError:
+        return 0
+    old_versions = [name for name in versions if name != current]
+    for name in old_versions:
+        shutil.rmtree(os.path.join(wiki_dir, name), ignore_errors=True)
+    return len(old_versions)
+
+
+def delete_wiki(wiki: dict):
+    """ Remove the stored cells of a wiki, whatever their version, in every app """
+    try:
+        namespaces = os.listdir(store_dir)
+    except FileNotFoundError:
+        return
+    for namespace in namespaces:
+        shutil.rmtree(get_wiki_dir(namespace, wiki), ignore_errors=True)
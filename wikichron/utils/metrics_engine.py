@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   metrics_engine.py
+
+   Descp: Execution engine for the metrics of a wiki.
+
+       Many metrics are derived from the same intermediate results (edits
+       per month and namespace, edits per month and contributor, first
+       edits per month...). Metric functions get these intermediates by
+       calling functions decorated with @shared_intermediate, and
+       compute_metrics() runs all the selected metrics within a plan which
+       computes every intermediate only once for the wiki data, no matter
+       how many metrics need it.
+
+       Outside of a plan (or for any other dataframe, like a subset of the
+       data of the wiki) intermediates are just computed every time, so
+       metric functions keep working when they are called on their own.
+
+       Intermediates are shared by all the metrics of a plan, so they must
+       be treated as read-only.
+
+       Metrics can also be computed for a time window (see time_window):
+       intermediates are still computed on the whole history of the wiki,
+       so they are shared with the rest of metrics, and every metric
+       returns the months of the window only.
+
+   Created on: 16-oct-2026
+"""
+
+import functools
+import threading
+
+from . import time_window
+
+_local = threading.local()
+
+
+class MetricsPlan:
+    """ Intermediates computed so far for the data of a wiki. """
+
+    def __init__(self, data):
+        self.data = data
+        self.intermediates = {}
+        self._previous_plan = None
+
+    def __enter__(self):
+        self._previous_plan = getattr(_local, 'plan', None)
+        _local.plan = self
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.plan = self._previous_plan
+        self.intermediates.clear()
+        return False
+
+
+def shared_intermediate(func):
+    """
+        Decorator for functions func(data, *args) which compute an
+        intermediate result for the metrics, so it's only computed once per
+        plan and args, which must be hashable.
+    """
+    @functools.wraps(func)
+    def wrapper(data, *args):
+        plan = getattr(_local, 'plan', None)
+        if plan is None or plan.data is not data:
+            return func(data, *args)
+        key = (func, args)
+        if key not in plan.intermediates:
+            plan.intermediates[key] = func(data, *args)
+        return plan.intermediates[key]
+    return wrapper
+
+
+def compute_metrics(metrics, data, index, window=None):
+    """
+        Compute all the metrics on data sharing their intermediates.
+
+        metrics -- list of metric objects
+        data -- data of the wiki
+        index -- months index to compute the metrics for
+        window -- time window (see time_window) to compute the metrics for,
+            or None for every month of index. Windowed metrics get only the
+            months of the window, and the results of the rest are sliced.
+        Return a list with the result of every metric, in the same order.
+    """
+    window_index = time_window.get_window_index(index, window)
+    results = []
+    with MetricsPlan(data):
+        for metric in metrics:
+            if window is None:
+                results.append(metric.calculate(data, index))
+            elif metric.windowed:
+                results.append(metric.calculate(data, window_index))
+            else:
+                results.append(time_window.slice_result(
+                                metric.calculate(data, index), window))
+    return results
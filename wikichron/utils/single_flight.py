@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   single_flight.py
+
+   Descp: Coalescing of concurrent identical computations.
+
+       When a page loads, Dash fires several callbacks at once which ask for
+       the same data (the same metrics, the same network). On a cold cache,
+       every one of them, in every worker, would compute it on its own.
+
+       Instead, computations of a cached value are run inside a flight of
+       its key: only one computation holds the flight at a time, and the
+       rest wait for it and then take the value from the cache.
+
+       Threads of the same process wait on a local lock, and, when the
+       cache backend is Redis, workers wait on a Redis lock. With any other
+       backend (the 'simple' one of debug mode), there's only one process,
+       so the local lock is enough.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import threading
+import contextlib
+
+# seconds to wait for a flight before computing the value anyway.
+#  It should be as long as the longest computation (gunicorn timeout)
+FLIGHT_TIMEOUT = int(os.getenv('WIKICHRON_FLIGHT_TIMEOUT', 1200))
+
+# seconds between two attempts to take the redis lock of a flight
+POLL_INTERVAL = 0.1
+
+_local_locks = {}   # key -> [lock, number of threads using it]
+_local_locks_lock = threading.Lock()
+
+
+def _acquire_local(key: str) -> (threading.Lock, bool):
+    """ Return the local lock of key and whether it was acquired in time """
+    with _local_locks_lock:
+        entry = _local_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    acquired = entry[0].acquire(timeout=FLIGHT_TIMEOUT)
+    return (entry[0], acquired)
+
+
+def _release_local(key: str, lock: threading.Lock, acquired: bool):
+    with _local_locks_lock:
+        entry = _local_locks[key]
+        entry[1] -= 1
+        if not entry[1]:
+            del _local_locks[key]
+    # if it timed out, the lock is still held by another thread
+    if acquired:
+        lock.release()
+
+
+def _get_redis_client(cache):
+    """ Return the redis client of a Flask-Caching cache, or None """
+    backend = getattr(cache, 'cache', cache)
+    return getattr(backend, '_write_client', None)
+
+
+@contextlib.contextmanager
+def flight(cache, key: str):
+    """
+        Context manager which holds the flight of key, across the threads
+        and workers using the same cache.
+
+        If the flight isn't released in FLIGHT_TIMEOUT seconds, the waiting
+        callers give up and enter it anyway.
+    """
+    (local_lock, local_acquired) = _acquire_local(key)
+    try:
+        client = _get_redis_client(cache)
+        if client is None:
+            yield
+            return
+        redis_lock = client.lock('flight:' + key, timeout=FLIGHT_TIMEOUT,
+                                sleep=POLL_INTERVAL,
+                                blocking_timeout=FLIGHT_TIMEOUT)
+        acquired = redis_lock.acquire()
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    redis_lock.release()
+                except Exception: # it expired and someone else holds it
+                    pass
+    finally:
+        _release_local(key, local_lock, local_acquired)
+
+
+@contextlib.contextmanager
+def flights(cache, keys: list):
+    """ Hold the flights of several keys, always taken in the same order """
+    with contextlib.ExitStack() as stack:
+        for key in sorted(set(keys)):
+            stack.enter_context(flight(cache, key))
+        yield
+
+
+def get_or_compute(cache, key: str, compute, timeout: int = None):
+    """
+        Return the value cached for key or, if there is none, compute it and
+        cache it, unless another caller is computing it already. In that
+        case, wait for it and return its value.
+
+        compute -- function without arguments which returns the value.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    with flight(cache, key):
+        # it might have been computed while waiting for the flight
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value, timeout=timeout)
+    return value
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   time_window.py
+
+   Descp: Time windows the metrics can be computed for.
+
+       A window is a (first month, last month) pair of month codes (see
+       derived_columns.get_month_codes), both included. Metrics computed for
+       a window only cover its months, but accumulated metrics still count
+       everything before the window.
+
+       Metrics which support windows natively (`windowed` metrics) get the
+       months of the window as their index and compute only them. The rest
+       are computed for the whole history of the wiki and sliced afterwards
+       with slice_result().
+
+   Created on: 16-oct-2026
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import derived_columns
+
+
+def parse_bound(bound):
+    """
+        Return the month code of a bound of a window, given as a date string
+        ('2015-01' or '2015-01-31') or as a unix timestamp, or None if it's
+        empty or invalid.
+    """
+    if isinstance(bound, (list, tuple)): # as parsed by parse_qs
+        bound = bound[0] if bound else None
+    if bound is None or bound == '':
+        return None
+    try:
+        timestamp = pd.Timestamp(float(bound), unit='s')
+    except (TypeError, ValueError):
+        try:
+            timestamp = pd.Timestamp(bound)
+        except (TypeError, ValueError):
+            return None
+    if pd.isnull(timestamp):
+        return None
+    return int(derived_columns.get_month_codes([timestamp])[0])
+
+
+def get_window(lower_bound, upper_bound):
+    """
+        Return the window between two bounds, or None for the whole history
+        when both of them are missing.
+    """
+    first = parse_bound(lower_bound)
+    last = parse_bound(upper_bound)
+    if first is None and last is None:
+        return None
+    if first is None:
+        first = np.iinfo(np.int32).min
+    if last is None:
+        last = np.iinfo(np.int32).max
+    if first > last:
+        (first, last) = (last, first)
+    return (first, last)
+
+
+def get_window_key(window) -> str:
+    """ Part of the cache keys of the results for a window """
+    return '{}-{}'.format(*window)
+
+
+def get_window_index(index: pd.DatetimeIndex, window) -> pd.DatetimeIndex:
+    """ Return the months of index within window """
+    if window is None:
+        return index
+    months = derived_columns.get_month_codes(index)
+    return index[(months >= window[0]) & (months <= window[1])]
+
+
+def _get_mask(timestamps, window) -> np.ndarray:
+    months = derived_columns.get_month_codes(timestamps)
+    return (months >= window[0]) & (months <= window[1])
+
+
+def slice_result(result, window):
+    """
+        Slice the result of a metric computed for every month down to the
+        months of window.
+
+        Series and dataframes are sliced by the months of their index (its
+        first level, if it has several ones). Results of monowiki graphs,
+        lists ending with their graph type, are sliced element by element,
+        and heatmaps ([months, y, z, ..., 'Heatmap']) by the columns of z.
+    """
+    if window is None:
+        return result
+
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        if not isinstance(result.index, (pd.DatetimeIndex, pd.MultiIndex)):
+            return result
+        return result[_get_mask(result.index.get_level_values(0), window)]
+
+    if isinstance(result, list) and result and isinstance(result[-1], str):
+        if result[-1] == 'Heatmap':
+            months = result[0]
+            mask = _get_mask(months, window)
+            if isinstance(result[2], np.ndarray):
+                z = result[2][:, mask]
+            else:
+                z = [[value for (value, keep) in zip(row, mask) if keep]
+                        for row in result[2]]
+            return [months[mask], result[1], z] + \
+                    [slice_result(extra, window) for extra in result[3:-1]] + \
+                    [result[-1]]
+        return [slice_result(element, window) for element in result[:-1]] + \
+                [result[-1]]
+
+    return result
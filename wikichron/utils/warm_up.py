@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   warm_up.py
+
+   Descp: Warm-up of the data, metrics and networks of the wikis.
+
+       After a deploy or a flush of the cache, the first users of a wiki pay
+       for parsing its csv and computing its metrics and networks. To avoid
+       it, every app registers a warm-up task, which computes the default
+       data of a wiki in that app, and a background thread of every worker
+       runs those tasks:
+
+       - on startup, for the `WIKICHRON_WARM_UP_WIKIS` most requested wikis
+         (10 by default, 0 to disable it), and
+       - for every wiki uploaded, right after it's added to wikis.json.
+
+       Every worker queues the same wikis, but the warm-up of a wiki for an
+       app is claimed in the cache of that app by only one of them (an
+       atomic add of a key with the data version of the wiki), so each one
+       is computed once, not once per worker.
+
+       The thread only uses a fraction of the CPU time
+       (`WIKICHRON_WARM_UP_CPU_BUDGET`, 0.25 by default): after every task,
+       it sleeps long enough to keep that duty cycle.
+
+       Requests of every wiki are counted in a popularity file
+       (`WIKICHRON_POPULARITY_FILE`, popularity.json in the data directory)
+       so the most requested wikis are known after a restart.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import json
+import time
+import queue
+import atexit
+import itertools
+import threading
+from warnings import warn
+from collections import Counter, OrderedDict
+
+from . import wiki_catalog
+from . import data_registry
+from . import data_version
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+popularity_path = os.getenv('WIKICHRON_POPULARITY_FILE',
+                            os.path.join(data_dir, 'popularity.json'))
+warm_up_wikis = int(os.getenv('WIKICHRON_WARM_UP_WIKIS', 10))
+cpu_budget = float(os.getenv('WIKICHRON_WARM_UP_CPU_BUDGET', 0.25))
+
+# seconds between two writes of the popularity file
+POPULARITY_FLUSH_INTERVAL = 300
+
+# seconds a worker keeps the claim of the warm-up of a wiki for an app
+CLAIM_TIMEOUT = 3600
+
+# uploaded wikis are warmed up before the popular ones
+UPLOAD_PRIORITY = 0
+STARTUP_PRIORITY = 1
+
+_tasks = OrderedDict()  # name -> (function which warms up a wiki, cache)
+_queue = queue.PriorityQueue()
+_sequence = itertools.count() # keeps FIFO order between equal priorities
+_worker = None
+_worker_pid = None
+_worker_lock = threading.Lock()
+
+_pending_requests = Counter()
+_popularity_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def register_task(name: str, task, cache=None):
+    """
+        Register a function which warms up the data of a wiki, given its
+        metadata dict, for an app. Tasks run in the order they are registered.
+
+        cache -- Flask-Caching cache object of the app, shared by all the
+            workers, where the warm-up of every wiki is claimed. Without it,
+            every worker runs the task.
+    """
+    _tasks[name] = (task, cache)
+
+
+### POPULARITY ###
+
+def _read_popularity() -> dict:
+    try:
+        with open(popularity_path) as popularity_file:
+            return json.load(popularity_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def flush_popularity():
+    """ Add the requests counted in this process to the popularity file """
+    global _last_flush
+    with _popularity_lock:
+        _last_flush = time.monotonic()
+        if not _pending_requests:
+            return
+        popularity = Counter(_read_popularity())
+        popularity.update(_pending_requests)
+        _pending_requests.clear()
+        tmp_path = '{}.{}.tmp'.format(popularity_path, os.getpid())
+        try:
+            with open(tmp_path, 'w') as popularity_file:
+                json.dump(popularity, popularity_file)
+            os.replace(tmp_path, popularity_path)
+        except OSError as e:
+            warn('Unable to write {}: {}'.format(popularity_path, e))
+
+
+def record_requests(wikis: list):
+    """ Count a request of every wiki, given their metadata dicts """
+    with _popularity_lock:
+        _pending_requests.update(wiki['domain'] for wiki in wikis)
+    if time.monotonic() - _last_flush > POPULARITY_FLUSH_INTERVAL:
+        flush_popularity()
+
+
+def get_most_requested(n: int) -> list:
+    """ Return the metadata dicts of the n most requested wikis """
+    popularity = Counter(_read_popularity())
+    with _popularity_lock:
+        popularity.update(_pending_requests)
+    wikis = []
+    for (domain, _) in popularity.most_common():
+        try:
+            wikis.append(wiki_catalog.get_wiki_by_domain(domain))
+        except KeyError: # not available anymore
+            continue
+        if len(wikis) == n:
+            break
+    return wikis
+
+
+### WARM-UP ###
+
+def _claim(name: str, cache, wiki: dict) -> bool:
+    """ Return whether this worker should run the task name for the wiki """
+    if cache is None:
+        return True
+    key = 'warm_up:{}:{}'.format(name, data_version.get_data_version(wiki))
+    return bool(cache.add(key, os.getpid(), timeout=CLAIM_TIMEOUT))
+
+
+def _warm_up(wiki: dict):
+    tasks = [(name, task) for (name, (task, cache)) in _tasks.items()
+                if _claim(name, cache, wiki)]
+    if not tasks: # other workers warm it up
+        return
+    print(' * [Info] Warming up {}'.format(wiki['domain']))
+    data_registry.read_data(wiki)
+    for (name, task) in tasks:
+        time_start = time.perf_counter()
+        try:
+            task(wiki)
+        except Exception as e:
+            warn('Warm-up of {} for {} failed: {}'.format(wiki['domain'], name, e))
+        elapsed = time.perf_counter() - time_start
+        # stay within the cpu budget
+        if 0 < cpu_budget < 1:
+            time.sleep(elapsed * (1 - cpu_budget) / cpu_budget)
+
+
+def _work():
+    while True:
+        (_, _, domain) = _queue.get()
+        try:
+            # the wiki might have been replaced since it was queued
+            wiki = wiki_catalog.get_wiki_by_domain(domain)
+        except KeyError:
+            continue
+        try:
+            _warm_up(wiki)
+        except Exception as e:
+            warn('Warm-up of {} failed: {}'.format(domain, e))
+
+
+def _ensure_worker():
+    global _worker, _worker_pid
+    with _worker_lock:
+        if _worker is None or _worker_pid != os.getpid():
+            _worker = threading.Thread(target=_work, name='warm-up', daemon=True)
+            _worker.start()
+            _worker_pid = os.getpid()
+
+
+def warm_wiki(wiki: dict, priority: int = UPLOAD_PRIORITY):
+    """ Queue the warm-up of a wiki, given its metadata dict """
+    if cpu_budget <= 0:
+        return
+    _ensure_worker()
+    _queue.put((priority, next(_sequence), wiki['domain']))
+
+
+def start():
+    """ Queue the warm-up of the most requested wikis """
+    if warm_up_wikis <= 0:
+        return
+    for wiki in get_most_requested(warm_up_wikis):
+        warm_wiki(wiki, STARTUP_PRIORITY)
+
+
+atexit.register(flush_popularity)
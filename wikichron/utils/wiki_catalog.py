@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   wiki_catalog.py
+
+   Descp: In-memory catalog of the available wikis, as listed in wikis.json.
+
+       wikis.json is parsed only once and indexed by domain and by name, so
+       looking up a wiki doesn't need to parse and scan the whole file. The
+       catalog checks the mtime and size of wikis.json on every access (at
+       most once every `CHECK_INTERVAL` seconds) and reloads it when it has
+       changed, so new uploads show up in every app and worker without a
+       restart.
+
+       The catalog also keeps the wikis sorted by every one of `SORT_KEYS`,
+       so search_wikis() serves sorted, filtered and paginated queries
+       without sorting the wikis for every request.
+
+       Logos still embedded in wikis.json as base64 are moved to the logos
+       store (see wiki_logos) when loading it, so the catalog only keeps a
+       reference to them.
+
+       The wiki dicts returned are shared by everyone, so they must be
+       treated as read-only.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import json
+import time
+import base64
+import bisect
+import threading
+from warnings import warn
+
+from . import wiki_logos
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+wikis_json_path = os.path.join(data_dir, 'wikis.json')
+
+# seconds between two checks of the mtime of wikis.json
+CHECK_INTERVAL = 1.0
+
+NUMERIC_SORT_KEYS = ('users', 'articles', 'pages', 'edits')
+SORT_KEYS = ('lastUpdated', 'name') + NUMERIC_SORT_KEYS
+
+DEFAULT_PAGE_SIZE = 24
+
+
+def get_sort_value(wiki: dict, sort_by: str):
+    """ Value of a wiki for sort_by, comparable with the one of every wiki """
+    value = wiki.get(sort_by)
+    if sort_by in NUMERIC_SORT_KEYS:
+        return value if isinstance(value, int) else -1
+    if sort_by == 'lastUpdated' and value == 'NA':
+        return ''
+    return str(value or '').lower()
+
+
+class _CatalogIndex:
+    """ Parsed wikis.json and its indexes """
+
+    def __init__(self, wikis: list):
+        self.wikis = wikis
+        self.by_domain = {wiki['domain']: wiki for wiki in wikis if 'domain' in wiki}
+        self.by_name = {wiki['name']: wiki for wiki in wikis if 'name' in wiki}
+
+        self.search_texts = {}
+        for (domain, wiki) in self.by_domain.items():
+            self.search_texts[domain] = ' '.join(
+                    (wiki.get('name', ''), wiki.get('url', ''), domain)).lower()
+
+        # for every sort key, the (sort value, domain) of every wiki in
+        #  ascending order, and the wikis in that same order.
+        self.orderings = {}
+        for sort_by in SORT_KEYS:
+            entries = sorted((get_sort_value(wiki, sort_by), domain)
+                                for (domain, wiki) in self.by_domain.items())
+            self.orderings[sort_by] = (entries,
+                                    [self.by_domain[domain] for (_, domain) in entries])
+
+
+_catalog_lock = threading.Lock()
+_index = _CatalogIndex([])
+_signature = None
+_last_check = 0
+
+
+def _get_signature():
+    json_stat = os.stat(wikis_json_path)
+    return (json_stat.st_mtime_ns, json_stat.st_size)
+
+
+def _load(signature):
+    global _index, _signature
+    try:
+        with open(wikis_json_path) as wikis_json_file:
+            wikis = json.load(wikis_json_file)
+    except ValueError:
+        # wikis.json is being written right now, try again in the next check
+        if _signature is None and not _index.wikis:
+            raise
+        return
+
+    for wiki in wikis:
+        try:
+            wiki_logos.extract_logo(wiki)
+        except (OSError, ValueError) as e:
+            warn('Unable to store the logo of {}: {}'.format(wiki.get('domain'), e))
+
+    # the index is replaced all at once, so readers never see it half-built
+    _index = _CatalogIndex(wikis)
+    _signature = signature
+    print(' * [Info] Loaded catalog of {} wikis'.format(len(wikis)))
+
+
+def _refresh() -> _CatalogIndex:
+    """ Reload wikis.json if it has changed since it was loaded """
+    global _last_check
+    now = time.monotonic()
+    if _signature is not None and now - _last_check < CHECK_INTERVAL:
+        return _index
+    with _catalog_lock:
+        signature = _get_signature()
+        if signature != _signature:
+            _load(signature)
+        _last_check = now
+    return _index
+
+
+def invalidate():
+    """ Force the catalog to reload wikis.json in the next access """
+    global _signature
+    _signature = None
+
+
+def get_available_wikis() -> list:
+    """ Return a new list with the metadata of every wiki, as in wikis.json """
+    return list(_refresh().wikis)
+
+
+def get_wiki_by_domain(domain: str) -> dict:
+    """ Return the metadata of the wiki with that domain. KeyError if none """
+    return _refresh().by_domain[domain]
+
+
+def get_wiki_by_name(name: str) -> dict:
+    """ Return the metadata of the wiki with that name, or None """
+    return _refresh().by_name.get(name)
+
+
+### SEARCH ###
+
+def encode_cursor(position: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(position).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        (value, domain) = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception:
+        raise ValueError('Invalid cursor: {}'.format(cursor))
+    return (value, domain)
+
+
+def _matches(wiki: dict, search: str, search_text: str, filters: dict) -> bool:
+    if search and search not in search_text:
+        return False
+    for (stat, (lower, upper)) in filters.items():
+        value = wiki.get(stat)
+        if not isinstance(value, int):
+            return False
+        if (lower is not None and value < lower) or (upper is not None and value > upper):
+            return False
+    return True
+
+
+def search_wikis(search: str = '', sort_by: str = 'lastUpdated',
+                    descending: bool = True, cursor: str = None,
+                    limit: int = DEFAULT_PAGE_SIZE, filters: dict = None):
+    """
+        Search the catalog.
+
+        search -- text to look for in the name, url and domain of the wikis.
+        sort_by -- one of SORT_KEYS.
+        cursor -- cursor returned by the previous call to get the next page,
+            or None to get the first page. Cursors point to the position of
+            the last wiki returned in the sort order, so they remain valid
+            even if the catalog is reloaded in the meantime.
+        limit -- maximum number of wikis returned.
+        filters -- dict {stat: (lower, upper)} with the bounds, both included,
+            of the numeric stats of the wikis. None for no bound.
+        Return a tuple (wikis, cursor of the next page or None if there are
+        no more wikis, total number of wikis matching the search).
+    """
+    if sort_by not in SORT_KEYS:
+        raise ValueError('Invalid sort key: {}'.format(sort_by))
+    filters = filters or {}
+    if any(stat not in NUMERIC_SORT_KEYS for stat in filters):
+        raise ValueError('Invalid filter: {}'.format(list(filters)))
+
+    index = _refresh()
+    (keys, wikis) = index.orderings[sort_by]
+    search = search.strip().lower()
+
+    matching = [i for i in range(len(keys))
+                    if _matches(wikis[i], search, index.search_texts[keys[i][1]], filters)]
+
+    # matching wikis after the cursor, in the requested order
+    try:
+        if descending:
+            end = bisect.bisect_left(keys, decode_cursor(cursor)) if cursor else len(keys)
+            after_cursor = [i for i in reversed(matching) if i < end]
+        else:
+            start = bisect.bisect_right(keys, decode_cursor(cursor)) if cursor else 0
+            after_cursor = [i for i in matching if i >= start]
+    except TypeError:
+        raise ValueError('Invalid cursor for sort key {}: {}'.format(sort_by, cursor))
+
+    page = after_cursor[:limit]
+    next_cursor = encode_cursor(keys[page[-1]]) if len(after_cursor) > limit else None
+    return ([wikis[i] for i in page], next_cursor, len(matching))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+   wiki_logos.py
+
+   Descp: Store of the logos of the wikis.
+
+       Logos used to be embedded in wikis.json as base64 data uris (the
+       `imageSrc` field), which made every parse and render of the wikis
+       metadata carry around ~10 KB per wiki. Now, every logo is stored as
+       an image file of its own, named after the hash of its content, and
+       wikis only keep the name of that file in their `logo` field.
+
+       Since the content of a file never changes for a given name, logos
+       are served with long-lived cache headers.
+
+   Created on: 16-oct-2026
+"""
+
+import os
+import base64
+import hashlib
+import mimetypes
+
+data_dir = os.getenv('WIKICHRON_DATA_DIR', 'data')
+logos_dir = os.getenv('WIKICHRON_LOGOS_DIR', os.path.join(data_dir, 'logos'))
+
+# one year, logos never change for a given filename
+LOGO_CACHE_TIMEOUT = 365 * 24 * 60 * 60
+
+_EXTENSIONS = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+    'image/svg+xml': '.svg',
+}
+
+
+def store_logo(image: bytes, mimetype: str = 'image/png') -> str:
+    """
+        Store an image as a logo, if it isn't stored yet, and return the
+        filename it's stored under.
+    """
+    extension = _EXTENSIONS.get(mimetype) or mimetypes.guess_extension(mimetype) or ''
+    filename = hashlib.sha1(image).hexdigest()[:20] + extension
+    path = os.path.join(logos_dir, filename)
+    if not os.path.isfile(path):
+        os.makedirs(logos_dir, exist_ok=True)
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as logo_file:
+            logo_file.write(image)
+        os.replace(tmp_path, path)
+    return filename
+
+
+def store_data_uri(data_uri: str) -> str:
+    """ Store a base64 data uri, like 'data:image/png;base64,...', as a logo """
+    (header, b64) = data_uri.split(',', 1)
+    mimetype = header[len('data:'):].split(';')[0] or 'image/png'
+    return store_logo(base64.b64decode(b64), mimetype)
+
+
+def extract_logo(wiki: dict) -> dict:
+    """
+        Move the embedded logo of a wiki, if any, to the logos store, leaving
+        only its filename in the `logo` field of the wiki.
+
+        wiki -- wiki metadata dict. It'll be modified in place.
+        Return wiki.
+    """
+    image_src = wiki.get('imageSrc')
+    if image_src and image_src.startswith('data:'):
+        wiki['logo'] = store_data_uri(image_src)
+        del wiki['imageSrc']
+    return wiki